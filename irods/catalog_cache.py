@@ -0,0 +1,157 @@
+import collections
+import re
+import threading
+import time
+
+# The number of users and groups kept by each session's user_cache.
+USER_CACHE_SIZE = 1000
+
+
+class CatalogCache:
+    """A bounded, thread-safe cache of the catalog rows found for collection and data object paths.
+
+    The collection and data object managers consult the cache in get() and exists(), storing the
+    row (or list of replica rows) found for a path under the kind of object looked up.  That no
+    object exists at a path is cached as well, as None.  Entries older than `ttl' seconds are
+    treated as absent, and the least recently used entry is evicted once the cache grows beyond
+    `max_size'; a size of 0 disables the cache altogether.
+
+    Each session also has a small cache of this class, always enabled, as its user_cache: there
+    the access manager keeps, by id, the users and groups named in the ACLs it reports.
+
+    The session's own operations changing a collection or data object (put, unlink, move, copy,
+    create, remove, metadata changes, etc.) invalidate the affected paths, and those changing
+    users or groups invalidate the cached users.  Changes made by other
+    clients are seen only once the cached entries expire, or after a call to invalidate() or clear().
+    """
+
+    Stats = collections.namedtuple(
+        "Stats", ("hits", "misses", "evictions", "invalidations", "size")
+    )
+
+    COLLECTION = "collection"
+    DATA_OBJECT = "data_object"
+    USER = "user"  # Users and groups, keyed by id rather than by path.
+
+    def __init__(self, max_size=None, ttl=None):
+        """Initialize the cache. Limits default to the current client configuration when not given."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        # Incremented by each invalidation, so that rows fetched before it are not stored after it.
+        self.generation = 0
+
+    @property
+    def max_size(self):
+        if self._max_size is not None:
+            return self._max_size
+        import irods.client_configuration as cfg
+
+        return cfg.data_objects.catalog_cache_size
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        import irods.client_configuration as cfg
+
+        return cfg.data_objects.catalog_cache_ttl
+
+    @staticmethod
+    def _normalize(path):
+        # Paths are cached as iRODSCollection.normalize_path() leaves them: single slashes, none trailing.
+        if not isinstance(path, str):
+            return path
+        if "//" in path or (path.endswith("/") and path != "/"):
+            path = re.sub("/+", "/", path).rstrip("/") or "/"
+        return path
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def lookup(self, kind, path):
+        """Return a tuple (found, value) for the entry cached for `path' (or other key) under `kind'."""
+        if not self.enabled:
+            return (False, None)
+        key = (kind, self._normalize(path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                ttl = self.ttl
+                if ttl is None or ttl < 0 or time.time() - stored <= ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return (True, value)
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return (False, None)
+
+    def store(self, kind, path, value, generation=None):
+        """Cache `value' (None meaning that no object exists) for `path' under `kind'.
+
+        If `generation' is given (the value of the generation attribute when the lookup of
+        `value' began), the value is not stored if any invalidation has happened since.
+        """
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+        key = (kind, self._normalize(path))
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time.time())
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *paths, tree=False):
+        """Drop the entries cached for the given paths, of any kind.
+
+        With tree=True, the entries for any path beneath them are dropped as well.
+        """
+        paths = set(self._normalize(path) for path in paths)
+        prefixes = tuple(path.rstrip("/") + "/" for path in paths) if tree else ()
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if key[1] in paths
+                or (prefixes and isinstance(key[1], str) and key[1].startswith(prefixes))
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self, kind=None):
+        """Remove all entries, or all those of the given kind."""
+        with self._lock:
+            self.generation += 1
+            if kind is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                return
+            stale = [key for key in self._entries if key[0] == kind]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def stats(self):
+        """Return a Stats tuple of the hit, miss, eviction and invalidation counters and the current size."""
+        with self._lock:
+            return self.Stats(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.invalidations,
+                len(self._entries),
+            )
+
+    def __len__(self):
+        return len(self._entries)
@@ -70,6 +70,16 @@ class DataObjects(iRODSConfiguration):
     __slots__ = (
         "auto_close",
         "allow_redirect",
+        "redirect_session_cache_size",
+        "redirect_session_idle_timeout",
+        "catalog_cache_size",
+        "catalog_cache_ttl",
+        "transfer_thread_pool_size",
+        "bulk_put_file_size_threshold",
+        "bulk_put_bundle_size",
+        "bulk_put_bundle_max_files",
+        "single_buffer_transfer_size",
+        "single_buffer_put",
     )
 
     def __init__(self):
@@ -86,6 +96,38 @@ class DataObjects(iRODSConfiguration):
         self.auto_close = False
         self.allow_redirect = False
 
+        # Bounds on the per-session cache of sessions to which data object opens
+        # have been redirected (see irods.session_cache).  A size of 0 disables the
+        # cache; a negative idle timeout disables eviction of idle entries.
+        self.redirect_session_cache_size = 8
+        self.redirect_session_idle_timeout = 300.0
+
+        # Bounds on the per-session cache of the catalog rows found by collection and data
+        # object lookups (see irods.catalog_cache).  A size of 0 disables the cache; a negative
+        # time to live (in seconds) lets entries stand until evicted or invalidated.
+        self.catalog_cache_size = 0
+        self.catalog_cache_ttl = 10.0
+
+        # Number of long-lived worker threads shared by all parallel transfers in
+        # the process (see irods.parallel.transfer_executor).  Values less than 1
+        # select a default based on the number of CPUs.
+        self.transfer_thread_pool_size = 0
+
+        # Limits for DataObjectManager.put_many and put_directory: files no larger than
+        # the threshold are sent in tar bundles of at most the given size (in bytes) and
+        # number of files, each bundle being expanded and registered by the server in
+        # one call.  Larger files are uploaded individually.
+        self.bulk_put_file_size_threshold = 1024**2
+        self.bulk_put_bundle_size = 32 * 1024**2
+        self.bulk_put_bundle_max_files = 1000
+
+        # Data objects of at most this many bytes are fetched by get() in a single
+        # DATA_OBJ_GET call, the data travelling within the reply, and (if single_buffer_put
+        # is True) are sent by put() in a single DATA_OBJ_PUT call.  A negative value
+        # disables this.
+        self.single_buffer_transfer_size = 4 * 1024**2
+        self.single_buffer_put = False
+
 
 # #############################################################################
 #
@@ -101,6 +143,47 @@ class DataObjects(iRODSConfiguration):
 data_objects = DataObjects()
 
 
+class GenQuery(iRODSConfiguration):
+    __slots__ = (
+        "in_filter_max_values",
+        "in_filter_workers",
+    )
+
+    def __init__(self):
+        # In() filters of a query listing more values than this are split, when the query
+        # is run, into filters of at most this many values, each sent in a query of its own.
+        # A value less than 1 disables the splitting.  Queries with ordering, a limit, an
+        # offset or aggregation are never split, nor In() filters on unselected columns.
+        self.in_filter_max_values = 100
+
+        # Number of threads, each with a pooled connection, that run the queries resulting
+        # from such a split concurrently.
+        self.in_filter_workers = 4
+
+
+genquery = GenQuery()
+
+
+class Metadata(iRODSConfiguration):
+    __slots__ = (
+        "atomic_operations_chunk_size",
+        "apply_many_workers",
+    )
+
+    def __init__(self):
+        # Largest number of AVU operations sent in one atomic metadata call when the changes
+        # batched by iRODSMetaCollection.batch() are applied.  Longer batches are sent in
+        # several calls, each atomic in itself.  A value less than 1 sends them all in one call.
+        self.atomic_operations_chunk_size = 1000
+
+        # Number of threads, each with a pooled connection, that send the atomic metadata
+        # calls of MetadataManager.apply_many() concurrently.
+        self.apply_many_workers = 4
+
+
+metadata = Metadata()
+
+
 class LegacyAuth(iRODSConfiguration):
     __slots__ = ("pam",)
 
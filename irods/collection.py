@@ -1,9 +1,27 @@
+import collections
+import concurrent.futures
 import itertools
 import operator
 
-from irods.models import Collection, DataObject
+from irods.column import Like
+from irods.models import Collection, DataObject, DataObjectMeta
 from irods.data_object import iRODSDataObject, irods_basename
-from irods.meta import iRODSMetaCollection
+from irods.meta import iRODSMeta, iRODSMetaCollection
+
+
+def _metadata_by_data_object_id(rows):
+    """Return a dict mapping data object ids to lists of iRODSMeta, given rows of their AVUs."""
+    metadata = collections.defaultdict(list)
+    for row in rows:
+        metadata[row[DataObject.id]].append(
+            iRODSMeta(
+                row[DataObjectMeta.name],
+                row[DataObjectMeta.value],
+                row[DataObjectMeta.units],
+                avu_id=row[DataObjectMeta.id],
+            )
+        )
+    return metadata
 
 
 def _first_char(*Strings):
@@ -44,7 +62,7 @@ class iRODSCollection:
 
     @property
     def metadata(self):
-        if not self._meta:
+        if self._meta is None:
             self._meta = iRODSMetaCollection(
                 self.manager.sess.metadata, Collection, self.path
             )
@@ -52,24 +70,87 @@ class iRODSCollection:
 
     @property
     def subcollections(self):
-        query = self.manager.sess.query(Collection).filter(
+        return self._subcollections_from(self._subcollections_query())
+
+    def _subcollections_query(self):
+        return self.manager.sess.query(Collection).filter(
             Collection.parent_name == self.path
         )
+
+    def _subcollections_from(self, rows):
         return [
             iRODSCollection(self.manager, row)
-            for row in query
+            for row in rows
             if row[Collection.name] != "/"
         ]
 
     @property
     def data_objects(self):
-        query = self.manager.sess.query(DataObject).filter(Collection.name == self.path)
-        results = query.get_results()
-        grouped = itertools.groupby(results, operator.itemgetter(DataObject.id))
-        return [
-            iRODSDataObject(self.manager.sess.data_objects, self, list(replicas))
+        return self.list_data_objects()
+
+    def list_data_objects(self, with_metadata=False):
+        """Return the data objects in the collection.
+
+        If `with_metadata' is True, the AVUs of all the data objects are read as well, by
+        a single (paged) query, so that the objects' metadata attributes are ready for use
+        without querying the catalog for each object.
+        """
+        metadata = None
+        if with_metadata:
+            metadata = _metadata_by_data_object_id(
+                self._data_objects_metadata_query().get_results()
+            )
+        return self._data_objects_from(
+            self._data_objects_query().get_results(), metadata
+        )
+
+    def _data_objects_query(self):
+        return self.manager.sess.query(DataObject).filter(Collection.name == self.path)
+
+    def _data_objects_metadata_query(self):
+        return self.manager.sess.query(
+            DataObject.id,
+            DataObjectMeta.id,
+            DataObjectMeta.name,
+            DataObjectMeta.value,
+            DataObjectMeta.units,
+        ).filter(Collection.name == self.path)
+
+    def _data_objects_from(self, rows, metadata=None):
+        """Return the data objects of the rows, with the AVUs in `metadata' (by data object id) if given."""
+        sess = self.manager.sess
+        grouped = itertools.groupby(rows, operator.itemgetter(DataObject.id))
+        data_objects = [
+            iRODSDataObject(sess.data_objects, self, list(replicas))
             for _, replicas in grouped
         ]
+        if metadata is not None:
+            for obj in data_objects:
+                obj._meta = iRODSMetaCollection(
+                    sess.metadata, DataObject, obj.path, avus=metadata.get(obj.id, [])
+                )
+        return data_objects
+
+    def _list_on_connection(self, with_metadata=False):
+        """Return the subcollections and data objects, querying both on one pooled connection.
+
+        Each query then pages through a single server agent, even while other threads are
+        using connections from the same pool.
+        """
+
+        def rows(query):
+            return (row for batch in query._batches_on(conn) for row in batch)
+
+        with self.manager.sess.pool.get_connection() as conn:
+            metadata = None
+            if with_metadata:
+                metadata = _metadata_by_data_object_id(
+                    rows(self._data_objects_metadata_query())
+                )
+            return (
+                self._subcollections_from(rows(self._subcollections_query())),
+                self._data_objects_from(rows(self._data_objects_query()), metadata),
+            )
 
     def remove(self, recurse=True, force=False, **options):
         self.manager.remove(self.path, recurse, force, **options)
@@ -80,22 +161,148 @@ class iRODSCollection:
     def move(self, path):
         self.manager.move(self.path, path)
 
-    def walk(self, topdown=True):
+    def walk(self, topdown=True, bulk=False, parallel=0, with_metadata=False):
         """
         Collection tree generator.
 
         For each subcollection in the directory tree, starting at the
         collection, yield a 3-tuple
+
+        If `bulk' is True, the whole subtree is read up front, by a few queries selecting
+        collections and data objects by path prefix, rather than by three queries for
+        each collection visited.
+
+        If `parallel' is a positive number, that many threads list the contents of
+        collections ahead of the walk, on connections from the session's pool, so that
+        sibling collections are explored concurrently.  The tuples are yielded in the
+        same order as by the sequential walk.  The listings held in advance are limited
+        to a few per thread.
+
+        If `with_metadata' is True, the AVUs of the data objects are read along with them,
+        by a query per collection (or a few queries in all, for a bulk walk), as by
+        list_data_objects(with_metadata=True).
         """
+        if bulk and parallel:
+            raise ValueError("A walk can be either bulk or parallel, not both.")
+
+        if parallel:
+            for x in self._walk_parallel(topdown, parallel, with_metadata):
+                yield x
+            return
+
+        if bulk:
+            subcollections, data_objects = self._read_subtree(with_metadata)
+
+            def walk_(coll):
+                subcolls = subcollections.get(coll.path, [])
+                if topdown:
+                    yield (coll, subcolls, data_objects.get(coll.path, []))
+                for subcollection in subcolls:
+                    for x in walk_(subcollection):
+                        yield x
+                if not topdown:
+                    yield (coll, subcolls, data_objects.get(coll.path, []))
+
+            for x in walk_(self):
+                yield x
+            return
 
         if topdown:
-            yield (self, self.subcollections, self.data_objects)
+            yield (self, self.subcollections, self.list_data_objects(with_metadata))
         for subcollection in self.subcollections:
             new_root = subcollection
-            for x in new_root.walk(topdown):
+            for x in new_root.walk(topdown, with_metadata=with_metadata):
                 yield x
         if not topdown:
-            yield (self, self.subcollections, self.data_objects)
+            yield (self, self.subcollections, self.list_data_objects(with_metadata))
+
+    def _walk_parallel(self, topdown, workers, with_metadata=False):
+        workers = self.manager.sess.pool.limit_workers(workers)
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+        listings = {}  # collection -> Future of (subcollections, data_objects)
+        max_listings_ahead = 4 * workers
+
+        def listing(coll):
+            future = listings.pop(coll, None)
+            if future is None:
+                future = executor.submit(coll._list_on_connection, with_metadata)
+            return future.result()
+
+        def walk_(coll):
+            subcolls, objs = listing(coll)
+            for subcollection in subcolls:
+                if len(listings) >= max_listings_ahead:
+                    break
+                listings[subcollection] = executor.submit(
+                    subcollection._list_on_connection, with_metadata
+                )
+            if topdown:
+                listed = list(subcolls)
+                yield (coll, subcolls, objs)
+                # The caller may have pruned subcollections from the walk.
+                for subcollection in listed:
+                    if subcollection not in subcolls and subcollection in listings:
+                        listings.pop(subcollection).cancel()
+            for subcollection in subcolls:
+                for x in walk_(subcollection):
+                    yield x
+            if not topdown:
+                yield (coll, subcolls, objs)
+
+        try:
+            for x in walk_(self):
+                yield x
+        finally:
+            for future in listings.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _read_subtree(self, with_metadata=False):
+        """Return dicts mapping the path of each collection in the subtree to its subcollections and to its data objects."""
+        sess = self.manager.sess
+        prefix = self.path.rstrip("/") + "/"
+
+        # LIKE also treats '_' and '%' within the prefix as wildcards, so matches are checked.
+        subcollections = collections.defaultdict(list)
+        by_id = {self.id: self}
+        query = sess.query(Collection).filter(Like(Collection.name, prefix + "%"))
+        for row in query.get_results():
+            path = row[Collection.name]
+            if path == "/" or not path.startswith(prefix):
+                continue
+            coll = iRODSCollection(self.manager, row)
+            subcollections[row[Collection.parent_name]].append(coll)
+            by_id[coll.id] = coll
+
+        criteria = [Like(Collection.name, prefix + "%")]
+        if prefix != self.path:
+            criteria.append(Collection.name == self.path)
+        replicas = collections.OrderedDict()
+        for criterion in criteria:
+            for row in sess.query(DataObject).filter(criterion).get_results():
+                if row[DataObject.collection_id] in by_id:
+                    replicas.setdefault(row[DataObject.id], []).append(row)
+        metadata = None
+        if with_metadata:
+            # AVUs of objects outside the subtree (matched by LIKE wildcards) go unused.
+            metadata = _metadata_by_data_object_id(
+                row
+                for criterion in criteria
+                for row in sess.query(
+                    DataObject.id,
+                    DataObjectMeta.id,
+                    DataObjectMeta.name,
+                    DataObjectMeta.value,
+                    DataObjectMeta.units,
+                )
+                .filter(criterion)
+                .get_results()
+            )
+        data_objects = collections.defaultdict(list)
+        for rows in replicas.values():
+            parent = by_id[rows[0][DataObject.collection_id]]
+            data_objects[parent.path] += parent._data_objects_from(rows, metadata)
+        return subcollections, data_objects
 
     @staticmethod
     def normalize_path(*paths, **kw_):
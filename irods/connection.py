@@ -30,7 +30,7 @@ from irods.message import (
 )
 from irods.exception import get_exception_by_code, NetworkException, nominal_code
 import irods.exception as ex
-from irods.message import PamAuthRequest, PamAuthRequestOut
+from irods.message import PamAuthRequest, PamAuthRequestOut, _send_message_parts
 
 
 # Message to be logged when the connection
@@ -133,11 +133,12 @@ class Connection:
         logger.debug(DESTRUCTOR_MSG)
 
     def send(self, message):
-        string = message.pack()
+        parts = message.pack_parts()
 
-        logger.debug(string)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(b"".join(parts))
         try:
-            self.socket.sendall(string)
+            _send_message_parts(self.socket, parts)
         except:
             logger.error(
                 "Unable to send message. "
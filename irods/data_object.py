@@ -81,7 +81,7 @@ class iRODSDataObject:
 
     @property
     def metadata(self):
-        if not self._meta:
+        if self._meta is None:
             self._meta = iRODSMetaCollection(
                 self.manager.sess.metadata, DataObject, self.path
             )
@@ -128,6 +128,10 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
 
     session = None  # codacy
 
+    # For a handle opened for writing, the session's catalog cache and the data object path,
+    # invalidated once the handle is closed (and the replica updated in the catalog).
+    catalog_cache = logical_path = None
+
     def __init__(self, conn, descriptor, finalize_on_close=True, **options):
         """
         Constructor needs a connection and an iRODS data object descriptor. If the
@@ -201,8 +205,12 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
         return True
 
     def close(self):
-        if self.finalize_on_close or not self._close_replica():
-            self.conn.close_file(self.desc, **self.options)
+        try:
+            if self.finalize_on_close or not self._close_replica():
+                self.conn.close_file(self.desc, **self.options)
+        finally:
+            if self.catalog_cache is not None:
+                self.catalog_cache.invalidate(self.logical_path)
         self.conn.release()
         super(iRODSDataObjectFileRaw, self).close()
         return None
@@ -218,9 +226,9 @@ class iRODSDataObjectFileRaw(io.RawIOBase):
         return len(contents)
 
     def write(self, b):
+        # A contiguous memoryview is sent as is, without first copying it to a bytes object.
         if isinstance(b, memoryview):
-            return self.conn.write_file(self.desc, b.tobytes())
-
+            b = b.cast("B") if b.c_contiguous else b.tobytes()
         return self.conn.write_file(self.desc, b)
 
     def readable(self):
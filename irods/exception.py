@@ -16,6 +16,10 @@ class NetworkException(PycommandsException):
     pass
 
 
+class ConnectionPoolTimeout(NetworkException):
+    pass
+
+
 class DoesNotExist(PycommandsException):
     pass
 
@@ -1,3 +1,6 @@
+import csv
+import itertools
+import json
 from os.path import basename, dirname
 
 from irods.manager import Manager
@@ -14,7 +17,8 @@ from irods.models import (
     CollectionAccess,
 )
 from irods.access import iRODSAccess
-from irods.column import In
+from irods.column import In, Like
+from irods.query import get_results_concurrently
 from irods.user import iRODSUser
 
 import logging
@@ -126,17 +130,8 @@ class AccessManager(Manager):
         else:
             raise TypeError
 
-        # TODO: remove the filtering through extant_ids on resolution of irods/irods#6921.
-        #   (depending on the nature of the fix we may make it conditional, based on the server --
-        #   if for example in upcoming iRODS 4.2.12 and >=4.3.1 outdated userIDs in R_OBJT_ACCESS
-        #   are guaranteed to be systematically and atomically purged.
-        extant_ids = set(u[User.id] for u in self.sess.query(User))
-        rows = [
-            r for r in query_func(target.path) if r[access_column.user_id] in extant_ids
-        ]
-        userids = set(r[access_column.user_id] for r in rows)
-
-        user_lookup = {j.id: j for j in users_by_ids(self.sess, userids)}
+        rows = list(query_func(target.path))
+        user_lookup = self._users_by_ids(r[access_column.user_id] for r in rows)
 
         if isinstance(users_out, dict):
             users_out.update(user_lookup)
@@ -149,23 +144,249 @@ class AccessManager(Manager):
         else:
             raise TypeError
 
+        return self._acls_from_rows(target.path, rows, access_column, user_lookup)
+
+    @staticmethod
+    def _acls_from_rows(path, rows, access_column, user_lookup):
         # Instantiate as set before converting to a list, in order to remove duplicate iRODSAccess
         # objects. [#557]
 
+        # TODO: revisit the filtering through user_lookup on resolution of irods/irods#6921.
+        #   (depending on the nature of the fix we may make it conditional, based on the server --
+        #   if for example in upcoming iRODS 4.2.12 and >=4.3.1 outdated userIDs in R_OBJT_ACCESS
+        #   are guaranteed to be systematically and atomically purged.  Until then, ACLs naming
+        #   user ids that no longer exist are left out.
+
         acls = list(
             {
                 iRODSAccess(
                     r[access_column.name],
-                    target.path,
+                    path,
                     user_lookup[r[access_column.user_id]].name,
                     user_lookup[r[access_column.user_id]].zone,
                     user_lookup[r[access_column.user_id]].type,
                 )
                 for r in rows
+                if r[access_column.user_id] in user_lookup
             }
         )
         return acls
 
+    def _users_by_ids(self, ids):
+        """Return a dict mapping each of the given ids that belongs to a user (or group) to the user.
+
+        Only the ids not found in the session's user cache are looked up, in one query.
+        """
+        cache = self.sess.user_cache
+        users = {}
+        missing = []
+        for id_ in set(ids):
+            found, user = cache.lookup(cache.USER, id_)
+            if not found:
+                missing.append(id_)
+            elif user is not None:
+                users[id_] = user
+        if missing:
+            generation = cache.generation
+            for user in users_by_ids(self.sess, missing):
+                users[user.id] = user
+            for id_ in missing:
+                cache.store(cache.USER, id_, users.get(id_), generation)
+        return users
+
+    def get_many(self, targets):
+        """Return the ACLs of many data objects and collections, as a dict keyed by logical path.
+
+        The ACLs of each target are as reported by get(target).  Rather than the queries made
+        per target by get(), the ACLs of all the data objects, and of all the collections, are
+        each found by a query filtering on the targets' ids (split, if need be, as set by
+        genquery.in_filter_max_values), and the users named are looked up together.
+        """
+        targets = list(targets)
+        data_paths, coll_paths = {}, {}
+        for target in targets:
+            if isinstance(target, iRODSDataObject):
+                data_paths[target.id] = target.path
+            elif isinstance(target, iRODSCollection):
+                coll_paths[target.id] = target.path
+            else:
+                raise TypeError
+
+        queries = []
+        if data_paths:
+            queries.append(
+                self.sess.query(
+                    DataObject.id, DataAccess.name, DataAccess.user_id
+                ).filter(In(DataObject.id, sorted(data_paths)))
+            )
+        if coll_paths:
+            queries.append(
+                self.sess.query(
+                    Collection.id, CollectionAccess.name, CollectionAccess.user_id
+                ).filter(In(Collection.id, sorted(coll_paths)))
+            )
+        rows = list(get_results_concurrently(queries))
+
+        rows_by_target = {
+            (access_column, path): []
+            for access_column, paths in (
+                (DataAccess, data_paths),
+                (CollectionAccess, coll_paths),
+            )
+            for path in paths.values()
+        }
+        for row in rows:
+            if DataObject.id in row:
+                rows_by_target[(DataAccess, data_paths[row[DataObject.id]])].append(row)
+            else:
+                rows_by_target[
+                    (CollectionAccess, coll_paths[row[Collection.id]])
+                ].append(row)
+
+        user_lookup = self._users_by_ids(
+            row[access_column.user_id]
+            for (access_column, _), target_rows in rows_by_target.items()
+            for row in target_rows
+        )
+        return {
+            path: self._acls_from_rows(path, target_rows, access_column, user_lookup)
+            for (access_column, path), target_rows in rows_by_target.items()
+        }
+
+    def walk(self, path):
+        """Generate a tuple (path, ACLs) for the collection at `path' and each collection and data object beneath it.
+
+        The ACLs are as reported by get().  Rather than the queries made per target by get(),
+        the ACLs of the whole subtree are read in paged queries, one for the collections and one
+        for the data objects, and the users they name are looked up as first seen.  Since the
+        rows are ordered by path, records are generated as the batches of rows arrive:  those of
+        the collections first, then those of the data objects.
+        """
+        for _, target_path, acls in self._walk(path):
+            yield (target_path, acls)
+
+    EXPORT_FIELDS = (
+        "type",
+        "path",
+        "user_name",
+        "user_zone",
+        "user_type",
+        "access_name",
+    )
+
+    def export(self, path, file, format="csv"):
+        """Write the ACLs found by walk(path) to `file' (a text file object, or a local path).
+
+        With format="csv", each ACL is written as a row of the EXPORT_FIELDS, after a header
+        row.  With format="jsonl", each collection or data object is written as a line holding a
+        JSON object with its "type" ("collection" or "data_object"), its "path" and its "acls",
+        a list of objects with the remaining fields.  Returns the number of collections and data
+        objects written.
+        """
+        if format not in ("csv", "jsonl"):
+            raise ValueError("Export format must be 'csv' or 'jsonl'")
+        if isinstance(file, str):
+            with open(file, "w", newline="") as f:
+                return self.export(path, f, format)
+        if format == "csv":
+            writer = csv.writer(file)
+            writer.writerow(self.EXPORT_FIELDS)
+        count = 0
+        for kind, target_path, acls in self._walk(path):
+            acls = sorted(acls, key=lambda acl: (acl.user_name, acl.access_name))
+            if format == "csv":
+                writer.writerows(
+                    (
+                        kind,
+                        target_path,
+                        acl.user_name,
+                        acl.user_zone,
+                        acl.user_type,
+                        acl.access_name,
+                    )
+                    for acl in acls
+                )
+            else:
+                record = {
+                    "type": kind,
+                    "path": target_path,
+                    "acls": [
+                        {field: getattr(acl, field) for field in self.EXPORT_FIELDS[2:]}
+                        for acl in acls
+                    ],
+                }
+                file.write(json.dumps(record) + "\n")
+            count += 1
+        return count
+
+    def _walk(self, path):
+        """Generate a tuple (kind, path, ACLs) for each collection and data object of the subtree at `path'."""
+        path = iRODSCollection.normalize_path(path)
+        prefix = path.rstrip("/") + "/"
+        # LIKE also treats '_' and '%' within the prefix as wildcards, so matches are checked.
+        criteria = [Like(Collection.name, prefix + "%")]
+        if prefix != path:
+            criteria.insert(0, Collection.name == path)
+
+        def in_subtree(row):
+            coll_name = row[Collection.name]
+            return coll_name == path or coll_name.startswith(prefix)
+
+        def collection_path(row):
+            return row[Collection.name]
+
+        def data_object_path(row):
+            return row[Collection.name].rstrip("/") + "/" + row[DataObject.name]
+
+        users = {}
+        looked_up = set()
+        for kind, access_column, path_of, path_columns in (
+            ("collection", CollectionAccess, collection_path, [Collection.name]),
+            (
+                "data_object",
+                DataAccess,
+                data_object_path,
+                [Collection.name, DataObject.name],
+            ),
+        ):
+            current_path, current_rows = None, []
+            for criterion in criteria:
+                query = self.sess.query(
+                    *(path_columns + [access_column.name, access_column.user_id])
+                ).filter(criterion)
+                for column in path_columns:
+                    query = query.order_by(column)
+                for result_set in query.get_batches():
+                    rows = [row for row in result_set if in_subtree(row)]
+                    new_ids = set(r[access_column.user_id] for r in rows) - looked_up
+                    if new_ids:
+                        users.update(self._users_by_ids(new_ids))
+                        looked_up |= new_ids
+                    # Ordering by path keeps the rows of each target together, though they
+                    # may be split across batches.
+                    for target_path, target_rows in itertools.groupby(
+                        rows, key=path_of
+                    ):
+                        if target_path != current_path:
+                            if current_rows:
+                                yield (
+                                    kind,
+                                    current_path,
+                                    self._acls_from_rows(
+                                        current_path, current_rows, access_column, users
+                                    ),
+                                )
+                            current_path, current_rows = target_path, []
+                        current_rows += target_rows
+            if current_rows:
+                yield (
+                    kind,
+                    current_path,
+                    self._acls_from_rows(
+                        current_path, current_rows, access_column, users
+                    ),
+                )
+
     def set(self, acl, recursive=False, admin=False, **kw):
 
         prefix = "admin:" if admin else ""
@@ -187,7 +408,11 @@ class AccessManager(Manager):
             msg=message_body,
             int_info=api_number["MOD_ACCESS_CONTROL_AN"],
         )
-        with self.sess.pool.get_connection() as conn:
-            conn.send(request)
-            response = conn.recv()
+        try:
+            with self.sess.pool.get_connection() as conn:
+                conn.send(request)
+                response = conn.recv()
+        finally:
+            # (No)inherit changes the collection's catalog row, recursively so if requested.
+            self.sess.catalog_cache.invalidate(acl.path, tree=recursive)
         logger.debug(response.int_info)
@@ -19,6 +19,13 @@ class CollectionManager(Manager):
 
     def get(self, path):
         path = iRODSCollection.normalize_path(path)
+        cache = self.sess.catalog_cache
+        found, result = cache.lookup(cache.COLLECTION, path)
+        if found:
+            if result is None:
+                raise CollectionDoesNotExist()
+            return iRODSCollection(self, result)
+        generation = cache.generation
         filters = [Collection.name == path]
         # if a ticket is supplied for this session, try both without and with DataObject join
         repeats = (True, False) if hasattr(self.sess, "ticket__") else (False,)
@@ -30,7 +37,9 @@ class CollectionManager(Manager):
                 if rep:
                     filters += [DataObject.id != 0]
                     continue
+                cache.store(cache.COLLECTION, path, None, generation)
                 raise CollectionDoesNotExist()
+            cache.store(cache.COLLECTION, path, result, generation)
             return iRODSCollection(self, result)
 
     def create(self, path, recurse=True, **options):
@@ -47,8 +56,14 @@ class CollectionManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(*self._path_and_ancestors(path))
         return self.get(path)
 
+    @staticmethod
+    def _path_and_ancestors(path):
+        elements = path.split("/")
+        return ["/".join(elements[:n]) or "/" for n in range(1, len(elements) + 1)]
+
     def remove(self, path, recurse=True, force=False, **options):
         if recurse:
             options[kw.RECURSIVE_OPR__KW] = ""
@@ -69,14 +84,18 @@ class CollectionManager(Manager):
         message = iRODSMessage(
             "RODS_API_REQ", msg=message_body, int_info=api_number["RM_COLL_AN"]
         )
-        with self.sess.pool.get_connection() as conn:
-            conn.send(message)
-            response = conn.recv()
-
-            while response.int_info == SYS_SVR_TO_CLI_COLL_STAT:
-                conn.reply(SYS_CLI_TO_SVR_COLL_STAT_REPLY)
+        try:
+            with self.sess.pool.get_connection() as conn:
+                conn.send(message)
                 response = conn.recv()
 
+                while response.int_info == SYS_SVR_TO_CLI_COLL_STAT:
+                    conn.reply(SYS_CLI_TO_SVR_COLL_STAT_REPLY)
+                    response = conn.recv()
+        finally:
+            # Even a failed recursive removal may have removed part of the tree.
+            self.sess.catalog_cache.invalidate(path, tree=True)
+
     def unregister(self, path, **options):
         # https://github.com/irods/irods/blob/4.2.1/lib/api/include/dataObjInpOut.h#L190
         options[kw.OPR_TYPE_KW] = 26
@@ -127,6 +146,7 @@ class CollectionManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(src_path, target_path, tree=True)
 
     def register(self, dir_path, coll_path, **options):
         options[kw.FILE_PATH_KW] = dir_path
@@ -149,6 +169,7 @@ class CollectionManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(coll_path, tree=True)
 
     def touch(self, path, **options):
         """Change the mtime of an existing collection.
@@ -186,3 +207,4 @@ class CollectionManager(Manager):
         options.pop("leaf_resource_name", None)
 
         _api_impl._touch_impl(self.sess, path, no_create=True, **options)
+        self.sess.catalog_cache.invalidate(path)
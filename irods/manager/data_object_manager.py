@@ -1,11 +1,15 @@
 import ast
 import collections
+import concurrent.futures
 import io
 import json
 import logging
 import os
+import tarfile
+import uuid
 import weakref
 from irods.models import DataObject, Collection
+from irods.column import In
 from irods.manager import Manager
 from irods.manager._internal import _api_impl, _logical_path
 from irods.message import (
@@ -19,6 +23,8 @@ from irods.message import (
     DataObjChksumResponse,
     RErrorStack,
     STR_PI,
+    StructFileExtAndRegRequest,
+    PortalOprOut,
 )
 import irods.exception as ex
 from irods.api_number import api_number
@@ -33,6 +39,7 @@ from irods.data_object import (
 import irods.client_configuration as client_config
 import irods.keywords as kw
 import irods.parallel as parallel
+from irods.query import get_results_concurrently
 from irods.parallel import deferred_call
 
 logger = logging.getLogger(__name__)
@@ -148,6 +155,23 @@ DEFAULT_NUMBER_OF_THREADS = (
 
 DEFAULT_QUEUE_DEPTH = 32
 
+# Number of bundles and individual puts in progress at once, for put_many() and put_directory().
+DEFAULT_NUMBER_OF_BULK_PUT_WORKERS = 4
+
+# Allowance for the tar header and padding of each file in a put_many() bundle, along with
+# a PAX extended header (as is written for a fractional modification time, or a long name).
+TAR_MEMBER_OVERHEAD = 4 * tarfile.BLOCKSIZE
+
+
+def _tar_size(members_size):
+    """The size of a tar stream whose members, with their headers and padding, take members_size bytes.
+
+    The archive ends with two zero blocks, and is padded out to a whole record.
+    """
+    size = members_size + 2 * tarfile.BLOCKSIZE
+    return -(-size // tarfile.RECORDSIZE) * tarfile.RECORDSIZE
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -222,22 +246,134 @@ class DataObjectManager(Manager):
             if size is not None and isinstance(open_options, dict):
                 open_options[kw.DATA_SIZE_KW] = size
 
-    def _download(self, obj, local_path, num_threads, updatables=(), **options):
+    # Parameters of open() that are not passed to the server as keywords. A put() or get() using
+    # any of them is carried out by way of open().
+    _open_only_options = frozenset(
+        ("create", "finalize_on_close", "auto_close", "returned_values", "allow_redirect")
+    )
+
+    def _single_buffer_eligible(self, size, options):
+        threshold = client_config.data_objects.single_buffer_transfer_size
+        return 0 <= size <= threshold and self._open_only_options.isdisjoint(options)
+
+    def _single_buffer_get(self, path, size, options):
+        """Fetch the contents of a data object in one DATA_OBJ_GET call.
+
+        Returns None if the server does not include the data in its reply, as when
+        it would instead have the client connect to a portal for a parallel transfer.
+        """
+        message_body = FileOpenRequest(
+            objPath=path,
+            createMode=0,
+            openFlags=self.O_RDONLY,
+            offset=0,
+            dataSize=size,
+            numThreads=self.sess.numThreads,
+            oprType=2,  # GET_OPR
+            KeyValPair_PI=StringStringMap(options),
+        )
+        message = iRODSMessage(
+            "RODS_API_REQ", msg=message_body, int_info=api_number["DATA_OBJ_GET_AN"]
+        )
+        conn = self.sess.pool.get_connection()
+        try:
+            conn.send(message)
+            response = conn.recv()
+            try:
+                num_threads = response.get_main_message(PortalOprOut).numThreads
+            except iRODSMessage.ResponseNotParseable:
+                num_threads = 0
+        except BaseException:
+            conn.release()
+            raise
+        data = response.bs or b""
+        if num_threads > 0 or len(data) != size:
+            # The server expects more of the client than we can provide here; drop the connection.
+            logger.debug("DATA_OBJ_GET of %r did not return the data in its reply.", path)
+            conn.release(destroy=True)
+            return None
+        conn.release()
+        return data
+
+    def _single_buffer_put(self, path, data, options):
+        """Create a data object with the given contents in one DATA_OBJ_PUT call.
+
+        As with iput, an existing data object is overwritten only if FORCE_FLAG_KW is among the options.
+        """
+        options = dict(options)
+        if self._RESC_flags_for_open.isdisjoint(options.keys()):
+            # As in open(), use the client-side default resource if available.
+            try:
+                options[kw.DEST_RESC_NAME_KW] = self.sess.default_resource
+            except AttributeError:
+                pass
+        options[kw.DATA_INCLUDED_KW] = ""
+        message_body = FileOpenRequest(
+            objPath=path,
+            createMode=0,
+            openFlags=self.O_WRONLY | self.O_CREAT | self.O_TRUNC,
+            offset=0,
+            dataSize=len(data),
+            numThreads=self.sess.numThreads,
+            oprType=1,  # PUT_OPR
+            KeyValPair_PI=StringStringMap(options),
+        )
+        message = iRODSMessage(
+            "RODS_API_REQ",
+            msg=message_body,
+            bs=data,
+            int_info=api_number["DATA_OBJ_PUT_AN"],
+        )
+        with self.sess.pool.get_connection() as conn:
+            conn.send(message)
+            conn.recv()
+
+    def _download(
+        self,
+        obj,
+        local_path,
+        num_threads,
+        updatables=(),
+        resume=False,
+        data_size=None,
+        data_object=None,
+        **options
+    ):
         """Transfer the contents of a data object to a local file.
 
-        Called from get() when a local path is named.
+        Called from get() when a local path is named, with the iRODSDataObject found there.
         """
         if os.path.isdir(local_path):
             local_file = os.path.join(local_path, irods_basename(obj))
         else:
             local_file = local_path
 
+        # A partial download, checkpointed in a journal of this same transfer, may be resumed
+        # and so must not be truncated here.
+        resuming = (
+            data_object is not None
+            and os.path.exists(local_file)
+            and parallel.can_resume_get(resume, data_object, local_file)
+        )
+
         # Check for force flag if local_file exists
-        if os.path.exists(local_file) and kw.FORCE_FLAG_KW not in options:
+        if (
+            os.path.exists(local_file)
+            and kw.FORCE_FLAG_KW not in options
+            and not resuming
+        ):
             raise ex.OVERWRITE_WITHOUT_FORCE_FLAG
 
+        if data_size is not None and self._single_buffer_eligible(data_size, options):
+            data = self._single_buffer_get(obj, data_size, options)
+            if data is not None:
+                with open(local_file, "wb") as f:
+                    f.write(data)
+                do_progress_updates(updatables, len(data))
+                return
+
         data_open_returned_values_ = {}
-        with open(local_file, "wb") as f:
+        with open(local_file, "ab" if resuming else "wb") as f:
             with self.open(
                 obj, "r", returned_values=data_open_returned_values_, **options
             ) as o:
@@ -252,9 +388,11 @@ class DataObjectManager(Manager):
                         target_resource_name=options.get(kw.RESC_NAME_KW, ""),
                         data_open_returned_values=data_open_returned_values_,
                         updatables=updatables,
+                        resume=resume,
                     ):
                         raise RuntimeError("parallel get failed")
                 else:
+                    f.truncate(0)
                     for chunk in chunks(o, self.READ_BUFFER_SIZE):
                         f.write(chunk)
                         do_progress_updates(updatables, len(chunk))
@@ -265,6 +403,7 @@ class DataObjectManager(Manager):
         local_path=None,
         num_threads=DEFAULT_NUMBER_OF_THREADS,
         updatables=(),
+        resume=False,
         **options
     ):
         """
@@ -272,18 +411,21 @@ class DataObjectManager(Manager):
 
         Only download the object if the local_path is a string (specifying
         a path in the local filesystem to use as a destination file).
+
+        If `resume' is True (or the path of a journal file), a parallel download is
+        checkpointed, and if interrupted can be resumed by repeating the same call.
         """
         parent = self.sess.collections.get(irods_dirname(path))
 
-        # TODO: optimize
-        if local_path:
-            self._download(
-                path,
-                local_path,
-                num_threads=num_threads,
-                updatables=updatables,
-                **options
-            )
+        # The replica sizes found in the cache might be out of date for a download.
+        cache = self.sess.catalog_cache
+        if not local_path:
+            found, results = cache.lookup(cache.DATA_OBJECT, path)
+            if found:
+                if not results:
+                    raise ex.DataObjectDoesNotExist()
+                return iRODSDataObject(self, parent, results)
+        generation = cache.generation
 
         query = (
             self.sess.query(DataObject)
@@ -299,9 +441,86 @@ class DataObjectManager(Manager):
             # is for a DataObject and we don't explicitly join to Collection
 
         results = query.all()  # get up to max_rows replicas
+        cache.store(cache.DATA_OBJECT, path, results.rows or None, generation)
         if len(results) <= 0:
             raise ex.DataObjectDoesNotExist()
-        return iRODSDataObject(self, parent, results)
+
+        data_object = iRODSDataObject(self, parent, results)
+        if local_path:
+            # The replica sizes let small objects be downloaded in a single call.
+            self._download(
+                path,
+                local_path,
+                num_threads=num_threads,
+                updatables=updatables,
+                resume=resume,
+                data_size=max(row[DataObject.size] for row in results),
+                data_object=data_object,
+                **options
+            )
+
+        return data_object
+
+    def get_many(self, paths):
+        """
+        Get references to many data objects at once, given their paths.
+
+        Returns a dict mapping each of the paths to an iRODSDataObject, or to None if no data
+        object exists at that path.  Rather than two queries per path, as get() makes, the
+        paths are grouped by collection (and zone) and looked up by a few queries joining
+        data objects to their collections.  Each query covers up to the number of names and
+        collections set by genquery.in_filter_max_values.  The queries are run concurrently
+        on up to genquery.in_filter_workers connections.
+        """
+        paths = list(paths)
+        max_values = client_config.genquery.in_filter_max_values
+        wanted = collections.defaultdict(set)  # zone -> {(collection path, name), ...}
+        for path in paths:
+            zone = path.split("/")[1]
+            wanted[zone].add((irods_dirname(path), irods_basename(path)))
+
+        queries = []
+        for zone, pairs in wanted.items():
+            coll_names, data_names = set(), set()
+            for coll_name, data_name in sorted(pairs):
+                if max_values > 0 and (
+                    len(coll_names | {coll_name}) > max_values
+                    or len(data_names | {data_name}) > max_values
+                ):
+                    queries.append((zone, coll_names, data_names))
+                    coll_names, data_names = set(), set()
+                coll_names.add(coll_name)
+                data_names.add(data_name)
+            queries.append((zone, coll_names, data_names))
+        queries = [
+            self.sess.query(DataObject, Collection)
+            .filter(
+                In(Collection.name, sorted(coll_names)),
+                In(DataObject.name, sorted(data_names)),
+            )
+            .add_keyword(kw.ZONE_KW, zone)
+            for zone, coll_names, data_names in queries
+        ]
+
+        # The queries select every name in every listed collection; keep only what was asked for.
+        found = collections.defaultdict(list)
+        parents = {}
+        for row in get_results_concurrently(queries):
+            key = (row[Collection.name], row[DataObject.name])
+            zone = key[0].split("/")[1]
+            if key in wanted[zone]:
+                found[key].append(row)
+                if key[0] not in parents:
+                    parents[key[0]] = iRODSCollection(self.sess.collections, row)
+
+        data_objects = {}
+        for path in paths:
+            key = (irods_dirname(path), irods_basename(path))
+            rows = found.get(key)
+            data_objects[path] = (
+                iRODSDataObject(self, parents[key[0]], rows) if rows else None
+            )
+        return data_objects
 
     def put(
         self,
@@ -310,8 +529,15 @@ class DataObjectManager(Manager):
         return_data_object=False,
         num_threads=DEFAULT_NUMBER_OF_THREADS,
         updatables=(),
+        resume=False,
         **options
     ):
+        """
+        Upload the local file at `local_path' to `irods_path'.
+
+        If `resume' is True (or the path of a journal file), a parallel upload is
+        checkpointed, and if interrupted can be resumed by repeating the same call.
+        """
 
         if self.sess.collections.exists(irods_path):
             obj = iRODSCollection.normalize_path(
@@ -336,8 +562,18 @@ class DataObjectManager(Manager):
                     or options.get(kw.DEST_RESC_NAME_KW, ""),
                     open_options=options,
                     updatables=updatables,
+                    resume=resume,
                 ):
                     raise RuntimeError("parallel put failed")
+            elif (
+                client_config.data_objects.single_buffer_put
+                and self._single_buffer_eligible(
+                    sizelist[0] if sizelist else os.fstat(f.fileno()).st_size, options
+                )
+            ):
+                data = f.read()
+                self._single_buffer_put(obj, data, options)
+                do_progress_updates(updatables, len(data))
             else:
                 with self.open(obj, "w", **options) as o:
                     # Set operation type to trigger acPostProcForPut
@@ -354,10 +590,166 @@ class DataObjectManager(Manager):
             # in multiple replicas being marked good with different checksums, which is an inconsistency.
             del repl_options[kw.REG_CHKSUM_KW]
             self.replicate(obj, **repl_options)
+        self.sess.catalog_cache.invalidate(obj)
 
         if return_data_object:
             return self.get(obj)
 
+    def put_many(
+        self,
+        pairs,
+        num_workers=DEFAULT_NUMBER_OF_BULK_PUT_WORKERS,
+        updatables=(),
+        **options
+    ):
+        """
+        Upload many local files, given as an iterable of (local_path, logical_path) pairs.
+
+        Files no larger than the data_objects.bulk_put_file_size_threshold setting are packed
+        into tar bundles, one or more per destination collection.  Each bundle is streamed to
+        the server as a temporary data object, which is then expanded and its contents registered
+        in a single STRUCT_FILE_EXT_AND_REG_AN call.  Larger files, as well as the files of any
+        bundle the server declines to expand, are uploaded using put().  Up to `num_workers'
+        bundles and puts are in progress at once.
+
+        Returns the list of logical paths uploaded.
+        """
+        config = client_config.data_objects
+        singles = []
+        bundles = []
+        open_bundles = {}
+        for local_path, logical_path in pairs:
+            size = os.path.getsize(local_path)
+            if size > config.bulk_put_file_size_threshold:
+                singles.append((local_path, logical_path))
+                continue
+            collection = irods_dirname(logical_path)
+            bundle = open_bundles.get(collection)
+            if (
+                bundle is None
+                or len(bundle["members"]) >= config.bulk_put_bundle_max_files
+                or _tar_size(bundle["size"] + size + TAR_MEMBER_OVERHEAD)
+                > config.bulk_put_bundle_size
+            ):
+                bundle = open_bundles[collection] = {"members": [], "size": 0}
+                bundles.append((collection, bundle["members"]))
+            bundle["members"].append((local_path, irods_basename(logical_path), size))
+            bundle["size"] += size + TAR_MEMBER_OVERHEAD
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.sess.pool.limit_workers(max(1, num_workers))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._put_bundle, collection, members, updatables, options
+                )
+                for collection, members in bundles
+            ]
+            futures += [
+                executor.submit(
+                    self._put_single, local_path, logical_path, updatables, options
+                )
+                for local_path, logical_path in singles
+            ]
+            return [path for f in futures for path in f.result()]
+
+    def put_directory(self, local_dir, irods_collection, **kwargs):
+        """
+        Upload the tree of files under `local_dir' into `irods_collection'.
+
+        The collection and its subcollections are created as necessary.  Other
+        parameters are as for put_many(), and the list of logical paths uploaded
+        is returned.
+        """
+        irods_collection = iRODSCollection.normalize_path(irods_collection)
+        pairs = []
+        for dirpath, _, filenames in os.walk(local_dir):
+            relative_dir = os.path.relpath(dirpath, local_dir)
+            collection = irods_collection
+            if relative_dir != os.curdir:
+                collection += "/" + "/".join(relative_dir.split(os.sep))
+            self.sess.collections.create(collection)
+            pairs += [
+                (os.path.join(dirpath, name), collection + "/" + name)
+                for name in filenames
+            ]
+        return self.put_many(pairs, **kwargs)
+
+    def _put_single(self, local_path, logical_path, updatables, options):
+        self.put(local_path, logical_path, updatables=updatables, **dict(options))
+        return [logical_path]
+
+    def _put_bundle(self, collection, members, updatables, options):
+        """Upload the files of one put_many() bundle into `collection', by way of a tar file."""
+        logical_paths = [collection + "/" + name for _, name, _ in members]
+        staging_path = "{}/.bulk_put_{}.tar".format(collection, uuid.uuid4().hex)
+        # Unless forced, the extraction stops at a data object already present.  Note which
+        # ones were, so as to tell them from those the extraction registered before failing.
+        existing = None
+        if kw.FORCE_FLAG_KW not in options:
+            existing = set(
+                path
+                for path, obj in self.get_many(logical_paths).items()
+                if obj is not None
+            )
+        try:
+            with self.open(staging_path, "w", **dict(options)) as o:
+                with tarfile.open(fileobj=o, mode="w|") as tar:
+                    for local_path, name, _ in members:
+                        tar.add(local_path, arcname=name, recursive=False)
+            extract_options = dict(options)
+            extract_options[kw.DATA_TYPE_KW] = "tar"
+            extract_options[kw.BULK_OPR_KW] = ""
+            message_body = StructFileExtAndRegRequest(
+                objPath=staging_path,
+                collection=collection,
+                oprType=0,
+                flags=0,
+                KeyValPair_PI=StringStringMap(extract_options),
+            )
+            message = iRODSMessage(
+                "RODS_API_REQ",
+                msg=message_body,
+                int_info=api_number["STRUCT_FILE_EXT_AND_REG_AN"],
+            )
+            with self.sess.pool.get_connection() as conn:
+                conn.send(message)
+                conn.recv()
+        except ex.iRODSException as exc:
+            logger.warning(
+                "Bundled upload into %r failed (%r); uploading its %d files individually.",
+                collection,
+                exc,
+                len(members),
+            )
+            registered = {}
+            if existing is not None:
+                registered = {
+                    path: obj
+                    for path, obj in self.get_many(logical_paths).items()
+                    if obj is not None and path not in existing
+                }
+            for (local_path, _, size), logical_path in zip(members, logical_paths):
+                obj = registered.get(logical_path)
+                if obj is not None and obj.size == size:
+                    do_progress_updates(updatables, size)
+                    continue
+                put_options = dict(options)
+                if obj is not None:
+                    # Replace a file left incomplete by the extraction.
+                    put_options[kw.FORCE_FLAG_KW] = ""
+                self._put_single(local_path, logical_path, updatables, put_options)
+        else:
+            for _, _, size in members:
+                do_progress_updates(updatables, size)
+        finally:
+            try:
+                self.unlink(staging_path, force=True)
+            except ex.iRODSException as exc:
+                logger.debug("Could not remove bundle %r: %r", staging_path, exc)
+            self.sess.catalog_cache.invalidate(*logical_paths)
+        return logical_paths
+
     def chksum(self, path, **options):
         """
         See: https://github.com/irods/irods/blob/4-2-stable/lib/api/include/dataObjChksum.h
@@ -396,6 +788,9 @@ class DataObjectManager(Manager):
                 except iRODSMessage.ResponseNotParseable:
                     # response.msg is None when VERIFY_CHKSUM_KW is used
                     pass
+                finally:
+                    # Computing the checksum may have registered it.
+                    self.sess.catalog_cache.invalidate(path)
         return checksum
 
     def parallel_get(
@@ -408,6 +803,7 @@ class DataObjectManager(Manager):
         data_open_returned_values=None,
         progressQueue=False,
         updatables=(),
+        resume=False,
     ):
         """Call into the irods.parallel library for multi-1247 GET.
 
@@ -426,6 +822,7 @@ class DataObjectManager(Manager):
             data_open_returned_values=data_open_returned_values,
             queueLength=(DEFAULT_QUEUE_DEPTH if progressQueue else 0),
             updatables=updatables,
+            resume=resume,
         )
 
     def parallel_put(
@@ -439,6 +836,7 @@ class DataObjectManager(Manager):
         open_options={},
         updatables=(),
         progressQueue=False,
+        resume=False,
     ):
         """Call into the irods.parallel library for multi-1247 PUT.
 
@@ -457,6 +855,7 @@ class DataObjectManager(Manager):
             open_options=open_options,
             queueLength=(DEFAULT_QUEUE_DEPTH if progressQueue else 0),
             updatables=updatables,
+            resume=resume,
         )
 
     def create(self, path, resource=None, force=False, **options):
@@ -493,6 +892,7 @@ class DataObjectManager(Manager):
             response = conn.recv()
             desc = response.int_info
             conn.close_file(desc)
+        self.sess.catalog_cache.invalidate(path)
 
         return self.get(path)
 
@@ -542,6 +942,9 @@ class DataObjectManager(Manager):
             "a+": (self.O_RDWR | createFlag, True),
         }[mode]
         # TODO: Use seek_to_end
+        if mode != "r":
+            # Writes (and the replica updates on close) make any cached rows out of date.
+            self.sess.catalog_cache.invalidate(path)
 
         if not isinstance(returned_values, dict):
             returned_values = {}
@@ -603,8 +1006,13 @@ class DataObjectManager(Manager):
         if redirected_host and use_get_rescinfo_apis:
             # Redirect only if the local zone is being targeted, and if the hostname is changed from the original.
             if target_zone == self.sess.zone and (self.sess.host != redirected_host):
-                # This is the actual redirect.
-                directed_sess = self.sess.clone(host=redirected_host)
+                # This is the actual redirect.  Reuse a previously redirected session (and its warm
+                # connections) to the same host, if one is cached.
+                redirect_sessions = self.sess.redirect_sessions
+                directed_sess = redirect_sessions.get(
+                    redirect_sessions.key_for(self.sess, redirected_host),
+                    lambda: self.sess.clone(host=redirected_host),
+                )
                 returned_values["session"] = directed_sess
                 conn.release()
                 conn = directed_sess.pool.get_connection()
@@ -626,6 +1034,9 @@ class DataObjectManager(Manager):
             conn, desc, finalize_on_close=finalize_on_close, **options
         )
         raw.session = directed_sess
+        if mode != "r":
+            # Rows cached while the handle is open are out of date once it is closed.
+            raw.catalog_cache, raw.logical_path = self.sess.catalog_cache, path
 
         (_raw_fd_holder).append(raw)
 
@@ -671,6 +1082,7 @@ class DataObjectManager(Manager):
             conn.send(message)
             response = conn.recv()
             msg = response.get_main_message(STR_PI)
+        self.sess.catalog_cache.invalidate(path)
 
         return json.loads(msg.myStr)
 
@@ -698,6 +1110,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(path)
 
     def unlink(self, path, force=False, **options):
         if force:
@@ -725,6 +1138,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(path)
 
     def unregister(self, path, **options):
         # https://github.com/irods/irods/blob/4.2.1/lib/api/include/dataObjInpOut.h#L190
@@ -780,6 +1194,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(src_path, target_path)
 
     def copy(self, src_path, dest_path, **options):
         # check if dest is a collection
@@ -818,6 +1233,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(target_path)
 
     def truncate(self, path, size, **options):
         message_body = FileOpenRequest(
@@ -839,6 +1255,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(path)
 
     def replicate(self, path, resource=None, **options):
         if resource:
@@ -865,6 +1282,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(path)
 
     def register(self, file_path, obj_path, **options):
         options[kw.FILE_PATH_KW] = file_path
@@ -886,6 +1304,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(obj_path)
 
     def modDataObjMeta(self, data_obj_info, meta_dict, **options):
         if (
@@ -944,6 +1363,7 @@ class DataObjectManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(message)
             response = conn.recv()
+        self.sess.catalog_cache.invalidate(data_obj_info["objPath"])
 
     def touch(self, path, **options):
         """Change the mtime of a data object.
@@ -989,3 +1409,4 @@ class DataObjectManager(Manager):
             raise ex.InvalidInputArgument()
 
         _api_impl._touch_impl(self.sess, path, **options)
+        self.sess.catalog_cache.invalidate(path)
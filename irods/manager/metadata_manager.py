@@ -1,5 +1,8 @@
+import concurrent.futures
 import logging
 import copy
+import threading
+import time
 from os.path import dirname, basename
 
 from irods.manager import Manager
@@ -26,6 +29,34 @@ class InvalidAtomicAVURequest(Exception):
     pass
 
 
+class BulkMetadataResult:
+    """The outcome of MetadataManager.apply_many().
+
+    Counts the entities (data objects, collections, etc.) whose AVU operations were
+    applied, and the operations sent.  Each entity for which the call failed is listed
+    in `failures' as a tuple (model class, path, exception).
+    """
+
+    def __init__(self):
+        self.applied = 0
+        self.operations = 0
+        self.failures = []
+        self.elapsed = 0.0
+
+    @property
+    def entities_per_second(self):
+        return self.applied / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def operations_per_second(self):
+        return self.operations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return (
+            "<BulkMetadataResult applied={} failed={} operations={} elapsed={:.3f}s>"
+        ).format(self.applied, len(self.failures), self.operations, self.elapsed)
+
+
 class MetadataManager(Manager):
 
     @property
@@ -101,6 +132,11 @@ class MetadataManager(Manager):
             for row in results
         ]
 
+    def _invalidate_cached(self, model_cls, *paths):
+        # The catalog cache holds rows of collections and data objects only.
+        if model_cls in (DataObject, Collection):
+            self.sess.catalog_cache.invalidate(*paths)
+
     def add(self, model_cls, path, meta, **opts):
 
         resource_type = self._model_class_to_resource_type(model_cls)
@@ -119,6 +155,7 @@ class MetadataManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(request)
             response = conn.recv()
+        self._invalidate_cached(model_cls, path)
         logger.debug(response.int_info)
 
     def remove(self, model_cls, path, meta, **opts):
@@ -138,6 +175,7 @@ class MetadataManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(request)
             response = conn.recv()
+        self._invalidate_cached(model_cls, path)
         logger.debug(response.int_info)
 
     def copy(self, src_model_cls, dest_model_cls, src, dest, **opts):
@@ -158,6 +196,7 @@ class MetadataManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(request)
             response = conn.recv()
+        self._invalidate_cached(dest_model_cls, dest)
         logger.debug(response.int_info)
 
     def set(self, model_cls, path, meta, **opts):
@@ -177,6 +216,7 @@ class MetadataManager(Manager):
         with self.sess.pool.get_connection() as conn:
             conn.send(request)
             response = conn.recv()
+        self._invalidate_cached(model_cls, path)
         logger.debug(response.int_info)
 
     @staticmethod
@@ -202,6 +242,61 @@ class MetadataManager(Manager):
             "operations": [self._avu_operation_to_dict(op) for op in avu_ops],
         }
         self._call_atomic_metadata_api(request)
+        self._invalidate_cached(model_cls, path)
+
+    def apply_many(self, entries, workers=None):
+        """Apply AVU operations to many entities, given as (model_cls, path, avu_ops) tuples.
+
+        Each entry is applied as by apply_atomic_operations(model_cls, path, *avu_ops).
+        Up to `workers' calls (by default, the metadata.apply_many_workers setting) are
+        in progress at once, each on a pooled connection of its own.  Entries are drawn
+        from the iterable as calls complete, so it may be a generator of any length.
+
+        A failure to apply one entry's operations does not stop the others from being
+        applied; it is recorded in the `failures' of the BulkMetadataResult returned,
+        which also counts the entities and operations applied and the time taken.
+        """
+        if workers is None:
+            import irods.client_configuration as cfg
+
+            workers = cfg.metadata.apply_many_workers
+        workers = self.sess.pool.limit_workers(max(1, workers))
+        result = BulkMetadataResult()
+        entries = iter(entries)
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def apply_entries():
+            while not stop.is_set():
+                with lock:
+                    entry = next(entries, None)
+                if entry is None:
+                    return
+                model_cls, path, avu_ops = entry
+                avu_ops = list(avu_ops)
+                try:
+                    if avu_ops:
+                        self.apply_atomic_operations(model_cls, path, *avu_ops)
+                except Exception as exc:
+                    logger.debug("apply_many: failed on %r: %r", path, exc)
+                    with lock:
+                        result.failures.append((model_cls, path, exc))
+                else:
+                    with lock:
+                        result.applied += 1
+                        result.operations += len(avu_ops)
+
+        start = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(apply_entries) for _ in range(workers)]
+            try:
+                # Errors raised by the iterable itself end the run.
+                for future in futures:
+                    future.result()
+            finally:
+                stop.set()
+                result.elapsed = time.time() - start
+        return result
 
     def _call_atomic_metadata_api(self, request_text):
         with self.sess.pool.get_connection() as conn:
@@ -120,11 +120,19 @@ class UserManager(Manager):
         request = iRODSMessage(
             "RODS_API_REQ", msg=message_body, int_info=api_number["GENERAL_ADMIN_AN"]
         )
-        with self.sess.pool.get_connection() as conn:
-            conn.send(request)
-            response = conn.recv()
+        try:
+            with self.sess.pool.get_connection() as conn:
+                conn.send(request)
+                response = conn.recv()
+        finally:
+            # Removing a group also removes its memberships.
+            self._invalidate_cached_users()
         logger.debug(response.int_info)
 
+    def _invalidate_cached_users(self):
+        # Drop the users and groups cached by id for the access manager.
+        self.sess.user_cache.clear()
+
     def temp_password_for_user(self, user_name):
         with self.sess.pool.get_connection() as conn:
             message_body = GetTempPasswordForOtherRequest(
@@ -256,6 +264,7 @@ class UserManager(Manager):
 
             conn.send(request)
             response = conn.recv()
+        self._invalidate_cached_users()
         logger.debug(response.int_info)
 
 
@@ -343,9 +352,12 @@ class GroupManager(UserManager):
         request = iRODSMessage(
             "RODS_API_REQ", msg=message_body, int_info=api_number[api_key]
         )
-        with self.sess.pool.get_connection() as conn:
-            conn.send(request)
-            response = conn.recv()
+        try:
+            with self.sess.pool.get_connection() as conn:
+                conn.send(request)
+                response = conn.recv()
+        finally:
+            self._invalidate_cached_users()
         logger.debug(response.int_info)
 
     def removemember(
@@ -367,9 +379,12 @@ class GroupManager(UserManager):
         request = iRODSMessage(
             "RODS_API_REQ", msg=message_body, int_info=api_number[api_key]
         )
-        with self.sess.pool.get_connection() as conn:
-            conn.send(request)
-            response = conn.recv()
+        try:
+            with self.sess.pool.get_connection() as conn:
+                conn.send(request)
+                response = conn.recv()
+        finally:
+            self._invalidate_cached_users()
         logger.debug(response.int_info)
 
     def remove_quota(self, group_name, resource="total"):
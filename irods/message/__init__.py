@@ -3,6 +3,7 @@
 import struct
 import logging
 import socket
+import ssl
 import json
 import irods.exception as ex
 import xml.etree.ElementTree as ET_xml
@@ -12,6 +13,7 @@ from ..api_number import api_number
 from collections import namedtuple
 import os
 import ast
+import re
 import threading
 from .message import Message
 from .property_types import (
@@ -200,10 +202,38 @@ def _socket_is_blocking(sk):
         return timeout is None or timeout > 0
 
 
-def _recv_message_in_len(sock, size):
-    size_left = size
-    retbuf = None
+def _recv_with_flags(sock, size):
+    try:
+        return sock.recv(size, socket.MSG_WAITALL)
+    except (AttributeError, ValueError):
+        return sock.recv(size)
+    except OSError as e:
+        # skip only Windows error 10045
+        if getattr(e, "winerror", 0) != 10045:
+            raise
+        return sock.recv(size)
+
+
+def _recv_into_with_flags(sock, view, size):
+    try:
+        return sock.recv_into(view, size, socket.MSG_WAITALL)
+    except (AttributeError, ValueError):
+        return sock.recv_into(view, size)
+    except OSError as e:
+        # skip only Windows error 10045
+        if getattr(e, "winerror", 0) != 10045:
+            raise
+        return sock.recv_into(view, size)
+
+
+def _short_read_error(received, size):
+    msg = "Read {} bytes from socket instead of expected {} bytes".format(
+        received, size
+    )
+    return socket.error(msg)
+
 
+def _recv_message_in_len(sock, size):
     # Get socket properties for debug and exception messages.
     is_blocking = _socket_is_blocking(sock)
     timeout = sock.gettimeout()
@@ -211,39 +241,24 @@ def _recv_message_in_len(sock, size):
     logger.debug("is_blocking: %s", is_blocking)
     logger.debug("timeout: %s", timeout)
 
-    while size_left > 0:
-        try:
-            buf = sock.recv(size_left, socket.MSG_WAITALL)
-        except (AttributeError, ValueError):
-            buf = sock.recv(size_left)
-        except OSError as e:
-            # skip only Windows error 10045
-            if getattr(e, "winerror", 0) != 10045:
-                raise
-            buf = sock.recv(size_left)
-
-        # This prevents an infinite loop. If the call to recv()
-        # returns an empty buffer, break out of the loop.
-        if len(buf) == 0:
-            break
-        size_left -= len(buf)
-        if retbuf is None:
-            retbuf = buf
-        else:
-            retbuf += buf
+    # Usually the whole message arrives at once.  Otherwise, rather than concatenating
+    # the pieces, fill in the rest of a buffer allocated at the full size.
+    buf = _recv_with_flags(sock, size)
+    received = len(buf)
+    if received == size:
+        return buf
+    retbuf = bytearray(size)
+    retbuf[:received] = buf
+    if received > 0:
+        received += len(_recv_message_into(sock, memoryview(retbuf)[received:], size - received))
 
     # This method is supposed to read and return 'size'
-    # bytes from the socket. If it reads no bytes (retbuf
-    # will be None), or if it reads less number of bytes
-    # than 'size', throw a socket.error exception
-    if retbuf is None or len(retbuf) != size:
-        retbuf_size = len(retbuf) if retbuf is not None else 0
-        msg = "Read {} bytes from socket instead of expected {} bytes".format(
-            retbuf_size, size
-        )
-        raise socket.error(msg)
+    # bytes from the socket. If it reads less than that,
+    # throw a socket.error exception
+    if received != size:
+        raise _short_read_error(received, size)
 
-    return retbuf
+    return bytes(retbuf)
 
 
 def _recv_message_into(sock, buffer, size):
@@ -251,20 +266,38 @@ def _recv_message_into(sock, buffer, size):
     index = 0
     mv = memoryview(buffer)
     while size_left > 0:
-        try:
-            rsize = sock.recv_into(mv[index:], size_left, socket.MSG_WAITALL)
-        except (AttributeError, ValueError):
-            rsize = sock.recv_into(mv[index:], size_left)
-        except OSError as e:
-            # skip only Windows error 10045
-            if getattr(e, "winerror", 0) != 10045:
-                raise
-            rsize = sock.recv_into(mv[index:], size_left)
+        rsize = _recv_into_with_flags(sock, mv[index:], size_left)
+        # An empty read means the connection was closed; don't loop forever.
+        if rsize == 0:
+            raise _short_read_error(index, size)
         size_left -= rsize
         index += rsize
     return mv[:index]
 
 
+def _send_message_parts(sock, parts):
+    """Send the buffers in `parts' in order, without first joining them into one.
+
+    Uses scatter-gather I/O (socket.sendmsg) where the socket supports it.  Otherwise,
+    as for SSL sockets, the small leading parts are joined and the last sent as is.
+    """
+    parts = [memoryview(part).cast("B") for part in parts if len(part)]
+    if isinstance(sock, ssl.SSLSocket) or not hasattr(sock, "sendmsg"):
+        if len(parts) > 1:
+            sock.sendall(b"".join(parts[:-1]))
+        if parts:
+            sock.sendall(parts[-1])
+        return
+    while parts:
+        sent = sock.sendmsg(parts)
+        while sent > 0:
+            if sent >= len(parts[0]):
+                sent -= len(parts.pop(0))
+            else:
+                parts[0] = parts[0][sent:]
+                sent = 0
+
+
 # ------------------------------------
 
 
@@ -334,20 +367,62 @@ class iRODSMessage:
         )
         raise XMLMessageNotConvertibleToJSON(error_text)
 
+    # MsgHeader_PI has a fixed shape, so it is encoded and decoded without a general XML parser.
+    _HEADER_TEMPLATE = (
+        b"<MsgHeader_PI>"
+        b"<type>%s</type>"
+        b"<msgLen>%d</msgLen>"
+        b"<errorLen>%d</errorLen>"
+        b"<bsLen>%d</bsLen>"
+        b"<intInfo>%d</intInfo>"
+        b"</MsgHeader_PI>"
+    )
+
+    _HEADER_PATTERN = re.compile(
+        rb"\s*<MsgHeader_PI>"
+        rb"\s*<type>([^<&]*)</type>"
+        rb"\s*<msgLen>(-?\d+)</msgLen>"
+        rb"\s*<errorLen>(-?\d+)</errorLen>"
+        rb"\s*<bsLen>(-?\d+)</bsLen>"
+        rb"\s*<intInfo>(-?\d+)</intInfo>"
+        rb"\s*</MsgHeader_PI>"
+    )
+
+    @classmethod
+    def unpack_header(cls, rsp_header):
+        """Decode a packed MsgHeader_PI, returning (type, msgLen, errorLen, bsLen, intInfo)."""
+        match = cls._HEADER_PATTERN.match(rsp_header)
+        if match is not None:
+            msg_type, msg_len, err_len, bs_len, int_info = match.groups()
+            return (
+                msg_type.decode("utf-8") or None,
+                int(msg_len),
+                int(err_len),
+                int(bs_len),
+                int(int_info),
+            )
+        # Anything unexpected, such as character entities, is left to the XML parser.
+        xml_root = ET().fromstring(rsp_header)
+        return (
+            xml_root.find("type").text,
+            int(xml_root.find("msgLen").text),
+            int(xml_root.find("errorLen").text),
+            int(xml_root.find("bsLen").text),
+            int(xml_root.find("intInfo").text),
+        )
+
     @staticmethod
-    def recv(sock):
+    def _recv_header(sock):
         # rsp_header_size = sock.recv(4, socket.MSG_WAITALL)
         rsp_header_size = _recv_message_in_len(sock, 4)
         rsp_header_size = struct.unpack(">i", rsp_header_size)[0]
         # rsp_header = sock.recv(rsp_header_size, socket.MSG_WAITALL)
         rsp_header = _recv_message_in_len(sock, rsp_header_size)
+        return iRODSMessage.unpack_header(rsp_header)
 
-        xml_root = ET().fromstring(rsp_header)
-        msg_type = xml_root.find("type").text
-        msg_len = int(xml_root.find("msgLen").text)
-        err_len = int(xml_root.find("errorLen").text)
-        bs_len = int(xml_root.find("bsLen").text)
-        int_info = int(xml_root.find("intInfo").text)
+    @staticmethod
+    def recv(sock):
+        msg_type, msg_len, err_len, bs_len, int_info = iRODSMessage._recv_header(sock)
 
         # message = sock.recv(msg_len, socket.MSG_WAITALL) if msg_len != 0 else
         # None
@@ -355,7 +430,8 @@ class iRODSMessage:
         # error = sock.recv(err_len, socket.MSG_WAITALL) if err_len != 0 else
         # None
         error = _recv_message_in_len(sock, err_len) if err_len != 0 else None
-        # bs = sock.recv(bs_len, socket.MSG_WAITALL) if bs_len != 0 else None
+        # The (possibly large) byte stream is received whole, or else into a buffer of the
+        # full size, rather than in pieces to be joined.
         bs = _recv_message_in_len(sock, bs_len) if bs_len != 0 else None
 
         # if message:
@@ -365,16 +441,7 @@ class iRODSMessage:
 
     @staticmethod
     def recv_into(sock, buffer):
-        rsp_header_size = _recv_message_in_len(sock, 4)
-        rsp_header_size = struct.unpack(">i", rsp_header_size)[0]
-        rsp_header = _recv_message_in_len(sock, rsp_header_size)
-
-        xml_root = ET().fromstring(rsp_header)
-        msg_type = xml_root.find("type").text
-        msg_len = int(xml_root.find("msgLen").text)
-        err_len = int(xml_root.find("errorLen").text)
-        bs_len = int(xml_root.find("bsLen").text)
-        int_info = int(xml_root.find("intInfo").text)
+        msg_type, msg_len, err_len, bs_len, int_info = iRODSMessage._recv_header(sock)
 
         message = _recv_message_in_len(sock, msg_len) if msg_len != 0 else None
         error = _recv_message_in_len(sock, err_len) if err_len != 0 else None
@@ -389,27 +456,29 @@ class iRODSMessage:
         else:
             return my_str
 
+    _pack_length = struct.Struct(">i").pack
+
     @staticmethod
     def pack_header(type, msg_len, err_len, bs_len, int_info):
-        msg_header = (
-            "<MsgHeader_PI>"
-            "<type>{}</type>"
-            "<msgLen>{}</msgLen>"
-            "<errorLen>{}</errorLen>"
-            "<bsLen>{}</bsLen>"
-            "<intInfo>{}</intInfo>"
-            "</MsgHeader_PI>"
-        ).format(type, msg_len, err_len, bs_len, int_info)
-
-        # encode if needed
-        msg_header = iRODSMessage.encode_unicode(msg_header)
+        if isinstance(type, str):
+            type = type.encode("utf-8")
+        msg_header = iRODSMessage._HEADER_TEMPLATE % (
+            type,
+            msg_len,
+            err_len,
+            bs_len,
+            int_info,
+        )
 
-        # pack length
-        msg_header_length = struct.pack(">i", len(msg_header))
+        # prefix with the packed length
+        return iRODSMessage._pack_length(len(msg_header)) + msg_header
 
-        return msg_header_length + msg_header
+    def pack_parts(self):
+        """Return the packed header, main message, error and byte stream as a list of buffers.
 
-    def pack(self):
+        The byte stream is included as given (for instance, as a memoryview) rather than copied,
+        so that the parts can be sent using scatter-gather I/O.
+        """
         # pack main message and endcode if needed
         if self.msg:
             main_msg = self.encode_unicode(self.msg.pack())
@@ -419,13 +488,18 @@ class iRODSMessage:
         # encode message parts if needed
         self.error = self.encode_unicode(self.error)
         self.bs = self.encode_unicode(self.bs)
+        if isinstance(self.bs, memoryview):
+            self.bs = self.bs.cast("B") if self.bs.c_contiguous else self.bs.tobytes()
 
         # pack header
         packed_header = self.pack_header(
             self.msg_type, len(main_msg), len(self.error), len(self.bs), self.int_info
         )
 
-        return packed_header + main_msg + self.error + self.bs
+        return [packed_header, main_msg, self.error, self.bs]
+
+    def pack(self):
+        return b"".join(self.pack_parts())
 
     def get_main_message(self, cls, r_error=None):
         msg = cls()
@@ -753,6 +827,32 @@ class FileSeekResponse(Message):
     offset = LongProperty()
 
 
+# define PortList_PI "int portNum; int cookie; int sock; int windowSize; str
+# hostAddr[LONG_NAME_LEN];"
+
+
+class PortList(Message):
+    _name = "PortList_PI"
+    portNum = IntegerProperty()
+    cookie = IntegerProperty()
+    sock = IntegerProperty()
+    windowSize = IntegerProperty()
+    hostAddr = StringProperty()
+
+
+# define PortalOprOut_PI "int status; int l1descInx; int numThreads; str
+# chksum[NAME_LEN]; struct PortList_PI;"
+
+
+class PortalOprOut(Message):
+    _name = "PortalOprOut_PI"
+    status = IntegerProperty()
+    l1descInx = IntegerProperty()
+    numThreads = IntegerProperty()
+    chksum = StringProperty()
+    PortList_PI = SubmessageProperty(PortList)
+
+
 # define DataObjCopyInp_PI "struct DataObjInp_PI; struct DataObjInp_PI;"
 
 
@@ -848,6 +948,19 @@ class CollectionRequest(Message):
     KeyValPair_PI = SubmessageProperty(StringStringMap)
 
 
+# define StructFileExtAndRegInp_PI "str objPath[MAX_NAME_LEN]; str
+# collection[MAX_NAME_LEN]; int oprType; int flags; struct KeyValPair_PI;"
+
+
+class StructFileExtAndRegRequest(Message):
+    _name = "StructFileExtAndRegInp_PI"
+    objPath = StringProperty()
+    collection = StringProperty()
+    oprType = IntegerProperty()
+    flags = IntegerProperty()
+    KeyValPair_PI = SubmessageProperty(StringStringMap)
+
+
 # define Version_PI "int status; str relVersion[NAME_LEN]; str
 # apiVersion[NAME_LEN]; int reconnPort; str reconnAddr[LONG_NAME_LEN]; int
 # cookie;"
@@ -8,6 +8,14 @@ class MessageMetaclass(OrderedMetaclass):
         super(MessageMetaclass, self).__init__(name, bases, attys)
         for name, prop in self._ordered_properties:
             prop.dub(name)
+        # Specialize each property's packing and unpacking once per class, rather than
+        # dispatching through the generic MessageProperty methods for every message.
+        self._packers = [
+            (name, prop.packer()) for name, prop in self._ordered_properties
+        ]
+        self._unpackers = [
+            (name, prop.unpacker()) for name, prop in self._ordered_properties
+        ]
 
 
 class Message(OrderedClass, metaclass=MessageMetaclass):
@@ -20,14 +28,18 @@ class Message(OrderedClass, metaclass=MessageMetaclass):
                 self._values[name] = kwargs[name]
 
     def pack(self):
-        values = []
-        values.append("<%s>" % self.__class__._name)
-        for name, prop in self._ordered_properties:
-            if name in self._values:
-                values.append(prop.pack(self._values[name]))
-        values.append("</%s>" % self.__class__._name)
-        return "".join(values)
+        values = self._values
+        _name = self.__class__._name
+        return "<%s>%s</%s>" % (
+            _name,
+            "".join(
+                [pack(values[name]) for name, pack in self._packers if name in values]
+            ),
+            _name,
+        )
 
     def unpack(self, root):
-        for name, prop in self._ordered_properties:
-            self._values[name] = prop.unpack(root.findall(name))
+        findall = root.findall
+        values = self._values
+        for name, unpack in self._unpackers:
+            values[name] = unpack(findall(name))
@@ -32,17 +32,37 @@ class MessageProperty(OrderedProperty):
             return self.parse(el.text)
         return None
 
+    # The following return functions equivalent to pack(), unpack() and the unpacking of a
+    # single element; the message classes build them once, when the class is defined.
 
-class IntegerProperty(MessageProperty):
+    def packer(self):
+        if type(self).pack is not MessageProperty.pack:
+            return self.pack
+        open_tag, close_tag, format = "<%s>" % self.name, "</%s>" % self.name, self.format
 
-    def format(self, value):
-        return str(value)
+        def pack(value):
+            my_value = format(value)
+            if isinstance(my_value, bytes):
+                my_value = my_value.decode("utf-8")
+            return open_tag + my_value + close_tag
 
-    def parse(self, value):
-        return int(value)
+        return pack
 
+    def element_parser(self):
+        if type(self).unpack is not MessageProperty.unpack:
+            return lambda el: self.unpack([el])
+        parse = self.parse
+        return lambda el: parse(el.text)
 
-class LongProperty(MessageProperty):
+    def unpacker(self):
+        if type(self).unpack is not MessageProperty.unpack:
+            return self.unpack
+        parse = self.parse
+        return lambda els: parse(els[0].text) if els else None
+
+
+class _IntegralProperty(MessageProperty):
+    """The formatting, parsing and packing shared by the integer-valued properties."""
 
     def format(self, value):
         return str(value)
@@ -50,6 +70,24 @@ class LongProperty(MessageProperty):
     def parse(self, value):
         return int(value)
 
+    def packer(self):
+        open_tag, close_tag = "<%s>" % self.name, "</%s>" % self.name
+        return lambda value: open_tag + str(value) + close_tag
+
+    def element_parser(self):
+        return lambda el: int(el.text)
+
+    def unpacker(self):
+        return lambda els: int(els[0].text) if els else None
+
+
+class IntegerProperty(_IntegralProperty):
+    pass
+
+
+class LongProperty(_IntegralProperty):
+    pass
+
 
 class BinaryProperty(MessageProperty):
 
@@ -90,6 +128,22 @@ class StringProperty(MessageProperty):
     def parse(self, value):
         return value
 
+    def packer(self):
+        open_tag, close_tag, format = "<%s>" % self.name, "</%s>" % self.name, self.format
+
+        def pack(value):
+            if type(value) is str:
+                return open_tag + self.escape_xml_string(value) + close_tag
+            return open_tag + format(value) + close_tag
+
+        return pack
+
+    def element_parser(self):
+        return lambda el: el.text
+
+    def unpacker(self):
+        return lambda els: els[0].text if els else None
+
 
 class ArrayProperty(MessageProperty):
 
@@ -104,6 +158,14 @@ class ArrayProperty(MessageProperty):
     def unpack(self, els):
         return [self.prop.unpack([el]) for el in els]
 
+    def packer(self):
+        pack = self.prop.dub(self.name).packer()
+        return lambda values: "".join([pack(v) for v in values])
+
+    def unpacker(self):
+        parse_element = self.prop.element_parser()
+        return lambda els: [parse_element(el) for el in els]
+
 
 class SubmessageProperty(MessageProperty):
 
@@ -121,3 +183,18 @@ class SubmessageProperty(MessageProperty):
             msg.unpack(el)
             return msg
         return None
+
+    def packer(self):
+        return lambda value: value.pack()
+
+    def element_parser(self):
+        def parse_element(el):
+            msg = self.message_cls()
+            msg.unpack(el)
+            return msg
+
+        return parse_element
+
+    def unpacker(self):
+        parse_element = self.element_parser()
+        return lambda els: parse_element(els[0]) if els else None
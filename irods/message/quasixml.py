@@ -2,6 +2,8 @@
 # The interface aims to be compatible with xml.etree.ElementTree,
 # at least for the features used by python-irodsclient.
 
+import re
+
 
 class Element:
     """
@@ -85,95 +87,109 @@ class QuasiXmlParseError(Exception):
     """Indicates parse failure of XML protocol data."""
 
 
-def tokenize(s):
-    """Parse an XML-ish string into a list of tokens."""
-    tokens = []
+# Whitespace as understood by bytes.lstrip().
+_whitespace = re.compile(rb"[ \t\n\r\x0b\x0c]*")
+
+_OPEN, _CLOSE, _CDATA = range(3)
+
+
+def _scan(s):
+    """Generate (kind, text) pairs for the tags and character data in `s'.
 
-    # Consume input until empty.
+    The scan proceeds by index, without copying the remainder of the input for each token.
+    Whitespace is skipped before an opening tag and after a closing tag, as well as at the
+    end of the input; otherwise it belongs to the character data.
+    """
+    find = s.find
+    skip_whitespace = _whitespace.match
+    size = len(s)
+    i = 0
+    nextclose = find(b"</")
     while True:
-        nextclose = s.find(b"</")
-        nextopen = s.find(b"<")
+        if nextclose != -1 and nextclose < i:
+            nextclose = find(b"</", i)
+        nextopen = find(b"<", i)
         if nextopen < nextclose or nextopen == -1:
             # Either we have no tags left, or we are in a non-cdata element body: strip whitespace.
-            s = s.lstrip()
+            i = skip_whitespace(s, i).end()
 
-        if len(s) == 0:
-            return tokens
+        if i == size:
+            return
 
-            # Closing tag?
-        elif s.startswith(b"</"):
-            try:
-                name, s = s[2:].split(b">", 1)
-            except Exception:
+        if s.startswith(b"</", i):
+            # Closing tag.
+            end = find(b">", i + 2)
+            if end == -1:
                 raise QuasiXmlParseError("protocol error: unterminated close tag")
-            tokens.append(TokenTagClose(name))
-            s = s.lstrip()  # consume space after closing tag
-
-            # Opening tag?
-        elif s.startswith(b"<"):
-            try:
-                name, s = s[1:].split(b">", 1)
-            except Exception:
+            yield _CLOSE, s[i + 2 : end]
+            i = skip_whitespace(s, end + 1).end()  # consume space after closing tag
+
+        elif s.startswith(b"<", i):
+            # Opening tag.
+            end = find(b">", i + 1)
+            if end == -1:
                 raise QuasiXmlParseError("protocol error: unterminated open tag")
-            tokens.append(TokenTagOpen(name))
+            yield _OPEN, s[i + 1 : end]
+            i = end + 1
 
         else:
-            # capture cdata till next tag.
-            try:
-                cdata, s = s.split(b"<", 1)
-            except Exception:
+            # Capture cdata till next tag.
+            if nextopen == -1:
                 raise QuasiXmlParseError("protocol error: unterminated cdata")
-            s = b"<" + s
-            tokens.append(TokenCData(cdata))
-
+            yield _CDATA, s[i:nextopen]
+            i = nextopen
 
-def fromtokens(tokens):
-    """Parse XML-ish tokens into an Element."""
 
-    def parse_elem(tokens):
-        """Parse some tokens into one Element, and return unconsumed tokens."""
-        topen, tokens = tokens[0], tokens[1:]
-        if type(topen) is not TokenTagOpen:
+def tokenize(s):
+    """Parse an XML-ish string into a list of tokens."""
+    token_types = {_OPEN: TokenTagOpen, _CLOSE: TokenTagClose, _CDATA: TokenCData}
+    return [token_types[kind](text) for kind, text in _scan(s)]
+
+
+def _build(items):
+    """Assemble an Element from (kind, text) pairs, as generated by _scan."""
+    stack = []  # [name, children, cdata] for each element still open
+    root = None
+    for kind, text in items:
+        if root is not None:
+            raise QuasiXmlParseError("protocol error: trailing data")
+        if kind == _OPEN:
+            stack.append([text, [], None])
+        elif not stack:
             raise QuasiXmlParseError(
                 "protocol error: data does not start with open tag"
             )
-
-        children = []
-        cdata = None
-
-        while len(tokens) > 0:
-            t, tokens = tokens[0], tokens[1:]
-            if type(t) is TokenTagOpen:
-                # Slurp a sub-element.
-                el, tokens = parse_elem([t] + tokens)
-                children.append(el)
-                # Continue with non-consumed tokens.
-            elif type(t) == TokenTagClose:
-                if t.text != topen.text:
-                    raise QuasiXmlParseError(
-                        "protocol error: close tag <{}> does not match opening tag <{}>".format(
-                            t.text, topen.text
-                        )
-                    )
-                elif cdata is not None and len(children):
-                    raise QuasiXmlParseError(
-                        "protocol error: mixed cdata and child elements"
+        elif kind == _CDATA:
+            stack[-1][2] = text
+        else:
+            name, children, cdata = stack.pop()
+            if text != name:
+                raise QuasiXmlParseError(
+                    "protocol error: close tag <{}> does not match opening tag <{}>".format(
+                        text, name
                     )
-                return (
-                    Element(
-                        topen.text.decode("utf-8"),
-                        cdata.decode("utf-8") if cdata is not None else children,
-                    ),
-                    tokens,
                 )
+            elif cdata is not None and len(children):
+                raise QuasiXmlParseError(
+                    "protocol error: mixed cdata and child elements"
+                )
+            el = Element(
+                name.decode("utf-8"),
+                cdata.decode("utf-8") if cdata is not None else children,
+            )
+            if stack:
+                stack[-1][1].append(el)
             else:
-                cdata = t.text
+                root = el
+    if root is None:
+        raise QuasiXmlParseError("protocol error: unterminated element")
+    return root
 
-    elem, rest = parse_elem(tokens)
-    if rest != []:
-        raise QuasiXmlParseError("protocol error: trailing data")
 
-    return elem
+def fromtokens(tokens):
+    """Parse XML-ish tokens into an Element."""
+    kinds = {TokenTagOpen: _OPEN, TokenTagClose: _CLOSE, TokenCData: _CDATA}
+    return _build((kinds[type(t)], t.text) for t in tokens)
 
 
 try:
@@ -188,7 +204,7 @@ def fromstring(s):
     if type(s) is not bytes:
         raise TypeError("expected a bytes-object, got {}".format(type(s).__name__))
 
-    return fromtokens(tokenize(s))
+    return _build(_scan(s))
 
 
 def encode_entities(s):
@@ -200,6 +216,9 @@ def encode_entities(s):
 
 
 def decode_entities(s):
+    if "&" not in s:
+        return s
+
     from . import XML_entities_active
 
     rev = list(XML_entities_active())
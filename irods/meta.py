@@ -84,6 +84,7 @@ class AVUOperation(dict):
             setattr(self, atr, locals()[atr])
 
 
+import contextlib
 import copy
 
 
@@ -91,18 +92,129 @@ class iRODSMetaCollection:
 
     def __call__(self, admin=False, timestamps=False, **opts):
         x = copy.copy(self)
+        x._pending = None
         x._manager = (x._manager)(admin, timestamps, **opts)
         x._reset_metadata()
         return x
 
-    def __init__(self, manager, model_cls, path):
+    _pending = None  # The AVUOperations accumulated by batch(), while in that context.
+
+    def __init__(self, manager, model_cls, path, avus=None):
+        """
+        The metadata are read from the catalog when first needed, unless
+        `avus' (a list of iRODSMeta) is given as the metadata of the entity.
+        """
         self._manager = manager
         self._model_cls = model_cls
         self._path = path
-        self._reset_metadata()
+        self._avus = None if avus is None else list(avus)
+
+    @property
+    def _meta(self):
+        # The local view of the metadata, (re-)read if not loaded yet or made stale.
+        if self._avus is None:
+            avus = self._manager.get(self._model_cls, self._path)
+            # Show any changes batched before the read.
+            self._avus = self._applied(avus, self._pending or ())
+        return self._avus
+
+    @_meta.setter
+    def _meta(self, avus):
+        self._avus = avus
+
+    @property
+    def stale(self):
+        """
+        True if the metadata are to be read from the catalog when next
+        needed: they have not been read yet, or have since been changed.
+        """
+        return self._avus is None
 
     def _reset_metadata(self):
-        self._meta = self._manager.get(self._model_cls, self._path)
+        """Mark the local view stale, so that it is re-read when next needed."""
+        if self._pending is not None:
+            return  # The local view shows the batched changes until they are applied.
+        self._avus = None
+
+    @contextlib.contextmanager
+    def batch(self, refresh=True, chunk_size=None):
+        """
+        Accumulate the changes made within the context, and apply them
+        together on leaving it.
+
+        Within the context, add(), set(), remove(), remove_all(),
+        apply_atomic_operations() and the assignment or deletion of keys
+        send nothing to the server.  They are recorded as AVUOperations,
+        and the local view (items(), get_all(), etc.) is updated to match.
+        On leaving the context, the operations are sent in one atomic
+        metadata call, or in calls of at most `chunk_size' operations (by
+        default, the metadata.atomic_operations_chunk_size setting), each
+        atomic in itself.  The metadata are then re-read (once, when next
+        needed) unless `refresh' is False, in which case the local view is
+        kept (lacking the AVU ids and timestamps of the AVUs added).  Adds
+        and removes need no read of the metadata; the local view is only
+        updated if it has been read.
+
+        If the context is left by an exception, nothing is sent and the
+        local view is restored.  Options such as admin are taken from the
+        collection, as in obj.metadata(admin=True).batch(), rather than
+        from the calls within the context.
+        """
+        if self._pending is not None:
+            raise RuntimeError("A metadata batch is already in progress.")
+        saved_avus = self._avus
+        self._pending = []
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            self._avus = saved_avus
+            raise
+        avu_ops, self._pending = self._pending, None
+        if not avu_ops:
+            return
+        if chunk_size is None:
+            import irods.client_configuration as cfg
+
+            chunk_size = cfg.metadata.atomic_operations_chunk_size
+        if chunk_size < 1:
+            chunk_size = len(avu_ops)
+        try:
+            for i in range(0, len(avu_ops), chunk_size):
+                self._manager.apply_atomic_operations(
+                    self._model_cls, self._path, *avu_ops[i : i + chunk_size]
+                )
+        except BaseException:
+            # Earlier chunks may have been applied.
+            self._reset_metadata()
+            raise
+        if refresh:
+            self._reset_metadata()
+
+    def _batch(self, avu_ops, opts):
+        """Record AVUOperations in the batch in progress, applying them to the local view."""
+        if opts:
+            raise ValueError(
+                "Keyword options {} cannot be given within a metadata batch.".format(
+                    sorted(opts)
+                )
+            )
+        self._pending.extend(avu_ops)
+        if self._avus is not None:
+            self._avus = self._applied(self._avus, avu_ops)
+
+    @staticmethod
+    def _applied(avus, avu_ops):
+        """Return a copy of the list `avus' with AVUOperations applied to it."""
+        avus = list(avus)
+        for avu_op in avu_ops:
+            avu = avu_op.avu
+            if avu_op.operation == "add":
+                if avu not in avus:
+                    avus.append(iRODSMeta(avu.name, avu.value, avu.units))
+            else:
+                avus = [m for m in avus if m != avu]
+        return avus
 
     def get_all(self, key):
         """
@@ -132,6 +244,9 @@ class iRODSMetaCollection:
         return args[0] if len(args) == 1 else iRODSMeta(*args)
 
     def apply_atomic_operations(self, *avu_ops):
+        if self._pending is not None:
+            self._batch(avu_ops, {})
+            return
         self._manager.apply_atomic_operations(self._model_cls, self._path, *avu_ops)
         self._reset_metadata()
 
@@ -140,6 +255,14 @@ class iRODSMetaCollection:
         Set as iRODSMeta to a key
         """
         meta = self._get_meta(*args)
+        if self._pending is not None:
+            # As "imeta set" does, replace the AVUs (in the local view) having this name.
+            self._batch(
+                [AVUOperation("remove", m) for m in self.get_all(meta.name)]
+                + [AVUOperation("add", meta)],
+                opts,
+            )
+            return
         self._manager.set(self._model_cls, self._path, meta, **opts)
         self._reset_metadata()
 
@@ -148,6 +271,9 @@ class iRODSMetaCollection:
         Add as iRODSMeta to a key
         """
         meta = self._get_meta(*args)
+        if self._pending is not None:
+            self._batch([AVUOperation("add", meta)], opts)
+            return
         self._manager.add(self._model_cls, self._path, meta, **opts)
         self._reset_metadata()
 
@@ -156,6 +282,9 @@ class iRODSMetaCollection:
         Removes an iRODSMeta
         """
         meta = self._get_meta(*args)
+        if self._pending is not None:
+            self._batch([AVUOperation("remove", meta)], opts)
+            return
         self._manager.remove(self._model_cls, self._path, meta, **opts)
         self._reset_metadata()
 
@@ -193,8 +322,12 @@ class iRODSMetaCollection:
         self.add(meta)
 
     def _delete_all_values(self, key):
+        if self._pending is not None:
+            self._batch([AVUOperation("remove", m) for m in self.get_all(key)], {})
+            return
         for meta in self.get_all(key):
-            self.remove(meta)
+            self._manager.remove(self._model_cls, self._path, meta)
+        self._reset_metadata()
 
     def __delitem__(self, key):
         """
@@ -203,7 +336,6 @@ class iRODSMetaCollection:
         if not isinstance(key, str):
             raise TypeError
         self._delete_all_values(key)
-        self._reset_metadata()
 
     def __contains__(self, key):
         if not isinstance(key, str):
@@ -212,6 +344,9 @@ class iRODSMetaCollection:
         return len(values) > 0
 
     def remove_all(self, **opts):
+        if self._pending is not None:
+            self._batch([AVUOperation("remove", m) for m in self._meta], opts)
+            return
         for meta in self._meta:
             self._manager.remove(self._model_cls, self._path, meta, **opts)
         self._reset_metadata()
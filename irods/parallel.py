@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import os
+import json
 import ssl
 import time
 import sys
@@ -11,7 +12,7 @@ import threading
 import multiprocessing
 
 from irods.data_object import iRODSDataObject
-from irods.exception import DataObjectDoesNotExist
+from irods.exception import DataObjectDoesNotExist, iRODSException
 import irods.keywords as kw
 from queue import Queue, Full, Empty
 
@@ -226,8 +227,12 @@ def _io_send_bytes_progress(queueObject, item):
 
 COPY_BUF_SIZE = (1024**2) * 4
 
+# Parallel transfers split the data object into chunks of (at most) this many bytes, which the
+# transfer threads take from a shared queue until none remain.
+DEFAULT_CHUNK_SIZE = (1024**2) * 16
 
-def _copy_part(src, dst, length, queueObject, debug_info, mgr, updatables=()):
+
+def _copy_bytes(src, dst, length, queueObject, debug_info, updatables=()):
     """
     The work-horse for performing the copy between file and data object.
 
@@ -252,14 +257,14 @@ def _copy_part(src, dst, length, queueObject, debug_info, mgr, updatables=()):
         if verboseConnection:
             print("(" + debug_info + ")", end="", file=sys.stderr)
             sys.stderr.flush()
+    return bytecount
+
 
-    # In a put or get, exactly one of (src,dst) is a file. Find which and close that one first.
-    (file_, obj_) = (src, dst) if dst in mgr else (dst, src)
+def _close_part(file_, obj_, mgr):
     file_.close()
     mgr.remove_io(obj_)  # 1. closes obj if it is not the mgr's initial descriptor
     # 2. blocks at barrier until all transfer threads are done copying
     # 3. closes with finalize if obj is mgr's initial descriptor
-    return bytecount
 
 
 class _Multipart_close_manager:
@@ -273,9 +278,10 @@ class _Multipart_close_manager:
 
     """
 
-    def __init__(self, initial_io_, exit_barrier_):
+    def __init__(self, initial_io_, exit_barrier_, journal=None):
         self.exit_barrier = exit_barrier_
         self.initial_io = initial_io_
+        self.journal = journal
         self.__lock = threading.Lock()
         self.aux = []
 
@@ -307,13 +313,25 @@ class _Multipart_close_manager:
         if is_initial:
             self.finalize()
 
+    # `abort' is for a part of the transfer that has failed, or was never started. The other
+    # threads are released from the exit barrier, and no finalizing close takes place.
+
+    def abort(self, Io=None):
+        with self.__lock:
+            if Io is not None and Io in self.aux:
+                self.aux.remove(Io)
+                Io.close()
+        self.exit_barrier.abort()
+
     def finalize(self):
         self.initial_io.close()
+        if self.journal is not None:
+            self.journal.remove()
 
 
 def _io_part(
     objHandle,
-    range_,
+    chunks_,
     file_,
     opr_,
     mgr_,
@@ -322,28 +340,253 @@ def _io_part(
     updatables=None,
 ):
     """
-    Runs in a separate thread to manage the transfer of a range of bytes within the data object.
+    Runs in a separate thread to transfer byte ranges of the data object.
 
-    The particular range is defined by the end of the range_ parameter, which should be of type
-    (Py2) xrange or (Py3) range.
+    Ranges (of type range) are taken from the chunks_ queue, which is shared with the other threads
+    of the transfer, until it is empty; so faster streams end up transferring more of the data.  The
+    data object and file handles are then closed as for any part of a multipart transfer.
     """
-    if 0 == len(range_):
-        return 0
     Operation = Oper(opr_)
-    (offset, length) = (range_[0], len(range_))
-    objHandle.seek(offset)
-    file_.seek(offset)
+    (src, dst) = (file_, objHandle) if Operation.isPut() else (objHandle, file_)
     if thread_debug_id == "":  # for more succinct thread identifiers while debugging.
         thread_debug_id = str(threading.currentThread().ident)
-    return (
-        _copy_part(
-            file_, objHandle, length, queueObject, thread_debug_id, mgr_, updatables
-        )
-        if Operation.isPut()
-        else _copy_part(
-            objHandle, file_, length, queueObject, thread_debug_id, mgr_, updatables
+    bytecount = 0
+    try:
+        while not mgr_.exit_barrier.broken:
+            try:
+                range_ = chunks_.get_nowait()
+            except Empty:
+                break
+            if 0 == len(range_):
+                continue
+            objHandle.seek(range_[0])
+            file_.seek(range_[0])
+            n = _copy_bytes(
+                src, dst, len(range_), queueObject, thread_debug_id, updatables
+            )
+            bytecount += n
+            if mgr_.journal is not None:
+                dst.flush()
+                mgr_.journal.record(range_[0], range_[0] + n)
+    except BaseException:
+        # Release the other threads of the transfer from the exit barrier, without a finalizing close.
+        try:
+            file_.close()
+        finally:
+            mgr_.abort(objHandle)
+        raise
+    _close_part(file_, objHandle, mgr_)
+    return bytecount
+
+
+def _chunk_queue(total_size, chunk_size, spans=None):
+    """Return a Queue of the consecutive byte ranges, each of length at most chunk_size, spanning total_size bytes.
+
+    If given, `spans' is a list of (start, stop) tuples restricting the ranges to those parts of the data.
+    """
+    if spans is None:
+        spans = [(0, total_size)]
+    chunks_ = Queue()
+    for start, stop in spans:
+        for offset in range(start, stop, chunk_size):
+            chunks_.put(range(offset, min(offset + chunk_size, stop)))
+    if chunks_.empty():
+        chunks_.put(range(0, 0))
+    return chunks_
+
+
+def _merge_spans(spans):
+    merged = []
+    for start, stop in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(stop, merged[-1][1]))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+JOURNAL_SUFFIX = ".irods_journal"
+
+
+def journal_path(resume, local_path):
+    """Return the path of the checkpoint journal for a transfer to or from local_path, or None if not resuming.
+
+    `resume' may be True, for a journal alongside the local file, or the path of the journal itself.
+    """
+    if not resume:
+        return None
+    if isinstance(resume, str):
+        return resume
+    return local_path + JOURNAL_SUFFIX
+
+
+class TransferJournal:
+    """A small local file recording the byte ranges completed by a parallel PUT or GET.
+
+    The journal also holds the replica token and resource hierarchy of the replica being written, and an
+    identity for the transfer (the paths, plus the size and modification time of the source), so that an
+    interrupted transfer can later be resumed by transferring only the ranges not yet recorded.  Ranges are
+    recorded only after they have been flushed to the destination, and the file is rewritten atomically.
+    """
+
+    def __init__(self, path, identity):
+        self.path = path
+        self.identity = identity
+        self.replica_token = self.resc_hier = None
+        self.completed = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Read the journal. Return True if it exists and was written for a transfer of the same identity."""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable transfer journal %r: %r", self.path, exc)
+            return False
+        if state.get("identity") != self.identity:
+            logger.info("Transfer journal %r is for a different transfer; ignoring it.", self.path)
+            return False
+        self.replica_token = state.get("replica_token")
+        self.resc_hier = state.get("resc_hier")
+        self.completed = _merge_spans(tuple(span) for span in state.get("completed", ()))
+        return True
+
+    def start(self, replica_token, resc_hier):
+        """Begin a new journal for the replica having the given token and hierarchy."""
+        with self._lock:
+            self.replica_token = replica_token
+            self.resc_hier = resc_hier
+            self.completed = []
+            self._save()
+
+    def record(self, start, stop):
+        """Record the byte range [start, stop) as transferred."""
+        if stop <= start:
+            return
+        with self._lock:
+            self.completed = _merge_spans(self.completed + [(start, stop)])
+            self._save()
+
+    def missing(self, total_size):
+        """Return the (start, stop) spans of the first total_size bytes not yet recorded as transferred."""
+        spans = []
+        offset = 0
+        for start, stop in self.completed:
+            if start > offset:
+                spans.append((offset, min(start, total_size)))
+            offset = max(offset, stop)
+            if offset >= total_size:
+                break
+        if offset < total_size:
+            spans.append((offset, total_size))
+        return [span for span in spans if span[1] > span[0]]
+
+    def _save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "identity": self.identity,
+                    "replica_token": self.replica_token,
+                    "resc_hier": self.resc_hier,
+                    "completed": [list(span) for span in self.completed],
+                },
+                f,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def remove(self):
+        """Delete the journal, as when the transfer it records has been completed and finalized."""
+        with self._lock:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.path)
+
+
+class _TransferExecutor:
+    """A long-lived pool of worker threads, shared by all parallel PUTs and GETs in the process.
+
+    The threads of a transfer synchronize on a Barrier before the final close, so all of a transfer's
+    parts must run at the same time. For that reason a transfer reserves its worker slots all at once
+    (see reserve), in first-come-first-served order, before submitting any of its parts; this bounds
+    the total concurrency across simultaneous transfers without the risk of deadlock.
+    """
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="irods_transfer"
         )
-    )
+        self._cond = threading.Condition()
+        self._free = max_workers
+        self._next_ticket = 0
+        self._now_serving = 0
+
+    def reserve(self, n):
+        """Block until `n' worker slots (at most max_workers) are free, then claim them.
+
+        Returns the number of slots claimed. Each claimed slot is released when a task submitted via
+        submit() completes; any slots left unused must be given back with release().
+        """
+        n = max(1, min(n, self.max_workers))
+        with self._cond:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._cond.wait_for(
+                lambda: ticket == self._now_serving and self._free >= n
+            )
+            self._free -= n
+            self._now_serving += 1
+            self._cond.notify_all()
+        return n
+
+    def release(self, n=1):
+        """Give back `n' worker slots claimed by reserve() for which no task was submitted."""
+        with self._cond:
+            self._free += n
+            self._cond.notify_all()
+
+    def _task_done(self, _future):
+        self.release()
+
+    def submit(self, fn, *args, **kwargs):
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._task_done)
+        return future
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+
+_transfer_executor = None
+_transfer_executor_lock = threading.Lock()
+
+
+def transfer_thread_pool_size():
+    """The number of worker threads to be shared among parallel transfers, per the client configuration."""
+    import irods.client_configuration as cfg
+
+    size = cfg.data_objects.transfer_thread_pool_size
+    if size < 1:
+        size = min(32, multiprocessing.cpu_count() + 4)
+    return max(size, 1)
+
+
+def transfer_executor():
+    """Return the process-wide _TransferExecutor, (re-)creating it if its configured size has changed."""
+    global _transfer_executor
+    size = transfer_thread_pool_size()
+    with _transfer_executor_lock:
+        if _transfer_executor is None or _transfer_executor.max_workers != size:
+            if _transfer_executor is not None:
+                # Threads already running transfers are allowed to finish.
+                _transfer_executor.shutdown(wait=False)
+            _transfer_executor = _TransferExecutor(size)
+        return _transfer_executor
 
 
 def _io_multipart_threaded(
@@ -359,30 +602,34 @@ def _io_multipart_threaded(
 ):
     """Called by _io_main.
 
-    Carve up (0,total_size) range into `num_threads` parts and initiate a transfer thread for each one.
+    Divide the (0,total_size) range into chunks and initiate `num_threads' transfer threads to
+    work through them.
     """
     (Data_object, Io) = dataObj_and_IO
     Operation = Oper(operation_)
 
-    def bytes_range_for_thread(i, num_threads, total_bytes, chunk):
-        begin_offs = i * chunk
-        if i + 1 < num_threads:
-            end_offs = (i + 1) * chunk
-        else:
-            end_offs = total_bytes
-        return range(begin_offs, end_offs)
-
-    bytes_per_thread = total_size // num_threads
+    chunk_size = max(1, extra_options.get("chunk_size") or DEFAULT_CHUNK_SIZE)
+    chunks_ = _chunk_queue(total_size, chunk_size, extra_options.get("spans"))
+    journal = extra_options.get("journal")
+    resuming = journal is not None and bool(journal.completed)
 
-    ranges = [
-        bytes_range_for_thread(i, num_threads, total_size, bytes_per_thread)
-        for i in range(num_threads)
-    ]
+    # All parts of the transfer must be able to run at once in the shared pool of worker threads.
+    executor = transfer_executor()
+    num_threads = min(num_threads, executor.max_workers, chunks_.qsize())
+    # Each part after the first holds a connection of its own, in addition to that of `Io'.
+    free = session.pool.free_capacity()
+    if free is not None:
+        num_threads = max(1, min(num_threads, 1 + free))
 
     logger.info(
-        "num_threads = %s ; bytes_per_thread = %s", num_threads, bytes_per_thread
+        "num_threads = %s ; chunk_size = %s ; num_chunks = %s",
+        num_threads,
+        chunk_size,
+        chunks_.qsize(),
     )
 
+    expected_bytes = sum(len(range_) for range_ in chunks_.queue)
+
     queueLength = extra_options.get("queueLength", 0)
     if queueLength > 0:
         queueObject = Queue(queueLength)
@@ -390,12 +637,12 @@ def _io_multipart_threaded(
         queueObject = None
 
     futures = []
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
-    num_threads = min(num_threads, len(ranges))
-    mgr = _Multipart_close_manager(Io, Barrier(num_threads))
+    reserved = executor.reserve(num_threads)
+    mgr = _Multipart_close_manager(Io, Barrier(num_threads), journal=journal)
     counter = 1
+    # When resuming a GET, the ranges already written to the local file must not be truncated away.
     gen_file_handle = lambda: open(
-        fname, Operation.disk_file_mode(initial_open=(counter == 1))
+        fname, Operation.disk_file_mode(initial_open=(counter == 1 and not resuming))
     )
     File = gen_file_handle()
 
@@ -404,39 +651,52 @@ def _io_multipart_threaded(
         "queueObject": queueObject,
     }
 
-    for byte_range in ranges:
-        if Io is None:
-            Io = session.data_objects.open(
-                Data_object.path,
-                Operation.data_object_mode(initial_open=False),
-                create=False,
-                finalize_on_close=False,
-                allow_redirect=False,
-                **{
-                    kw.NUM_THREADS_KW: str(num_threads),
-                    kw.DATA_SIZE_KW: str(total_size),
-                    kw.RESC_HIER_STR_KW: hier_str,
-                    kw.REPLICA_TOKEN_KW: replica_token,
-                }
-            )
-        mgr.add_io(Io)
-        logger.debug("target_host = %s", Io.raw.session.pool.account.host)
-        if File is None:
-            File = gen_file_handle()
-        futures.append(
-            executor.submit(
-                _io_part,
-                Io,
-                byte_range,
-                File,
-                Operation,
-                mgr,
-                thread_debug_id=str(counter),
-                **thread_opts
+    try:
+        for _ in range(num_threads):
+            if Io is None:
+                Io = session.data_objects.open(
+                    Data_object.path,
+                    Operation.data_object_mode(initial_open=False),
+                    create=False,
+                    finalize_on_close=False,
+                    allow_redirect=False,
+                    **{
+                        kw.NUM_THREADS_KW: str(num_threads),
+                        kw.DATA_SIZE_KW: str(total_size),
+                        kw.RESC_HIER_STR_KW: hier_str,
+                        kw.REPLICA_TOKEN_KW: replica_token,
+                    }
+                )
+            mgr.add_io(Io)
+            logger.debug("target_host = %s", Io.raw.session.pool.account.host)
+            if File is None:
+                File = gen_file_handle()
+            futures.append(
+                executor.submit(
+                    _io_part,
+                    Io,
+                    chunks_,
+                    File,
+                    Operation,
+                    mgr,
+                    thread_debug_id=str(counter),
+                    **thread_opts
+                )
             )
-        )
-        counter += 1
-        Io = File = None
+            counter += 1
+            Io = File = None
+    finally:
+        if len(futures) < num_threads:
+            # Close the handles opened for a part that could not be started, and release the parts
+            # already running, which would otherwise wait at the exit barrier for it.
+            try:
+                if File is not None:
+                    File.close()
+            finally:
+                mgr.abort(Io)
+        # Give back any reserved worker slots left unused due to an error.
+        if reserved > len(futures):
+            executor.release(reserved - len(futures))
 
     if Operation.isNonBlocking():
         if queueLength:
@@ -444,8 +704,72 @@ def _io_multipart_threaded(
         else:
             return futures
     else:
+        # Let all parts wind down, even if one has failed, before reporting the outcome.
+        concurrent.futures.wait(futures)
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            # Raise the error that caused the transfer to fail, not its effect on the other parts.
+            causes = [e for e in errors if not isinstance(e, threading.BrokenBarrierError)]
+            raise (causes or errors)[0]
         bytecounts = [f.result() for f in futures]
-        return sum(bytecounts), total_size
+        return sum(bytecounts), expected_bytes
+
+
+def _transfer_identity(Operation, Data, d_path, fname, total_bytes):
+    """Describe a transfer, such that a journal is only used to resume the very same transfer."""
+    identity = {
+        "operation": "put" if Operation.isPut() else "get",
+        "logical_path": d_path or Data.path,
+        "local_path": os.path.abspath(fname),
+    }
+    if Operation.isPut():
+        st = os.stat(fname)
+        identity.update(
+            size=(total_bytes if total_bytes >= 0 else st.st_size),
+            mtime_ns=st.st_mtime_ns,
+        )
+    else:
+        identity["replicas"] = [
+            [r.number, r.size, str(r.modify_time), r.checksum] for r in Data.replicas
+        ]
+    return identity
+
+
+def _local_file_holds(fname, completed):
+    """Whether the local file can contain the byte ranges a GET's journal records as completed."""
+    try:
+        size = os.path.getsize(fname)
+    except OSError:
+        return False
+    return not completed or size >= completed[-1][1]
+
+
+def can_resume_get(resume, Data, fname):
+    """Whether a GET of the data object Data into fname would resume from a journal of the same transfer."""
+    path = journal_path(resume, fname)
+    if path is None:
+        return False
+    journal = TransferJournal(
+        path, _transfer_identity(Oper(Oper.GET), Data, None, fname, -1)
+    )
+    return journal.load() and _local_file_holds(fname, journal.completed)
+
+
+def _reopen_for_resume(session, path, journal, options, output_values):
+    """Open the replica recorded in the journal, for the finalizing descriptor of a resumed PUT."""
+    options = dict(options)
+    options[kw.REPLICA_TOKEN_KW] = journal.replica_token
+    options[kw.RESC_HIER_STR_KW] = journal.resc_hier
+    for key in ("returned_values", kw.FORCE_FLAG_KW):
+        options.pop(key, None)
+    return session.data_objects.open_with_FileRaw(
+        path,
+        "a",
+        create=False,
+        finalize_on_close=True,
+        returned_values=output_values,
+        **options
+    )
 
 
 def io_main(session, Data, opr_, fname, R="", **kwopt):
@@ -459,6 +783,7 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
 
     """
     total_bytes = kwopt.pop("total_bytes", -1)
+    resume = kwopt.pop("resume", False)
     Operation = Oper(opr_)
     d_path = None
     Io = None
@@ -493,7 +818,37 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
         open_options[kw.NUM_THREADS_KW] = str(num_threads)
         open_options[kw.DATA_SIZE_KW] = str(total_bytes)
 
+    journal = None
+    if resume:
+        journal = TransferJournal(
+            journal_path(resume, fname),
+            _transfer_identity(Operation, Data, d_path, fname, total_bytes),
+        )
+        if (
+            journal.load()
+            and Operation.isGet()
+            and not _local_file_holds(fname, journal.completed)
+        ):
+            logger.info("Local file %r does not match its transfer journal.", fname)
+            journal.completed = []
+
     output_values = {}
+    if journal is not None and journal.completed and Operation.isPut():
+        # Reopen the replica left by the interrupted transfer, rather than truncating it.
+        try:
+            (Io, rawfile) = _reopen_for_resume(
+                session,
+                (d_path or Data.path),
+                journal,
+                dict(Io.keywords) if type(Io) is deferred_call else open_options,
+                output_values,
+            )
+        except iRODSException as exc:
+            logger.warning(
+                "Could not reopen replica to resume transfer; restarting it: %r", exc
+            )
+            journal.completed = []
+            output_values = {}
     if not Io:
         (Io, rawfile) = session.data_objects.open_with_FileRaw(
             (d_path or Data.path),
@@ -537,9 +892,20 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
 
     (replica_token, resc_hier) = rawfile.replica_access_info()
 
+    spans = None
+    if journal is not None:
+        if not journal.completed:
+            journal.start(replica_token, resc_hier)
+        spans = journal.missing(total_bytes)
+        logger.info(
+            "resuming transfer; %s bytes of %s remain",
+            sum(stop - start for start, stop in spans),
+            total_bytes,
+        )
+
     queueLength = kwopt.get("queueLength", 0)
 
-    pass_thru_options = ("updatables", "queueLength")
+    pass_thru_options = ("updatables", "queueLength", "chunk_size")
     retval = _io_multipart_threaded(
         Operation,
         (Data, Io),
@@ -549,6 +915,8 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
         fname,
         total_bytes,
         num_threads=num_threads,
+        journal=journal,
+        spans=spans,
         **{k: v for k, v in kwopt.items() if k in pass_thru_options}
     )
 
@@ -560,6 +928,8 @@ def io_main(session, Data, opr_, fname, R="", **kwopt):
 
         if queueLength > 0:
             (futures, chunk_notify_queue, mgr) = retval
+            if spans is not None:
+                total_bytes = sum(stop - start for start, stop in spans)
         else:
             futures = retval
             chunk_notify_queue = total_bytes = None
@@ -633,6 +1003,8 @@ if __name__ == "__main__":
     # kwarg options 'N' (num threads) and 'R' (target resource name) are via command-line
     # kwarg['num_threads'] (overrides 'N' when called as a library)
     # kwarg['target_resource_name'] (overrides 'R' when called as a library)
+    # kwarg['chunk_size'] (size of the byte ranges taken in turn by transfer threads, when called as a library)
+    # kwarg['resume'] (True or a journal path, to checkpoint the transfer and resume it if interrupted)
     if isinstance(ret, AsyncNotify):
         print("waiting on completion...", file=sys.stderr)
         ret.set_transfer_done_callback(
@@ -1,11 +1,14 @@
+import collections
 import datetime
 import logging
 import threading
 import os
+import time
 import weakref
 
 from irods import DEFAULT_CONNECTION_TIMEOUT
 from irods.connection import Connection
+from irods.exception import ConnectionPoolTimeout
 from irods.ticket import Ticket
 
 logger = logging.getLogger(__name__)
@@ -25,6 +28,9 @@ def attribute_from_return_value(attrname):
 
 DEFAULT_APPLICATION_NAME = "python-irodsclient"
 
+# Seconds get_connection() waits, by default, for a connection from a bounded pool.
+DEFAULT_ACQUIRE_TIMEOUT = 60.0
+
 
 def _adjust_timeout_to_pool_default(conn):
     set_timeout = conn.socket.gettimeout()
@@ -36,19 +42,55 @@ def _adjust_timeout_to_pool_default(conn):
 
 class Pool:
 
+    Stats = collections.namedtuple(
+        "Stats",
+        (
+            "acquisitions",
+            "waits",
+            "timeouts",
+            "total_wait_time",
+            "max_wait_time",
+            "created",
+            "active",
+            "idle",
+        ),
+    )
+
     def __init__(
-        self, account, application_name="", connection_refresh_time=-1, session=None
+        self,
+        account,
+        application_name="",
+        connection_refresh_time=-1,
+        session=None,
+        max_connections=0,
+        min_idle=0,
+        acquire_timeout=DEFAULT_ACQUIRE_TIMEOUT,
     ):
         """
         Pool( account , application_name='' )
         Create an iRODS connection pool; 'account' is an irods.account.iRODSAccount instance and
         'application_name' specifies the application name as it should appear in an 'ips' listing.
+
+        If 'max_connections' is positive, no more than that many connections are open at once:
+        get_connection() then waits, in turn with any other threads waiting, for a connection to
+        be released, raising ConnectionPoolTimeout if none is within 'acquire_timeout' seconds
+        (60 by default; None means to wait indefinitely).  A call to prewarm() opens connections
+        in the background until 'min_idle' of them are idle.
         """
 
         self.session_ref = weakref.ref(session) if session is not None else lambda: None
         self._thread_local = threading.local()
         self.account = account
         self._lock = threading.RLock()
+        self._available = threading.Condition(self._lock)
+        self._waiters = collections.deque()
+        self._opening = 0  # Connections being opened, counted against max_connections.
+        self._max_connections = max_connections
+        self.min_idle = min_idle
+        self.acquire_timeout = acquire_timeout
+        self._prewarm_stopped = False
+        self.acquisitions = self.waits = self.timeouts = self.created = 0
+        self.total_wait_time = self.max_wait_time = 0.0
         self.active = set()
         self.idle = set()
         self.connection_timeout = DEFAULT_CONNECTION_TIMEOUT
@@ -65,6 +107,16 @@ class Pool:
             self.refresh_connection = False
             self.connection_refresh_time = None
 
+    @property
+    def max_connections(self):
+        return self._max_connections
+
+    @max_connections.setter
+    def max_connections(self, value):
+        with self._available:
+            self._max_connections = value
+            self._available.notify_all()
+
     @property
     def _conn(self):
         return getattr(self._thread_local, "_conn", None)
@@ -73,11 +125,68 @@ class Pool:
     def _conn(self, conn_):
         setattr(self._thread_local, "_conn", conn_)
 
+    def free_capacity(self):
+        """
+        Return the number of connections that could be acquired now without waiting (idle,
+        or yet to be opened within 'max_connections'), or None if the pool is unbounded.
+        """
+        with self._available:
+            if self._max_connections <= 0:
+                return None
+            open_count = len(self.active) + len(self.idle) + self._opening
+            return len(self.idle) + max(0, self._max_connections - open_count)
+
+    def limit_workers(self, workers):
+        """
+        Return the number of threads, of the 'workers' wanted, to run at once if each is to
+        use a connection of its own: 'workers', unless fewer (but at least one) connections
+        could be acquired without waiting.
+        """
+        free = self.free_capacity()
+        return workers if free is None else max(1, min(workers, free))
+
+    def _can_open(self):
+        # Called with the lock held.
+        open_count = len(self.active) + len(self.idle) + self._opening
+        return self._max_connections <= 0 or open_count < self._max_connections
+
+    def _wait_for_turn(self):
+        # Called with the lock held.  Waiters are served in the order they arrived.
+        token = object()
+        self._waiters.append(token)
+        start = time.monotonic()
+        deadline = None
+        if self.acquire_timeout is not None:
+            deadline = start + self.acquire_timeout
+        try:
+            while self._waiters[0] is not token or not (self.idle or self._can_open()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.timeouts += 1
+                    raise ConnectionPoolTimeout(
+                        "No connection became available within {} seconds "
+                        "(max_connections = {}).".format(
+                            self.acquire_timeout, self._max_connections
+                        )
+                    )
+                self._available.wait(remaining)
+        finally:
+            self._waiters.remove(token)
+            # The next waiter may now be able to proceed.
+            self._available.notify_all()
+            waited = time.monotonic() - start
+            self.waits += 1
+            self.total_wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
     @attribute_from_return_value("_conn")
     def get_connection(self):
-        new_conn = False
-        with self._lock:
-            try:
+        conn = None
+        with self._available:
+            if self._waiters or not (self.idle or self._can_open()):
+                self._wait_for_turn()
+            self.acquisitions += 1
+            if self.idle:
                 conn = self.idle.pop()
 
                 curr_time = datetime.datetime.now()
@@ -98,37 +207,109 @@ class Pool:
                     # up the object and call disconnect(). This makes the behavior of the
                     # code more predictable as we are not relying on when garbage collector is called
                     conn.disconnect()
-                    conn = Connection(self, self.account)
-                    new_conn = True
-                    logger.debug(f"Created new connection with id: {id(conn)}")
-            except KeyError:
-                conn = Connection(self, self.account)
-                new_conn = True
-                logger.debug(
-                    f"No connection found in idle set. Created a new connection with id: {id(conn)}"
-                )
-
-            self.active.add(conn)
-
-            sess = self.session_ref()
-            if sess and sess.ticket__ and not sess.ticket_applied.get(conn, False):
-                Ticket._lowlevel_api_request(conn, "session", sess.ticket__)
-                sess.ticket_applied[conn] = True
-
-            logger.debug(f"Adding connection with id {id(conn)} to active set")
+                    conn = None
+                else:
+                    self.active.add(conn)
+            if conn is None:
+                self._opening += 1
 
+        if conn is None:
+            # Connect and authenticate without holding the lock, so that other threads
+            # may meanwhile take or release connections.
+            conn = self._open_connection(self.active)
+            logger.debug(f"Created new connection with id: {id(conn)}")
+        else:
             # If the connection we're about to make active was cached, it already has a socket object internal to it,
             # so we potentially have to modify it to have the desired timeout.
-            if not new_conn:
-                _adjust_timeout_to_pool_default(conn)
+            _adjust_timeout_to_pool_default(conn)
+
+        sess = self.session_ref()
+        if sess and sess.ticket__ and not sess.ticket_applied.get(conn, False):
+            Ticket._lowlevel_api_request(conn, "session", sess.ticket__)
+            sess.ticket_applied[conn] = True
 
+        logger.debug(f"Adding connection with id {id(conn)} to active set")
         logger.debug(f"num active: {len(self.active)}")
         logger.debug(f"num idle: {len(self.idle)}")
 
         return conn
 
+    def _open_connection(self, into):
+        # Open a connection for the slot reserved by incrementing self._opening,
+        # and add it to the set 'into' (self.active or self.idle).
+        conn = None
+        try:
+            conn = Connection(self, self.account)
+        finally:
+            with self._available:
+                self._opening -= 1
+                if conn is not None:
+                    self.created += 1
+                    into.add(conn)
+                self._available.notify_all()
+        return conn
+
+    def prewarm(self):
+        """
+        Open connections in a background thread until 'min_idle' of them are idle (or, if
+        sooner, until 'max_connections' are open).  Returns the thread, or None if there
+        is nothing to do.
+        """
+        if self.min_idle <= 0:
+            return None
+        thread = threading.Thread(
+            target=self._prewarm, name="irods-pool-prewarm", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _prewarm(self):
+        while True:
+            with self._available:
+                if (
+                    self._prewarm_stopped
+                    or len(self.idle) + self._opening >= self.min_idle
+                    or not self._can_open()
+                ):
+                    return
+                self._opening += 1
+            try:
+                conn = self._open_connection(self.idle)
+            except Exception as exc:
+                logger.warning(f"Could not pre-warm the connection pool: {exc!r}")
+                return
+            logger.debug(f"Added pre-warmed connection with id: {id(conn)} to idle set")
+            if self._prewarm_stopped:
+                # The session was cleaned up meanwhile.
+                self.release_connection(conn, destroy=True)
+                conn.disconnect()
+                return
+
+    def stop_prewarming(self):
+        """Stop the background opening of connections started by prewarm()."""
+        with self._available:
+            self._prewarm_stopped = True
+
+    def stats(self):
+        """
+        Return a Stats tuple of the number of connections acquired; of the acquisitions which
+        had to wait, and of those which timed out; of the total and longest waits in seconds;
+        of the connections opened; and of the connections currently active and idle.
+        """
+        with self._available:
+            return self.Stats(
+                self.acquisitions,
+                self.waits,
+                self.timeouts,
+                self.total_wait_time,
+                self.max_wait_time,
+                self.created,
+                len(self.active),
+                len(self.idle),
+            )
+
     def release_connection(self, conn, destroy=False):
-        with self._lock:
+        with self._available:
             if conn in self.active:
                 self.active.remove(conn)
                 logger.debug(f"Removed connection with id: {id(conn)} from active set")
@@ -138,8 +319,10 @@ class Pool:
                         conn.last_used_time = datetime.datetime.now()
                     self.idle.add(conn)
                     logger.debug(f"Added connection with id: {id(conn)} to idle set")
+                self._available.notify_all()
             elif conn in self.idle and destroy:
                 logger.debug(f"Destroying connection with id: {id(conn)}")
                 self.idle.remove(conn)
+                self._available.notify_all()
         logger.debug(f"num active: {len(self.active)}")
         logger.debug(f"num idle: {len(self.idle)}")
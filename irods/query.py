@@ -1,8 +1,12 @@
 from collections import OrderedDict
+import concurrent.futures
+import itertools
+import queue
+import threading
 
 from irods import MAX_SQL_ROWS
 from irods.models import Model
-from irods.column import Column, Keyword
+from irods.column import Column, In, Keyword, String
 from irods.message import (
     IntegerIntegerMap,
     IntegerStringMap,
@@ -193,10 +197,13 @@ class Query:
             dct[key] = self._keywords[key]
         return StringStringMap(dct)
 
+    def _max_rows(self):
+        # The number of rows requested of the server at a time.
+        return 500 if self._limit == -1 else self._limit
+
     def _message(self):
-        max_rows = 500 if self._limit == -1 else self._limit
         args = {
-            "maxRows": max_rows,
+            "maxRows": self._max_rows(),
             "continueInx": self._continue_index,
             "partialStartIndex": self._offset,
             "options": 0 if self.case_sensitive else query_number["UPPER_CASE_WHERE"],
@@ -207,22 +214,93 @@ class Query:
         return GenQueryRequest(**args)
 
     def execute(self):
+        """Run the query, returning the first batch (ResultSet) of its results.
+
+        The query is left open on the server while its continue_index is nonzero.  A query
+        split for the size of its In() filters (see get_batches) returns instead the first
+        rows of its parts, at most as many as an unsplit query would, with a continue_index
+        of zero; its full results are generated by get_batches() and get_results().
+        """
+        queries = self._split_in_filters()
+        if queries is not None:
+            return self._execute_split(queries)
         with self.sess.pool.get_connection() as conn:
+            return self._execute(conn)
 
-            message_body = self._message()
-            message = iRODSMessage(
-                "RODS_API_REQ", msg=message_body, int_info=api_number["GEN_QUERY_AN"]
-            )
+    def _execute(self, conn):
+        message_body = self._message()
+        message = iRODSMessage(
+            "RODS_API_REQ", msg=message_body, int_info=api_number["GEN_QUERY_AN"]
+        )
 
-            conn.send(message)
-            try:
-                result_message = conn.recv()
-                results = result_message.get_main_message(GenQueryResponse)
-                result_set = ResultSet(results)
-            except CAT_NO_ROWS_FOUND:
-                result_set = ResultSet(empty_gen_query_out(list(self.columns.keys())))
+        conn.send(message)
+        try:
+            result_message = conn.recv()
+            results = result_message.get_main_message(GenQueryResponse)
+            result_set = ResultSet(results)
+        except CAT_NO_ROWS_FOUND:
+            result_set = ResultSet(empty_gen_query_out(list(self.columns.keys())))
         return result_set
 
+    def _split_in_filters(self):
+        """Return the queries into which this one is split to bound the size of its In() filters.
+
+        Each In() filter with more than genquery.in_filter_max_values values is divided into
+        filters of at most that many, and one query made for each combination of these.
+        Returns None if no filter needs dividing.
+
+        A query that is ordered, limited, offset or aggregated is never split, since each
+        part would be so on its own.  Nor is an In() filter divided unless its column is
+        selected, as rows could otherwise be repeated across the parts.
+        """
+        import irods.client_configuration as cfg
+
+        max_values = cfg.genquery.in_filter_max_values
+        if max_values < 1:
+            return None
+        if (
+            self._limit != -1
+            or self._offset
+            or any(value != 1 for value in self.columns.values())
+        ):
+            return None
+        criteria_choices = []
+        for criterion in self.criteria:
+            choices = [criterion]
+            if isinstance(criterion, In) and self.columns.get(criterion.query_key) == 1:
+                values = list(criterion.value)
+                if len(values) > max_values:
+                    choices = [
+                        In(criterion.query_key, values[i : i + max_values])
+                        for i in range(0, len(values), max_values)
+                    ]
+            criteria_choices.append(choices)
+        if all(len(choices) == 1 for choices in criteria_choices):
+            return None
+        queries = []
+        for criteria in itertools.product(*criteria_choices):
+            query = self._clone()
+            query.criteria = list(criteria)
+            queries.append(query)
+        return queries
+
+    def _execute_split(self, queries):
+        import irods.client_configuration as cfg
+
+        def first_batch(query):
+            with self.sess.pool.get_connection() as conn:
+                result_set = query._execute(conn)
+                if result_set.continue_index > 0:
+                    query.continue_index(result_set.continue_index).limit(0)._execute(conn)
+                return result_set
+
+        workers = max(1, min(cfg.genquery.in_filter_workers, len(queries)))
+        workers = self.sess.pool.limit_workers(workers)
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            result_sets = list(executor.map(first_batch, queries))
+        # A page of the same size as the unsplit query's, which cannot be continued.
+        return ResultSet.concatenate(result_sets, max_rows=self._max_rows())
+
     def close(self):
         """Closes an open query on the server side.
         self._continue_index must be set to a valid value (returned by a previous query API call).
@@ -235,7 +313,33 @@ class Query:
             self.continue_index(result_set.continue_index).close()
         return result_set
 
-    def get_batches(self):
+    def get_batches(self, prefetch=0):
+        """Generate the query results one batch (ResultSet) at a time.
+
+        If `prefetch' is greater than zero, a background thread requests up to that many
+        batches ahead of the one being consumed.  The query is then run on a single pooled
+        connection, held until the last batch is fetched or the generator is closed, so
+        that each continuation reaches the server agent holding the query open.
+
+        A query with In() filters too large to send at once is split into several (see
+        genquery.in_filter_max_values), which are run concurrently, each on a pooled
+        connection of its own, by up to genquery.in_filter_workers threads.  Their batches
+        are generated as they arrive, and so follow no overall order.  Queries which are
+        ordered, limited, offset or aggregated are not split.
+        """
+        queries = self._split_in_filters()
+        if queries is not None:
+            import irods.client_configuration as cfg
+
+            workers = cfg.genquery.in_filter_workers
+            return _get_batches_threaded(
+                self.sess, queries, workers, prefetch if prefetch > 0 else workers
+            )
+        if prefetch > 0:
+            return _get_batches_threaded(self.sess, [self], 1, prefetch)
+        return self._get_batches()
+
+    def _get_batches(self):
         result_set = self.execute()
 
         try:
@@ -253,14 +357,76 @@ class Query:
             if result_set.continue_index > 0:
                 self.continue_index(result_set.continue_index).close()
 
-    def get_results(self):
-        for result_set in self.get_batches():
+    def _batches_on(self, conn, stop=None):
+        """Generate the batches of the query, making every request on the given connection.
+
+        Ends early if the `stop' event is set.  In that case, as when the generator is
+        closed, the query is closed on the server if still open.
+        """
+        result_set = self._execute(conn)
+        try:
+            yield result_set
+            while result_set.continue_index > 0:
+                if stop is not None and stop.is_set():
+                    break
+                result_set = self.continue_index(result_set.continue_index)._execute(
+                    conn
+                )
+                yield result_set
+        except GeneratorExit:
+            pass
+        if result_set.continue_index > 0:
+            self.continue_index(result_set.continue_index).limit(0)._execute(conn)
+
+    def get_results(self, prefetch=0):
+        for result_set in self.get_batches(prefetch=prefetch):
             for result in result_set:
                 yield result
 
     def __iter__(self):
         return self.get_results()
 
+    def to_arrays(self):
+        """Return all results as a dict of NumPy arrays, one per column, keyed by Column.
+
+        The batches are fetched in turn and each is converted in bulk, as for
+        ResultSet.to_arrays(), before the next is requested.  Requires NumPy.
+        """
+        import numpy
+
+        chunks = {}
+        for result_set in self.get_batches():
+            for key, array in result_set.to_arrays().items():
+                chunks.setdefault(key, []).append(array)
+        return {key: numpy.concatenate(arrays) for key, arrays in chunks.items()}
+
+    def to_dataframe(self, categorical=None):
+        """Return all results as a pandas DataFrame, with columns labeled by their catalog names.
+
+        Timestamps become timezone-aware (UTC) datetime columns.  `categorical' names the
+        Columns to store as pandas categoricals; by default, these are the text columns
+        with at most half as many distinct values as there are rows (resource names,
+        owners and the like).  Requires pandas.
+        """
+        import pandas
+
+        if categorical is not None:
+            categorical = set(categorical)
+        data = {}
+        for column, array in self.to_arrays().items():
+            if array.dtype.kind == "M":
+                values = pandas.Series(array).dt.tz_localize("UTC")
+            elif (
+                column in categorical
+                if categorical is not None
+                else column.column_type is String and 2 * len(set(array)) <= len(array)
+            ):
+                values = pandas.Categorical(array)
+            else:
+                values = array
+            data[column.icat_key] = values
+        return pandas.DataFrame(data)
+
     def one(self):
         results = self.execute()
         if results.continue_index > 0:
@@ -282,6 +448,84 @@ class Query:
             return results[0]
 
 
+def _get_batches_threaded(sess, queries, workers, depth):
+    """Generate the batches of the given queries, as fetched by worker threads.
+
+    Each thread takes the queries in turn, running them on a pooled connection (of the
+    session `sess') of its own, and keeps up to `depth' batches queued ahead of the
+    consumer.  A query need only provide a _batches_on(conn, stop) method.
+    """
+    pending = queue.Queue()
+    for query in queries:
+        pending.put(query)
+    batches = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    end = object()
+
+    def work():
+        try:
+            with sess.pool.get_connection() as conn:
+                while not stop.is_set():
+                    try:
+                        query = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    for result_set in query._batches_on(conn, stop):
+                        batches.put(result_set)
+        except BaseException as exc:
+            batches.put(exc)
+        finally:
+            batches.put(end)
+
+    threads = [
+        threading.Thread(target=work, daemon=True)
+        for _ in range(sess.pool.limit_workers(max(1, min(workers, len(queries)))))
+    ]
+    for thread in threads:
+        thread.start()
+    running = len(threads)
+    try:
+        while running:
+            item = batches.get()
+            if item is end:
+                running -= 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield item
+    finally:
+        # On early exit or error, have the threads stop after any request in flight
+        # (closing their queries on the server), draining the queue to unblock them.
+        stop.set()
+        while running:
+            if batches.get() is end:
+                running -= 1
+        for thread in threads:
+            thread.join()
+
+
+def get_results_concurrently(queries, workers=None):
+    """Generate the rows of several queries on one session, run concurrently.
+
+    Up to `workers' threads (by default, genquery.in_filter_workers) run the queries, each
+    on a pooled connection of its own.  Rows are generated in the order their batches arrive.
+    Queries with large In() filters are split beforehand, as by get_batches().
+    """
+    queries = [
+        part for query in queries for part in (query._split_in_filters() or [query])
+    ]
+    if not queries:
+        return
+    if workers is None:
+        import irods.client_configuration as cfg
+
+        workers = cfg.genquery.in_filter_workers
+    workers = max(1, workers)
+    for result_set in _get_batches_threaded(queries[0].sess, queries, workers, workers):
+        for result in result_set:
+            yield result
+
+
 #     def __getitem__(self, val):
 #         pass
 
@@ -329,7 +573,21 @@ class SpecificQuery:
         return response
 
     def execute(self, limit=MAX_SQL_ROWS, offset=0, options=0, conditions=None):
+        with self.session.pool.get_connection() as conn:
+            return self._execute(conn, limit, offset, options, conditions)
+
+    def _execute(
+        self,
+        conn,
+        limit=MAX_SQL_ROWS,
+        offset=0,
+        options=0,
+        conditions=None,
+        continue_index=None,
+    ):
         target = self._alias or self._sql
+        if continue_index is None:
+            continue_index = self._continue_index
 
         if conditions is None:
             conditions = StringStringMap({})
@@ -341,7 +599,7 @@ class SpecificQuery:
         message_body = SpecificQueryRequest(
             sql=target,
             maxRows=limit,
-            continueInx=self._continue_index,
+            continueInx=continue_index,
             rowOffset=offset,
             options=0,
             KeyValPair_PI=conditions,
@@ -352,9 +610,8 @@ class SpecificQuery:
             "RODS_API_REQ", msg=message_body, int_info=api_number["SPECIFIC_QUERY_AN"]
         )
 
-        with self.session.pool.get_connection() as conn:
-            conn.send(request)
-            response = conn.recv()
+        conn.send(request)
+        response = conn.recv()
 
         results = response.get_main_message(GenQueryResponse)
         return SpecificQueryResultSet(results, self._columns)
@@ -362,7 +619,19 @@ class SpecificQuery:
     def __iter__(self):
         return self.get_results()
 
-    def get_batches(self):
+    def get_batches(self, prefetch=0):
+        """Generate the query results one batch (ResultSet) at a time.
+
+        If `prefetch' is greater than zero, a background thread requests up to that many
+        batches ahead of the one being consumed.  The query is then run on a single pooled
+        connection, held until the last batch is fetched or the generator is closed, so
+        that each continuation reaches the server agent holding the query open.
+        """
+        if prefetch > 0:
+            return _get_batches_threaded(self.session, [self], 1, prefetch)
+        return self._get_batches()
+
+    def _get_batches(self):
         result_set = self.execute()
         yield result_set
 
@@ -374,7 +643,35 @@ class SpecificQuery:
             except CAT_NO_ROWS_FOUND:
                 break
 
-    def get_results(self):
-        for result_set in self.get_batches():
+    def _batches_on(self, conn, stop=None):
+        """Generate the batches of the query, making every request on the given connection.
+
+        Ends early if the `stop' event is set.  In that case, as when the generator is
+        closed, the query is closed on the server if still open.
+        """
+        result_set = self._execute(conn)
+        continue_index = result_set.continue_index
+        try:
+            yield result_set
+            while continue_index > 0:
+                if stop is not None and stop.is_set():
+                    break
+                try:
+                    result_set = self._execute(conn, continue_index=continue_index)
+                except CAT_NO_ROWS_FOUND:
+                    continue_index = 0
+                    break
+                continue_index = result_set.continue_index
+                yield result_set
+        except GeneratorExit:
+            pass
+        if continue_index > 0:
+            try:
+                self._execute(conn, limit=0, continue_index=continue_index)
+            except CAT_NO_ROWS_FOUND:
+                pass
+
+    def get_results(self, prefetch=0):
+        for result_set in self.get_batches(prefetch=prefetch):
             for result in result_set:
                 yield result
@@ -100,7 +100,7 @@ class iRODSResource:
 
     @property
     def metadata(self):
-        if not self._meta:
+        if self._meta is None:
             self._meta = iRODSMetaCollection(
                 self.manager.sess.metadata, Resource, self.name
             )
@@ -1,19 +1,59 @@
 from prettytable import PrettyTable
+from irods.column import DateTime, Integer, String
+from irods.message import GenQueryResponse, GenQueryResponseColumn
 from irods.models import ModelBase
 
 
 class ResultSet:
+    """The rows returned by a query.
+
+    The values are held per column, as received from the server, and are converted to
+    Python types one column at a time, when first accessed.  Row dictionaries are built
+    on demand; iterating over the result set does not keep them.
+    """
 
     def __init__(self, raw):
         self.length = raw.rowCnt
         col_length = raw.attriCnt
         self.cols = raw.SqlResult_PI[:col_length]
-        self.rows = [self._format_row(i) for i in range(self.length)]
+        self._keys_and_converters = None
+        self._converted_columns = {}
+        self._rows = None
         try:
             self.continue_index = raw.continueInx
         except KeyError:
             self.continue_index = 0
 
+    @classmethod
+    def concatenate(cls, result_sets, max_rows=None):
+        """Return a result set holding the rows of the given ones (having the same columns) in turn.
+
+        If `max_rows' is given, only that many of the rows are kept.
+        """
+        first = result_sets[0]
+        row_count = sum(len(result_set) for result_set in result_sets)
+        if max_rows is not None:
+            row_count = min(row_count, max_rows)
+        columns = [
+            GenQueryResponseColumn(
+                attriInx=col.attriInx,
+                value=[
+                    value
+                    for result_set in result_sets
+                    for value in result_set.cols[position].value
+                ][:row_count],
+            )
+            for position, col in enumerate(first.cols)
+        ]
+        return cls(
+            GenQueryResponse(
+                rowCnt=row_count,
+                attriCnt=len(columns),
+                continueInx=0,
+                SqlResult_PI=columns,
+            )
+        )
+
     def __str__(self):
         table = PrettyTable()
         for col in self.cols:
@@ -28,42 +68,123 @@ class ResultSet:
         table.align = "l"
         return table.get_html_string(*args, **kwargs)
 
+    def _column_key_and_type(self, position, col):
+        """Return the row key for a column of results, and the Column whose type converts its values."""
+        column = ModelBase.columns()[col.attriInx]
+        return (column, column)
+
+    def _get_keys_and_converters(self):
+        if self._keys_and_converters is None:
+            keys_and_converters = []
+            for position, col in enumerate(self.cols):
+                key, column = self._column_key_and_type(position, col)
+                keys_and_converters.append((key, column.column_type.to_python))
+            self._keys_and_converters = keys_and_converters
+        return self._keys_and_converters
+
     @staticmethod
-    def _format_attribute(attribute_index, value):
-        col = ModelBase.columns()[attribute_index]
+    def _convert(to_python, value):
         try:
-            return (col, col.column_type.to_python(value))
+            return to_python(value)
         except (TypeError, ValueError):
-            return (col, value)
-
-    _get_column_values = lambda self, index: [
-        (col, col.value[index]) for col in self.cols
-    ]
+            return value
+
+    def keys(self):
+        """Return the keys of the row dictionaries, in the order the columns were returned."""
+        return [key for key, _ in self._get_keys_and_converters()]
+
+    def _converted_column(self, position):
+        values = self._converted_columns.get(position)
+        if values is None:
+            _, to_python = self._get_keys_and_converters()[position]
+            raw_values = self.cols[position].value
+            if to_python is String.to_python:
+                values = raw_values
+            else:
+                try:
+                    values = [to_python(value) for value in raw_values]
+                except (TypeError, ValueError):
+                    convert = self._convert
+                    values = [convert(to_python, value) for value in raw_values]
+            self._converted_columns[position] = values
+        return values
+
+    def column_values(self, key):
+        """Return the list of (converted) values of a column, given its key in the row dictionaries."""
+        # Resolve the key as a row dictionary would (Column.__eq__ builds a query criterion).
+        positions = {key: position for position, key in enumerate(self.keys())}
+        return self._converted_column(positions[key])
+
+    def to_arrays(self):
+        """Return the columns as a dict of NumPy arrays, keyed as in the row dictionaries.
+
+        Integer columns are parsed in bulk into int64 arrays, and timestamps into
+        datetime64[s] arrays (in UTC).  Other columns, and any column with values that
+        do not parse as expected, are object arrays of the values found in the rows.
+        Requires NumPy.
+        """
+        import numpy
+
+        arrays = {}
+        for position, (key, to_python) in enumerate(self._get_keys_and_converters()):
+            raw_values = self.cols[position].value
+            array = None
+            if to_python is Integer.to_python or to_python is DateTime.to_python:
+                try:
+                    array = numpy.array(raw_values).astype(numpy.int64)
+                except ValueError:
+                    pass
+                else:
+                    if to_python is DateTime.to_python:
+                        array = array.astype("datetime64[s]")
+            if array is None:
+                array = numpy.array(self._converted_column(position), dtype=object)
+            arrays[key] = array
+        return arrays
 
     def _format_row(self, index):
-        values = self._get_column_values(index)
-        return dict(
-            [self._format_attribute(col.attriInx, value) for col, value in values]
-        )
+        convert = self._convert
+        return {
+            key: convert(to_python, col.value[index])
+            for (key, to_python), col in zip(self._get_keys_and_converters(), self.cols)
+        }
+
+    def _iter_rows(self):
+        keys = self.keys()
+        columns = [self._converted_column(i) for i in range(len(keys))]
+        for values in zip(*columns):
+            yield dict(zip(keys, values))
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = list(self._iter_rows())
+        return self._rows
 
     def __getitem__(self, index):
-        return self.rows.__getitem__(index)
+        if self._rows is not None:
+            return self._rows.__getitem__(index)
+        if isinstance(index, slice):
+            return [self._format_row(i) for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("list index out of range")
+        return self._format_row(index)
 
     def __iter__(self):
-        return self.rows.__iter__()
+        if self._rows is not None:
+            return self._rows.__iter__()
+        return self._iter_rows()
 
     def __len__(self):
         return self.length
 
     # For testing. Might go somewhere else...
     def has_value(self, value):
-        found = False
-
-        for row in self.rows:
-            if value in list(row.values()):
-                found = True
-
-        return found
+        return any(
+            value in self._converted_column(i) for i in range(len(self.keys()))
+        )
 
 
 class SpecificQueryResultSet(ResultSet):
@@ -72,24 +193,9 @@ class SpecificQueryResultSet(ResultSet):
         self._query_columns = columns
         super(SpecificQueryResultSet, self).__init__(raw)
 
-    def _format_row(self, index):
-        values = [col.value[index] for col in self.cols]
-
-        formatted_row = {}
-
-        for i, value in enumerate(values):
-            try:
-                column = self._query_columns[i]
-                result_key = column
-            except TypeError:
-                column = ModelBase.columns()[0]  # SpecificQueryResult.value
-                result_key = i
-
-            try:
-                formatted_value = column.column_type.to_python(value)
-            except (TypeError, ValueError):
-                formatted_value = value
-
-            formatted_row[result_key] = formatted_value
-
-        return formatted_row
+    def _column_key_and_type(self, position, col):
+        try:
+            column = self._query_columns[position]
+            return (column, column)
+        except TypeError:
+            return (position, ModelBase.columns()[0])  # SpecificQueryResult.value
@@ -10,7 +10,7 @@ import threading
 import weakref
 from irods.query import Query
 from irods.genquery2 import GenQuery2
-from irods.pool import Pool
+from irods.pool import DEFAULT_ACQUIRE_TIMEOUT, Pool
 from irods.account import iRODSAccount
 from irods.api_number import api_number
 from irods.manager.collection_manager import CollectionManager
@@ -23,6 +23,8 @@ from irods.manager.zone_manager import ZoneManager
 from irods.message import iRODSMessage, STR_PI
 from irods.exception import NetworkException, NotImplementedInIRODSServer
 from irods.password_obfuscation import decode
+from irods.session_cache import RedirectSessionCache
+from irods.catalog_cache import CatalogCache, USER_CACHE_SIZE
 from irods import NATIVE_AUTH_SCHEME, PAM_AUTH_SCHEMES
 from . import at_client_exit
 from . import DEFAULT_CONNECTION_TIMEOUT, MAXIMUM_CONNECTION_TIMEOUT
@@ -178,6 +180,12 @@ class iRODSSession:
         self.ticket__ = ""
         # A mapping for each connection - holds whether the session's assigned ticket has been applied.
         self.ticket_applied = weakref.WeakKeyDictionary()
+        # Sessions cloned for data object opens redirected to other servers, reused across opens.
+        self.redirect_sessions = RedirectSessionCache()
+        # Catalog rows found by collection and data object lookups (if enabled; see irods.catalog_cache).
+        self.catalog_cache = CatalogCache()
+        # Users and groups looked up by id, as for the ACLs reported by the access manager.
+        self.user_cache = CatalogCache(max_size=USER_CACHE_SIZE)
         if auto_cleanup:
             _weakly_reference(self)
 
@@ -208,6 +216,14 @@ class iRODSSession:
                 # Deep-copy the iRODSAccount subobject, since we might be setting the hostname on that object.
                 setattr(other, k, copy.copy(v))
 
+        # The clone must not share (and thus, on cleanup, clear) this session's redirect cache.
+        other.redirect_sessions = RedirectSessionCache()
+        other.catalog_cache = CatalogCache(
+            self.catalog_cache._max_size, self.catalog_cache._ttl
+        )
+        other.user_cache = CatalogCache(
+            self.user_cache._max_size, self.user_cache._ttl
+        )
         other.cleanup(new_host=kwargs.pop("host", ""))
         other.ticket__ = kwargs.pop("ticket", self.ticket__)
         other.ticket_applied = weakref.WeakKeyDictionary()
@@ -216,7 +232,11 @@ class iRODSSession:
         return other
 
     def cleanup(self, new_host=""):
+        redirect_sessions = getattr(self, "redirect_sessions", None)
+        if redirect_sessions is not None:
+            redirect_sessions.clear()
         if self.pool:
+            self.pool.stop_prewarming()
             for conn in self.pool.active | self.pool.idle:
                 try:
                     conn.disconnect()
@@ -315,9 +335,13 @@ class iRODSSession:
             application_name=kwargs.pop("application_name", ""),
             connection_refresh_time=connection_refresh_time,
             session=self,
+            max_connections=int(kwargs.get("max_connections", 0)),
+            min_idle=int(kwargs.get("min_idle_connections", 0)),
+            acquire_timeout=kwargs.get("pool_timeout", DEFAULT_ACQUIRE_TIMEOUT),
         )
         conn_timeout = getattr(self, "_cached_connection_timeout", None)
         self.pool.connection_timeout = conn_timeout
+        self.pool.prewarm()
         return account
 
     def query(self, *args, **kwargs):
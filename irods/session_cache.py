@@ -0,0 +1,140 @@
+import collections
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RedirectSessionCache:
+    """A bounded, thread-safe cache of the sessions cloned when a data object open() is redirected.
+
+    Sessions are keyed by (host, port, zone, user, authentication scheme, ticket) so that repeated
+    redirects to the same server reuse that session's pool, and thus its warm (already authenticated)
+    connections, rather than building a new session for every open().
+
+    Entries idle for longer than `idle_timeout' seconds are evicted, as is the least recently used entry
+    once the cache grows beyond `max_size'.  A session is only cleaned up on eviction if none of its
+    connections are checked out; otherwise it is merely dropped from the cache, and (as before the cache
+    existed) its lifetime is governed by the data object handles still referring to it.
+    """
+
+    Stats = collections.namedtuple("Stats", ("hits", "misses", "evictions", "size"))
+
+    def __init__(self, max_size=None, idle_timeout=None):
+        """Initialize the cache. Limits default to the current client configuration when not given."""
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def max_size(self):
+        if self._max_size is not None:
+            return self._max_size
+        import irods.client_configuration as cfg
+
+        return cfg.data_objects.redirect_session_cache_size
+
+    @property
+    def idle_timeout(self):
+        if self._idle_timeout is not None:
+            return self._idle_timeout
+        import irods.client_configuration as cfg
+
+        return cfg.data_objects.redirect_session_idle_timeout
+
+    @staticmethod
+    def key_for(session, host):
+        """Compute the cache key for `session' redirected to `host'."""
+        account = session.pool.account
+        return (
+            host,
+            session.port,
+            session.zone,
+            session.username,
+            account._original_authentication_scheme,
+            session.ticket__,
+        )
+
+    @staticmethod
+    def _in_use(session):
+        pool = session.pool
+        return pool is not None and len(pool.active) > 0
+
+    def get(self, key, factory):
+        """Return the session cached under `key', calling `factory()' to create it on a miss.
+
+        The session is created without holding the cache's lock, so that other lookups need
+        not wait on its connection.  Should another thread cache a session under the same key
+        meanwhile, that one is returned instead, and the one created here is cleaned up.
+        """
+        expired = []
+        try:
+            with self._lock:
+                expired += self._evict_idle(time.time())
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self.hits += 1
+                    return self._store(key, entry[0], expired)
+                self.misses += 1
+            session = factory()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    expired.append(session)
+                    session = entry[0]
+                return self._store(key, session, expired)
+        finally:
+            for stale in expired:
+                if not self._in_use(stale):
+                    self._dispose(stale)
+
+    def _store(self, key, session, expired):
+        # Cache the session as the most recently used, evicting any beyond the size limit
+        # into `expired'.  Called with the lock held.
+        if self.max_size > 0:
+            self._entries.pop(key, None)
+            self._entries[key] = (session, time.time())
+            while len(self._entries) > self.max_size:
+                _, (lru_session, _) = self._entries.popitem(last=False)
+                self.evictions += 1
+                expired.append(lru_session)
+        return session
+
+    def _evict_idle(self, now):
+        timeout = self.idle_timeout
+        if timeout is None or timeout < 0:
+            return []
+        stale = [
+            k
+            for k, (session, last_used) in self._entries.items()
+            if now - last_used > timeout and not self._in_use(session)
+        ]
+        self.evictions += len(stale)
+        return [self._entries.pop(k)[0] for k in stale]
+
+    @staticmethod
+    def _dispose(session):
+        try:
+            session.cleanup()
+        except Exception as exc:
+            logger.debug("Exception while cleaning up redirect session: %r", exc)
+
+    def clear(self):
+        """Remove all entries, cleaning up the sessions that are not in use."""
+        with self._lock:
+            sessions = [session for session, _ in self._entries.values()]
+            self._entries.clear()
+        for session in sessions:
+            if not self._in_use(session):
+                self._dispose(session)
+
+    def stats(self):
+        """Return a Stats tuple of the hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return self.Stats(self.hits, self.misses, self.evictions, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,13 +1,18 @@
 #! /usr/bin/env python
 
+import csv
+import io
+import json
 import os
 import sys
 import unittest
 
 from irods.access import iRODSAccess
+from irods.catalog_cache import CatalogCache
 from irods.collection import iRODSCollection
 from irods.column import In, Like
 from irods.exception import UserDoesNotExist
+from irods.manager import access_manager
 from irods.models import User, Collection, DataObject
 from irods.path import iRODSPath
 from irods.user import iRODSUser
@@ -101,6 +106,33 @@ class TestAccess(unittest.TestCase):
         c = self.sess.collections.get(self.coll_path)
         self.assertFalse(c.inheritance)
 
+    def test_set_inherit_acl_with_catalog_cache(self):
+        sub = helpers.make_collection(self.sess, self.coll_path + "/inherit_cached_sub")
+        self.sess.catalog_cache = CatalogCache(max_size=100, ttl=-1)
+        try:
+            for access_name, recursive in (
+                ("inherit", False),
+                ("noinherit", False),
+                ("inherit", True),
+                ("noinherit", True),
+            ):
+                # Look the collections up first, so that their rows are cached.
+                self.sess.collections.get(self.coll_path)
+                self.sess.collections.get(sub.path)
+                self.sess.acls.set(
+                    iRODSAccess(access_name, self.coll_path), recursive=recursive
+                )
+                expected = access_name == "inherit"
+                self.assertEqual(
+                    self.sess.collections.get(self.coll_path).inheritance, expected
+                )
+                if recursive:
+                    self.assertEqual(
+                        self.sess.collections.get(sub.path).inheritance, expected
+                    )
+        finally:
+            self.sess.catalog_cache = CatalogCache()
+
     def test_available_permissions__420_422(self):
         # Cycle through access levels (strings available via session.available_permissions) and test, with
         # a string compare, that the "set" access level matches the "get" access level.
@@ -455,6 +487,120 @@ class TestAccess(unittest.TestCase):
             else:
                 u.remove()
 
+    def test_acls_get_many(self):
+        data = [
+            helpers.make_object(
+                self.sess, "{}/acls_get_many_{}".format(self.coll_path, i)
+            )
+            for i in range(3)
+        ]
+        user = None
+        try:
+            user = self.sess.users.create("acls_get_many_user", "rodsuser")
+            self.sess.acls.set(iRODSAccess("read", data[1].path, user.name))
+            self.sess.acls.set(iRODSAccess("write", self.coll_path, user.name))
+            targets = data + [self.coll]
+            acls = self.sess.acls.get_many(targets)
+            self.assertEqual(set(acls), set(t.path for t in targets))
+            for target in targets:
+                self.assertEqual(
+                    set(acls[target.path]), set(self.sess.acls.get(target))
+                )
+            # The ACLs of a removed user are no longer reported.
+            user.remove()
+            user = None
+            acls = self.sess.acls.get_many(targets)
+            self.assertFalse(
+                any(
+                    acl.user_name == "acls_get_many_user"
+                    for target_acls in acls.values()
+                    for acl in target_acls
+                )
+            )
+        finally:
+            if user is not None:
+                user.remove()
+
+    def test_acls_get_many_sees_group_changes_through_cache(self):
+        obj = helpers.make_object(self.sess, self.coll_path + "/acls_cached_group")
+        group = None
+        try:
+            group = self.sess.groups.create("acls_cached_group")
+            self.sess.acls.set(iRODSAccess("read", obj.path, group.name))
+            group_acls = lambda: [
+                acl
+                for acl in self.sess.acls.get_many([obj])[obj.path]
+                if acl.user_name == "acls_cached_group"
+            ]
+            self.assertEqual(len(group_acls()), 1)
+            # Changes to memberships, and the removal of the group, drop the cached lookups.
+            self.assertGreater(len(self.sess.user_cache), 0)
+            group.addmember(self.sess.username)
+            self.assertEqual(len(self.sess.user_cache), 0)
+            group.removemember(self.sess.username)
+            group_acls()
+            group.remove()
+            group = None
+            self.assertEqual(group_acls(), [])
+        finally:
+            if group is not None:
+                group.remove()
+            obj.unlink(force=True)
+
+    def test_acls_get_many_looks_up_users_once(self):
+        obj = helpers.make_object(self.sess, self.coll_path + "/acls_users_once")
+        lookups = []
+        real_users_by_ids = access_manager.users_by_ids
+
+        def counting_users_by_ids(session, ids=()):
+            lookups.append(list(ids))
+            return real_users_by_ids(session, ids)
+
+        access_manager.users_by_ids = counting_users_by_ids
+        try:
+            self.sess.user_cache.clear()
+            first = self.sess.acls.get_many([obj])[obj.path]
+            self.assertEqual(len(lookups), 1)
+            # The users named are found in the session's user cache, with no query.
+            second = self.sess.acls.get_many([obj])[obj.path]
+            self.assertEqual(len(lookups), 1)
+            self.assertEqual(set(first), set(second))
+        finally:
+            access_manager.users_by_ids = real_users_by_ids
+            obj.unlink(force=True)
+
+    def test_acls_walk_and_export(self):
+        sub = helpers.make_collection(self.sess, self.coll_path + "/acls_walk_sub")
+        data = [
+            helpers.make_object(self.sess, path)
+            for path in (self.coll_path + "/acls_walk_0", sub.path + "/acls_walk_1")
+        ]
+        self.sess.acls.set(iRODSAccess("read", data[1].path, "public"))
+        targets = [self.coll, sub] + data
+        records = dict(self.sess.acls.walk(self.coll_path))
+        self.assertEqual(set(records), set(t.path for t in targets))
+        for target in targets:
+            self.assertEqual(
+                set(records[target.path]), set(self.sess.acls.get(target))
+            )
+
+        csv_file = io.StringIO()
+        self.assertEqual(self.sess.acls.export(self.coll_path, csv_file), len(targets))
+        csv_rows = list(csv.DictReader(io.StringIO(csv_file.getvalue())))
+        self.assertIn(
+            ("data_object", data[1].path, "public"),
+            [(r["type"], r["path"], r["user_name"]) for r in csv_rows],
+        )
+        jsonl_file = io.StringIO()
+        self.sess.acls.export(self.coll_path, jsonl_file, format="jsonl")
+        jsonl_records = [
+            json.loads(line) for line in jsonl_file.getvalue().splitlines()
+        ]
+        self.assertEqual(
+            sorted(r["path"] for r in jsonl_records), sorted(t.path for t in targets)
+        )
+        self.assertEqual(len(csv_rows), sum(len(r["acls"]) for r in jsonl_records))
+
     def test_iRODSAccess_can_be_constructed_using_iRODSCollection__issue_558(self):
         user_name = "testuser"
         collection_path = "/".join(
@@ -265,6 +265,95 @@ class TestCollection(unittest.TestCase):
         with self.assertRaises(StopIteration):
             next(colls)
 
+    def test_bulk_walk_matches_walk(self):
+        # An underscore in a name is a LIKE wildcard; a sibling it matches must be excluded.
+        helpers.make_collection(self.sess, self.test_coll_path + "/a_b/c/d", ["x", "y"])
+        helpers.make_collection(self.sess, self.test_coll_path + "/a_b/e", ["z"])
+        helpers.make_collection(self.sess, self.test_coll_path + "/aXb", ["w"])
+        helpers.make_collection(self.sess, self.test_coll_path + "/a_bc", ["v"])
+        root = self.sess.collections.get(self.test_coll_path + "/a_b")
+
+        def listing(walk):
+            return [
+                (
+                    coll.path,
+                    sorted(sub.path for sub in subs),
+                    sorted((obj.path, len(obj.replicas)) for obj in objs),
+                )
+                for coll, subs, objs in walk
+            ]
+
+        for topdown in (True, False):
+            expected = listing(root.walk(topdown))
+            actual = listing(root.walk(topdown, bulk=True))
+            self.assertEqual(sorted(actual), sorted(expected))
+            self.assertEqual(len(actual), 4)
+            self.assertEqual(actual[0 if topdown else -1][0], root.path)
+
+    def test_parallel_walk_matches_walk(self):
+        for i in range(6):
+            for j in range(3):
+                helpers.make_collection(
+                    self.sess,
+                    "{}/s{}/t{}".format(self.test_coll_path, i, j),
+                    ["foo", "bar"],
+                )
+
+        def listing(walk):
+            return [
+                (
+                    coll.path,
+                    [sub.path for sub in subs],
+                    [(obj.path, len(obj.replicas)) for obj in objs],
+                )
+                for coll, subs, objs in walk
+            ]
+
+        for topdown in (True, False):
+            self.assertEqual(
+                listing(self.test_coll.walk(topdown, parallel=4)),
+                listing(self.test_coll.walk(topdown)),
+            )
+
+        # Subcollections removed by the caller are not walked.
+        walk = self.test_coll.walk(parallel=2)
+        _, subcollections, _ = next(walk)
+        del subcollections[1:]
+        self.assertEqual(len(list(walk)), 4)
+
+    def test_walk_with_metadata(self):
+        for i in range(2):
+            coll = helpers.make_collection(
+                self.sess,
+                "{}/m{}".format(self.test_coll_path, i),
+                ["foo", "bar", "baz"],
+            )
+            for obj in coll.data_objects:
+                if obj.name != "baz":
+                    obj.metadata.add("walked", obj.path)
+                    obj.metadata.add("name", obj.name, "units")
+
+        def listing(walk):
+            return [
+                (
+                    obj.path,
+                    sorted((m.name, m.value, m.units) for m in obj.metadata.items()),
+                )
+                for _, _, objs in walk
+                for obj in objs
+            ]
+
+        expected = listing(self.test_coll.walk())
+        self.assertEqual(len(expected), 6)
+        for options in ({}, {"bulk": True}, {"parallel": 2}):
+            self.assertEqual(
+                listing(self.test_coll.walk(with_metadata=True, **options)), expected
+            )
+        objs = self.sess.collections.get(
+            self.test_coll_path + "/m0"
+        ).list_data_objects(with_metadata=True)
+        self.assertEqual(sorted(len(obj.metadata.items()) for obj in objs), [0, 2, 2])
+
     def test_collection_metadata(self):
         self.assertIsInstance(self.test_coll.metadata, iRODSMetaCollection)
 
@@ -13,11 +13,13 @@ import logging
 import os
 import random
 import re
+import shutil
 import socket
 import stat
 import string
 import sys
 import subprocess
+import tarfile
 import threading
 import time
 import unittest
@@ -50,6 +52,7 @@ def is_localhost_synonym(name):
 
 
 from irods.access import iRODSAccess
+from irods.catalog_cache import CatalogCache
 from irods.models import Collection, DataObject
 from irods.test.helpers import iRODSUserLogins
 import irods.exception as ex
@@ -231,6 +234,21 @@ class TestDataObjOps(unittest.TestCase):
                 fp.truncate()
             return helpers.make_session()
 
+    def test_write_and_read_memoryviews(self):
+        path = "{}/{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        with self.sess.data_objects.open(path, "w") as f:
+            f.raw.write(memoryview(b"0123456789"))
+            # A view that is not contiguous is copied before being sent.
+            f.raw.write(memoryview(b"abcdef")[::2])
+            f.raw.write(memoryview(bytearray(b"xy" * 4)).cast("B", (2, 4)))
+        with self.sess.data_objects.open(path, "r") as f:
+            self.assertEqual(f.read(), b"0123456789acexyxyxyxy")
+            f.seek(0)
+            self.assertIs(type(f.read(4)), bytes)
+        self.sess.data_objects.unlink(path, force=True)
+
     def test_data_write_stales_other_repls__ref_irods_5548(self):
         test_data = "irods_5548_testfile"
         test_coll = "/{0.zone}/home/{0.username}".format(self.sess)
@@ -2767,6 +2785,351 @@ class TestDataObjOps(unittest.TestCase):
             if logical_path and Data.exists(logical_path):
                 Data.unlink(logical_path, force=True)
 
+    def test_parallel_transfers_share_bounded_worker_pool(self):
+        POOL_SIZE = 4
+        FILE_LENGTH = data_object_manager.MAXIMUM_SINGLE_THREADED_TRANSFER_SIZE + 1
+        worker_names = set()
+        lock = threading.Lock()
+
+        def record_worker(n):
+            with lock:
+                worker_names.add(threading.current_thread().name)
+
+        with config.loadlines(
+            entries=[
+                dict(setting="data_objects.transfer_thread_pool_size", value=POOL_SIZE)
+            ]
+        ), NamedTemporaryFile() as f:
+            f.write(b"_" * FILE_LENGTH)
+            f.flush()
+            logical_paths = [
+                "{}/shared_pool_{}.dat".format(self.coll_path, i) for i in range(3)
+            ]
+            with concurrent.futures.ThreadPoolExecutor(3) as callers:
+                for _ in (1, 2):  # a second round of puts must reuse the same threads
+                    list(
+                        callers.map(
+                            lambda path: self.sess.data_objects.put(
+                                f.name, path, num_threads=3, updatables=record_worker
+                            ),
+                            logical_paths,
+                        )
+                    )
+            for path in logical_paths:
+                self.assertEqual(self.sess.data_objects.get(path).size, FILE_LENGTH)
+            self.assertLessEqual(len(worker_names), POOL_SIZE)
+            self.assertTrue(all(n.startswith("irods_transfer") for n in worker_names))
+
+    def test_parallel_transfer_in_small_chunks(self):
+        CHUNK_SIZE = MEBI
+        FILE_LENGTH = 7 * MEBI + 12345
+        logical_path = "{}/chunked_{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        LOG = io.StringIO()
+        with NamedTemporaryFile() as f, helpers.enableLogging(
+            logging.getLogger("irods.parallel"),
+            logging.StreamHandler,
+            (LOG,),
+            level_=logging.INFO,
+        ):
+            content = os.urandom(FILE_LENGTH)
+            f.write(content)
+            f.flush()
+            for operation, local_file in (
+                (irods.parallel.Oper.PUT, f.name),
+                (irods.parallel.Oper.GET, f.name + ".get"),
+            ):
+                self.assertTrue(
+                    irods.parallel.io_main(
+                        self.sess,
+                        logical_path,
+                        operation,
+                        local_file,
+                        num_threads=3,
+                        total_bytes=FILE_LENGTH,
+                        chunk_size=CHUNK_SIZE,
+                    )
+                )
+            try:
+                with open(f.name + ".get", "rb") as g:
+                    self.assertEqual(g.read(), content)
+            finally:
+                os.unlink(f.name + ".get")
+        self.assertIn("num_chunks = 8", LOG.getvalue())
+        self.assertEqual(self.sess.data_objects.get(logical_path).size, FILE_LENGTH)
+
+    def test_small_objects_are_transferred_in_a_single_call(self):
+        logical_path = "{}/{}.dat".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        content = os.urandom(12345)
+
+        def no_open(*args, **kwargs):
+            raise AssertionError("data object should not be opened")
+
+        with NamedTemporaryFile() as f, config.loadlines(
+            entries=[dict(setting="data_objects.single_buffer_put", value=True)]
+        ):
+            f.write(content)
+            f.flush()
+            with helpers.temporarily_assign_attribute(
+                self.sess.data_objects, "open", no_open
+            ):
+                self.sess.data_objects.put(f.name, logical_path)
+                # A second put overwrites the data object only when forced, as for iput.
+                with self.assertRaises(ex.OVERWRITE_WITHOUT_FORCE_FLAG):
+                    self.sess.data_objects.put(f.name, logical_path)
+                self.sess.data_objects.put(
+                    f.name, logical_path, **{kw.FORCE_FLAG_KW: ""}
+                )
+                data_obj = self.sess.data_objects.get(
+                    logical_path, f.name + ".get", **{kw.FORCE_FLAG_KW: ""}
+                )
+            try:
+                with open(f.name + ".get", "rb") as g:
+                    self.assertEqual(g.read(), content)
+            finally:
+                os.unlink(f.name + ".get")
+        self.assertEqual(data_obj.size, len(content))
+        self.assertEqual(len(data_obj.replicas), 1)
+
+    def test_get_many_data_objects(self):
+        base = "{}/get_many_{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        paths = []
+        for i in range(4):
+            self.sess.collections.create("{}/c{}".format(base, i))
+            for j in range(3):
+                paths.append("{}/c{}/obj_{}".format(base, i, j))
+                self.sess.data_objects.create(paths[-1])
+        missing = ["{}/c0/no_such_object".format(base), "{}/c9/obj_0".format(base)]
+        with config.loadlines(
+            entries=[dict(setting="genquery.in_filter_max_values", value=5)]
+        ):
+            objects = self.sess.data_objects.get_many(paths + missing)
+        self.assertEqual(set(objects), set(paths + missing))
+        for path in missing:
+            self.assertIsNone(objects[path])
+        for path in paths:
+            obj = objects[path]
+            expected = self.sess.data_objects.get(path)
+            self.assertEqual((obj.path, obj.id), (expected.path, expected.id))
+            self.assertEqual(obj.collection.path, expected.collection.path)
+            self.assertEqual(
+                [r.resource_name for r in obj.replicas],
+                [r.resource_name for r in expected.replicas],
+            )
+
+    def test_catalog_cache_is_invalidated_by_session_changes(self):
+        path = "{}/{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        moved_path = path + "_moved"
+        self.sess.catalog_cache = CatalogCache(max_size=100, ttl=-1)
+        try:
+            self.assertFalse(self.sess.data_objects.exists(path))
+            self.assertFalse(self.sess.data_objects.exists(path))
+            self.assertGreater(self.sess.catalog_cache.stats().hits, 0)
+            self.sess.data_objects.create(path)
+            self.assertTrue(self.sess.data_objects.exists(path))
+
+            with self.sess.data_objects.open(path, "w") as f:
+                f.write(b"12345")
+            self.assertEqual(self.sess.data_objects.get(path).size, 5)
+
+            # Rows looked up (and cached) while a handle is open for writing are out of
+            # date once it is closed.
+            with self.sess.data_objects.open(path, "a") as f:
+                f.write(b"678")
+                self.assertEqual(self.sess.data_objects.get(path).size, 5)
+            self.assertEqual(self.sess.data_objects.get(path).size, 8)
+
+            obj = self.sess.data_objects.get(path)
+            obj.metadata.add("a", "1")
+            self.assertEqual(
+                [avu.name for avu in self.sess.data_objects.get(path).metadata.items()],
+                ["a"],
+            )
+
+            self.sess.data_objects.move(path, moved_path)
+            self.assertFalse(self.sess.data_objects.exists(path))
+            self.assertTrue(self.sess.data_objects.exists(moved_path))
+            self.sess.data_objects.unlink(moved_path, force=True)
+            self.assertFalse(self.sess.data_objects.exists(moved_path))
+            self.assertGreater(self.sess.catalog_cache.stats().invalidations, 0)
+        finally:
+            self.sess.catalog_cache = CatalogCache()
+            for p in (path, moved_path):
+                if self.sess.data_objects.exists(p):
+                    self.sess.data_objects.unlink(p, force=True)
+
+    def test_put_many_bundles_stay_within_size_limit(self):
+        FILE_SIZE = 4000
+        # A tar stream is written in whole records, and ends with two zero blocks.  Two
+        # records leave room for three members with their overhead, but not a fourth.
+        bundle_size = 2 * tarfile.RECORDSIZE
+        local_dir = mktemp()
+        helpers.make_flat_test_dir(local_dir, file_count=8, file_size=FILE_SIZE)
+        bundles = []
+
+        def record_bundle(collection, members, updatables, options):
+            bundles.append(members)
+            return [collection + "/" + name for _, name, _ in members]
+
+        try:
+            with config.loadlines(
+                entries=[
+                    dict(
+                        setting="data_objects.bulk_put_bundle_size", value=bundle_size
+                    )
+                ]
+            ), helpers.temporarily_assign_attribute(
+                self.sess.data_objects, "_put_bundle", record_bundle
+            ):
+                self.sess.data_objects.put_many(
+                    (os.path.join(local_dir, name), self.coll_path + "/" + name)
+                    for name in sorted(os.listdir(local_dir))
+                )
+            self.assertEqual([len(members) for members in bundles], [3, 3, 2])
+            for members in bundles:
+                stream = io.BytesIO()
+                with tarfile.open(fileobj=stream, mode="w|") as tar:
+                    for local_path, name, _ in members:
+                        tar.add(local_path, arcname=name, recursive=False)
+                self.assertLessEqual(len(stream.getvalue()), bundle_size)
+        finally:
+            shutil.rmtree(local_dir)
+
+    def test_put_many_recovers_from_a_partial_extraction(self):
+        local_dir = mktemp()
+        helpers.make_flat_test_dir(local_dir, file_count=6, file_size=100)
+        names = sorted(os.listdir(local_dir))
+        # Without the force flag, the bundle's extraction stops at a data object already
+        # present; the files are then put individually, whether or not already registered.
+        obj = self.sess.data_objects.create(self.coll_path + "/" + names[3])
+        with obj.open("w") as o:
+            o.write(b"stale")
+        try:
+            uploaded = self.sess.data_objects.put_many(
+                (os.path.join(local_dir, name), self.coll_path + "/" + name)
+                for name in names
+            )
+            self.assertEqual(len(uploaded), len(names))
+            for name, logical_path in zip(names, uploaded):
+                with open(os.path.join(local_dir, name), "rb") as f:
+                    with self.sess.data_objects.open(logical_path, "r") as d:
+                        self.assertEqual(d.read(), f.read())
+        finally:
+            shutil.rmtree(local_dir)
+
+    def test_put_directory_bundles_small_files(self):
+        local_dir = mktemp()
+        helpers.make_flat_test_dir(local_dir, file_count=25, file_size=1024)
+        helpers.make_flat_test_dir(
+            os.path.join(local_dir, "sub"), file_count=5, file_size=4096
+        )
+        with open(os.path.join(local_dir, "large.dat"), "wb") as f:
+            f.write(os.urandom(MEBI + 1))
+        target = "{}/bulk_{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        try:
+            with config.loadlines(
+                entries=[
+                    dict(setting="data_objects.bulk_put_file_size_threshold", value=MEBI),
+                    dict(setting="data_objects.bulk_put_bundle_max_files", value=10),
+                ]
+            ):
+                uploaded = self.sess.data_objects.put_directory(local_dir, target)
+            self.assertEqual(len(uploaded), 31)
+            for logical_path in uploaded:
+                relative_path = logical_path[len(target) + 1 :]
+                with open(os.path.join(local_dir, *relative_path.split("/")), "rb") as f:
+                    with self.sess.data_objects.open(logical_path, "r") as d:
+                        self.assertEqual(d.read(), f.read())
+            # No temporary bundles are left behind.
+            coll = self.sess.collections.get(target)
+            self.assertEqual(len(coll.data_objects), 26)
+            self.assertEqual(len(coll.subcollections[0].data_objects), 5)
+        finally:
+            shutil.rmtree(local_dir)
+
+    def test_interrupted_parallel_transfers_resume_from_journal(self):
+        CHUNK_SIZE = MEBI
+        FILE_LENGTH = 6 * MEBI + 321
+        logical_path = "{}/resumed_{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        real_copy_bytes = irods.parallel._copy_bytes
+        calls = []
+
+        def interrupted_copy_bytes(*args, **kwargs):
+            calls.append(None)
+            if len(calls) == 3:
+                raise RuntimeError("simulated interruption")
+            return real_copy_bytes(*args, **kwargs)
+
+        with NamedTemporaryFile() as f:
+            content = os.urandom(FILE_LENGTH)
+            f.write(content)
+            f.flush()
+            for operation, local_file in (
+                (irods.parallel.Oper.PUT, f.name),
+                (irods.parallel.Oper.GET, f.name + ".get"),
+            ):
+                journal = local_file + irods.parallel.JOURNAL_SUFFIX
+                transfer = lambda: irods.parallel.io_main(
+                    self.sess,
+                    logical_path,
+                    operation,
+                    local_file,
+                    num_threads=2,
+                    total_bytes=FILE_LENGTH,
+                    chunk_size=CHUNK_SIZE,
+                    resume=True,
+                )
+                del calls[:]
+                irods.parallel._copy_bytes = interrupted_copy_bytes
+                try:
+                    with self.assertRaises(RuntimeError):
+                        transfer()
+                finally:
+                    irods.parallel._copy_bytes = real_copy_bytes
+                self.assertTrue(os.path.exists(journal))
+                self.assertTrue(transfer())
+                self.assertFalse(os.path.exists(journal))
+            try:
+                with open(f.name + ".get", "rb") as g:
+                    self.assertEqual(g.read(), content)
+            finally:
+                os.unlink(f.name + ".get")
+        self.assertEqual(self.sess.data_objects.get(logical_path).size, FILE_LENGTH)
+
+    def test_get_does_not_resume_from_journal_of_another_transfer(self):
+        logical_path = "{}/{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        with NamedTemporaryFile() as f:
+            f.write(b"new content")
+            f.flush()
+            self.sess.data_objects.put(f.name, logical_path)
+            journal = f.name + irods.parallel.JOURNAL_SUFFIX
+            try:
+                # A journal left by a transfer of some other data object.
+                with open(journal, "w") as j:
+                    json.dump(
+                        {"identity": {"logical_path": "/elsewhere"}, "completed": []},
+                        j,
+                    )
+                with self.assertRaises(ex.OVERWRITE_WITHOUT_FORCE_FLAG):
+                    self.sess.data_objects.get(logical_path, f.name, resume=True)
+                with open(f.name, "rb") as g:
+                    self.assertEqual(g.read(), b"new content")
+            finally:
+                os.unlink(journal)
+
     def test_mock_progress_bar_for_parallel_io__issue_574(self):
 
         # Simulated progress bar in the style of TQDM
@@ -2888,6 +3251,36 @@ class TestDataObjOps(unittest.TestCase):
                             if self.sess.data_objects.exists(path):
                                 self.sess.data_objects.unlink(path, force=True)
 
+    def test_redirected_sessions_are_cached_and_reused(self):
+        self._skip_unless_connected_to_local_computer_by_other_than_localhost_synonym()
+        data_path = "{}/redirect_cache_{}".format(
+            self.coll_path, unique_name(my_function_name(), datetime.now())
+        )
+        with config.loadlines(
+            entries=[dict(setting="data_objects.allow_redirect", value=True)]
+        ):
+            with self.create_simple_resc(hostname="localhost") as resc_name:
+                try:
+                    redirected_sessions = []
+                    for _ in range(3):
+                        with self.sess.data_objects.open(
+                            data_path, "a", **{kw.RESC_NAME_KW: resc_name}
+                        ) as d:
+                            d.write(b"_")
+                            redirected_sessions.append(d.raw.session)
+                    self.assertIsNot(redirected_sessions[0], self.sess)
+                    # All opens after the first should reuse the cached session.
+                    self.assertEqual(len(set(map(id, redirected_sessions))), 1)
+                    stats = self.sess.redirect_sessions.stats()
+                    self.assertEqual((stats.misses, stats.hits, stats.size), (1, 2, 1))
+                    # The session's warm connection is kept for the next open.
+                    self.assertEqual(len(redirected_sessions[0].pool.idle), 1)
+                finally:
+                    if self.sess.data_objects.exists(data_path):
+                        self.sess.data_objects.unlink(data_path, force=True)
+                    self.sess.cleanup()
+                    self.assertEqual(len(self.sess.redirect_sessions), 0)
+
     def test_replica_truncate__issue_534(self):
         sess = self.sess
         data_objs = self.sess.data_objects
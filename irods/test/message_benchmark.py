@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""Microbenchmarks for the iRODS protocol message layer.
+
+Run as:  python -m irods.test.message_benchmark [number_of_iterations]
+"""
+
+import struct
+import sys
+import timeit
+
+import irods.message
+from irods.message import (
+    iRODSMessage,
+    XML_Parser_Type,
+    GenQueryResponse,
+    OpenedDataObjRequest,
+    StringStringMap,
+)
+
+SERVER_HEADER = (
+    b"<MsgHeader_PI>\n"
+    b"<type>RODS_API_REPLY</type>\n"
+    b"<msgLen>0</msgLen>\n"
+    b"<errorLen>0</errorLen>\n"
+    b"<bsLen>4194304</bsLen>\n"
+    b"<intInfo>4194304</intInfo>\n"
+    b"</MsgHeader_PI>\n"
+)
+
+
+def _xml_header_decode(parser_module):
+    def decode(rsp_header):
+        xml_root = parser_module.fromstring(rsp_header)
+        return (
+            xml_root.find("type").text,
+            int(xml_root.find("msgLen").text),
+            int(xml_root.find("errorLen").text),
+            int(xml_root.find("bsLen").text),
+            int(xml_root.find("intInfo").text),
+        )
+
+    return decode
+
+
+def _format_header_encode(type, msg_len, err_len, bs_len, int_info):
+    msg_header = (
+        "<MsgHeader_PI>"
+        "<type>{}</type>"
+        "<msgLen>{}</msgLen>"
+        "<errorLen>{}</errorLen>"
+        "<bsLen>{}</bsLen>"
+        "<intInfo>{}</intInfo>"
+        "</MsgHeader_PI>"
+    ).format(type, msg_len, err_len, bs_len, int_info)
+    msg_header = msg_header.encode("utf-8")
+    return struct.pack(">i", len(msg_header)) + msg_header
+
+
+def _report(title, timings, number):
+    print(title)
+    fastest = min(timings.values())
+    for name, seconds in timings.items():
+        print(
+            "    {:<24} {:>9.2f} us/op  {:>6.1f}x".format(
+                name, seconds / number * 1e6, seconds / fastest
+            )
+        )
+
+
+def _best_of(repeat, function, number):
+    return min(timeit.repeat(function, number=number, repeat=repeat))
+
+
+def benchmark_header(number=20000):
+    """Compare the MsgHeader_PI codec with the general XML parsers and with string formatting."""
+    decoders = {"unpack_header": iRODSMessage.unpack_header}
+    for parser_type in (
+        XML_Parser_Type.STANDARD_XML,
+        XML_Parser_Type.QUASI_XML,
+        XML_Parser_Type.SECURE_XML,
+    ):
+        decoders[parser_type.name] = _xml_header_decode(
+            irods.message._XML_parsers[parser_type]
+        )
+    expected = decoders["unpack_header"](SERVER_HEADER)
+    timings = {}
+    for name, decode in decoders.items():
+        assert decode(SERVER_HEADER) == expected, name
+        timings[name] = timeit.timeit(lambda: decode(SERVER_HEADER), number=number)
+    _report("MsgHeader_PI decode:", timings, number)
+
+    args = ("RODS_API_REQ", 312, 0, 4194304, 676)
+    assert iRODSMessage.pack_header(*args) == _format_header_encode(*args)
+    timings = {
+        "pack_header": timeit.timeit(
+            lambda: iRODSMessage.pack_header(*args), number=number
+        ),
+        "str.format": timeit.timeit(
+            lambda: _format_header_encode(*args), number=number
+        ),
+    }
+    _report("MsgHeader_PI encode:", timings, number)
+
+
+def _generic_pack(message):
+    """Pack by dispatching through each property's pack(), as Message.pack did before specializing."""
+    values = ["<%s>" % message._name]
+    for name, prop in message._ordered_properties:
+        if name in message._values:
+            values.append(prop.pack(message._values[name]))
+    values.append("</%s>" % message._name)
+    return "".join(values)
+
+
+def _generic_unpack(message, root):
+    for name, prop in message._ordered_properties:
+        message._values[name] = prop.unpack(root.findall(name))
+
+
+def benchmark_message(number=20000):
+    """Compare the per-class pack()/unpack() with generic property dispatch, for a read/write request."""
+    request = OpenedDataObjRequest(
+        l1descInx=3,
+        len=4194304,
+        whence=0,
+        oprType=0,
+        offset=0,
+        bytesWritten=0,
+        KeyValPair_PI=StringStringMap(),
+    )
+    assert request.pack() == _generic_pack(request)
+    timings = {
+        "Message.pack": _best_of(5, request.pack, number),
+        "generic": _best_of(5, lambda: _generic_pack(request), number),
+    }
+    _report("OpenedDataObjInp_PI pack:", timings, number)
+
+    parser = irods.message._XML_parsers[XML_Parser_Type.STANDARD_XML]
+    root = parser.fromstring(request.pack())
+    timings = {
+        "Message.unpack": _best_of(
+            5, lambda: OpenedDataObjRequest().unpack(root), number
+        ),
+        "generic": _best_of(
+            5, lambda: _generic_unpack(OpenedDataObjRequest(), root), number
+        ),
+    }
+    _report("OpenedDataObjInp_PI unpack:", timings, number)
+
+
+def genquery_response(rows):
+    """Return a GenQueryOut_PI, formatted as by the server, for a query of `rows' data objects."""
+    columns = [
+        (403, lambda i: "file_{:06d}.dat".format(i)),  # DATA_NAME
+        (401, lambda i: str(10000 + i)),  # D_DATA_ID
+        (407, lambda i: str(i * 1024)),  # DATA_SIZE
+        (501, lambda i: "/tempZone/home/alice/project/run_{}".format(i % 100)),  # COLL_NAME
+        (420, lambda i: "0{:010d}".format(1700000000 + i)),  # D_MODIFY_TIME
+    ]
+    parts = [
+        "<GenQueryOut_PI>\n<rowCnt>{}</rowCnt>\n<attriCnt>{}</attriCnt>\n"
+        "<continueInx>0</continueInx>\n<totalRowCount>0</totalRowCount>\n".format(
+            rows, len(columns)
+        )
+    ]
+    for attribute_index, value in columns:
+        parts.append(
+            "<SqlResult_PI>\n<attriInx>{}</attriInx>\n<reslen>1088</reslen>\n".format(
+                attribute_index
+            )
+        )
+        parts.extend("<value>{}</value>\n".format(value(i)) for i in range(rows))
+        parts.append("</SqlResult_PI>\n")
+    parts.append("</GenQueryOut_PI>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def benchmark_genquery_response(row_counts=(1000, 10000, 50000), number=3):
+    """Time parsing (and unpacking into GenQueryResponse) of large query results with each XML parser.
+
+    The time per row should be roughly independent of the number of rows.
+    """
+    for rows in row_counts:
+        payload = genquery_response(rows)
+        timings = {}
+        for parser_type in (XML_Parser_Type.STANDARD_XML, XML_Parser_Type.QUASI_XML):
+            parser = irods.message._XML_parsers[parser_type]
+
+            def parse():
+                response = GenQueryResponse()
+                response.unpack(parser.fromstring(payload))
+                return response
+
+            assert parse().rowCnt == rows
+            timings[parser_type.name] = timeit.timeit(parse, number=number) / rows
+        _report(
+            "GenQueryOut_PI of {} rows ({} bytes), per row:".format(rows, len(payload)),
+            timings,
+            number,
+        )
+
+
+if __name__ == "__main__":
+    number = [int(arg) for arg in sys.argv[1:2]]
+    benchmark_header(*number)
+    benchmark_message(*number)
+    benchmark_genquery_response()
@@ -1,14 +1,17 @@
 #!/usr/bin/env python
 
 import os
+import socket
+import struct
 import sys
+import threading
 import unittest
 
 # this does not get called when imported from  runner.py
 if __name__ == "__main__":
     sys.path.insert(0, os.path.abspath("../.."))
 
-from irods.message import ET
+from irods.message import ET, iRODSMessage, _send_message_parts
 
 # from base64 import b64encode, b64decode
 from irods.message import (
@@ -20,6 +23,16 @@ from irods.message import (
     GenQueryRequest,
     GenQueryResponseColumn,
     GenQueryResponse,
+    StructFileExtAndRegRequest,
+    OpenedDataObjRequest,
+)
+from irods.message.property_types import (
+    ArrayProperty,
+    BinaryProperty,
+    IntegerProperty,
+    LongProperty,
+    StringProperty,
+    SubmessageProperty,
 )
 
 
@@ -206,6 +219,152 @@ class TestMessages(unittest.TestCase):
         self.assertEqual(gqo2.rowCnt, 2)
         self.assertEqual(gqo2.pack(), expected)
 
+    def test_struct_file_ext_and_reg_inp(self):
+        req = StructFileExtAndRegRequest(
+            objPath="/tempZone/home/rods/coll/bundle.tar",
+            collection="/tempZone/home/rods/coll",
+            oprType=0,
+            flags=0,
+            KeyValPair_PI=StringStringMap({"dataType": "tar", "bulkOpr": ""}),
+        )
+        expected = "<StructFileExtAndRegInp_PI><objPath>/tempZone/home/rods/coll/bundle.tar</objPath>\
+<collection>/tempZone/home/rods/coll</collection><oprType>0</oprType><flags>0</flags>\
+<KeyValPair_PI><ssLen>2</ssLen><keyWord>dataType</keyWord><keyWord>bulkOpr</keyWord>\
+<svalue>tar</svalue><svalue></svalue></KeyValPair_PI></StructFileExtAndRegInp_PI>"
+        self.assertEqual(req.pack(), expected)
+
+        req2 = StructFileExtAndRegRequest()
+        req2.unpack(ET().fromstring(expected))
+        self.assertEqual(req2.objPath, "/tempZone/home/rods/coll/bundle.tar")
+        self.assertEqual(req2.collection, "/tempZone/home/rods/coll")
+        self.assertEqual(req2.KeyValPair_PI.keyWord, ["dataType", "bulkOpr"])
+
+    def test_opened_data_obj_inp(self):
+        from irods.message import quasixml
+
+        req = OpenedDataObjRequest(
+            l1descInx=3,
+            len=4194304,
+            whence=0,
+            oprType=0,
+            offset=2**40,
+            bytesWritten=0,
+            KeyValPair_PI=StringStringMap({"a&b": "<c>"}),
+        )
+        expected = "<OpenedDataObjInp_PI><l1descInx>3</l1descInx><len>4194304</len>\
+<whence>0</whence><oprType>0</oprType><offset>1099511627776</offset><bytesWritten>0</bytesWritten>\
+<KeyValPair_PI><ssLen>1</ssLen><keyWord>a&amp;b</keyWord><svalue>&lt;c&gt;</svalue>\
+</KeyValPair_PI></OpenedDataObjInp_PI>"
+        self.assertEqual(req.pack(), expected)
+
+        # Values not assigned are not packed.
+        self.assertEqual(
+            OpenedDataObjRequest(l1descInx=3).pack(),
+            "<OpenedDataObjInp_PI><l1descInx>3</l1descInx></OpenedDataObjInp_PI>",
+        )
+
+        for parser in (ET().fromstring, quasixml.fromstring):
+            req2 = OpenedDataObjRequest()
+            req2.unpack(parser(expected))
+            self.assertEqual(req2.offset, 2**40)
+            self.assertEqual(req2.KeyValPair_PI.keyWord, ["a&b"])
+            self.assertEqual(req2.KeyValPair_PI.svalue, ["<c>"])
+            self.assertEqual(req2.pack(), expected)
+
+    def test_quasi_xml_parser_on_large_query_response(self):
+        from irods.message import quasixml, XML_Parser_Type, _XML_parsers
+        from irods.test.message_benchmark import genquery_response
+
+        payload = genquery_response(5000)
+        responses = []
+        for parser_type in (XML_Parser_Type.STANDARD_XML, XML_Parser_Type.QUASI_XML):
+            response = GenQueryResponse()
+            response.unpack(_XML_parsers[parser_type].fromstring(payload))
+            responses.append(response)
+        self.assertEqual(responses[0].pack(), responses[1].pack())
+        self.assertEqual(responses[1].SqlResult_PI[0].value[4999], "file_004999.dat")
+
+        # Whitespace is kept within character data, but not between elements.
+        elem = quasixml.fromstring(b" <a>\n <b> x &amp; y </b>\n<c></c> </a> ")
+        self.assertEqual(elem.find("b").text, " x & y ")
+        self.assertIsNone(elem.find("c").text)
+        with self.assertRaises(quasixml.QuasiXmlParseError):
+            quasixml.fromstring(b"<a><b>x</a>")
+
+    def test_msg_header_codec(self):
+        packed = iRODSMessage.pack_header("RODS_API_REQ", 312, 0, 4096, -808000)
+        expected = b"<MsgHeader_PI><type>RODS_API_REQ</type><msgLen>312</msgLen>\
+<errorLen>0</errorLen><bsLen>4096</bsLen><intInfo>-808000</intInfo></MsgHeader_PI>"
+        self.assertEqual(packed, struct.pack(">i", len(expected)) + expected)
+        self.assertEqual(
+            iRODSMessage.unpack_header(expected),
+            ("RODS_API_REQ", 312, 0, 4096, -808000),
+        )
+        # as formatted by the server
+        self.assertEqual(
+            iRODSMessage.unpack_header(
+                b"<MsgHeader_PI>\n<type>RODS_API_REPLY</type>\n<msgLen>0</msgLen>\n"
+                b"<errorLen>0</errorLen>\n<bsLen>0</bsLen>\n<intInfo>7</intInfo>\n</MsgHeader_PI>\n"
+            ),
+            ("RODS_API_REPLY", 0, 0, 0, 7),
+        )
+        # character entities are left to the XML parser
+        self.assertEqual(
+            iRODSMessage.unpack_header(expected.replace(b"API_REQ", b"&lt;x&gt;"))[0],
+            "RODS_<x>",
+        )
+
+    def test_property_packers_agree_with_pack_and_unpack(self):
+        kvp = StringStringMap({"a": "b & c"})
+        cases = [
+            (IntegerProperty(), [0, -7, 2**31 - 1]),
+            (LongProperty(), [0, 2**40]),
+            (StringProperty(), ["plain", "<a & 'b'>", b"bytes & more", 42]),
+            (BinaryProperty(), [b"\x00\xff binary", "text"]),
+            (ArrayProperty(IntegerProperty()), [[], [1, 2, 3]]),
+            (ArrayProperty(StringProperty()), [["x < y", "z"]]),
+            (SubmessageProperty(StringStringMap), [kvp]),
+        ]
+        for prop, values in cases:
+            prop.dub("field")
+            pack, unpack = prop.packer(), prop.unpacker()
+            for value in values:
+                packed = prop.pack(value)
+                self.assertEqual(pack(value), packed)
+                els = list(ET().fromstring("<r>" + packed + "</r>"))
+                unpacked = prop.unpack(els)
+                if isinstance(unpacked, StringStringMap):
+                    self.assertEqual(unpack(els).pack(), unpacked.pack())
+                else:
+                    self.assertEqual(unpack(els), unpacked)
+
+    def test_message_parts_round_trip_through_socket(self):
+        payload = os.urandom(8 * 1024**2 + 3)
+        message = iRODSMessage(
+            "RODS_API_REQ",
+            msg=StringStringMap({"a": "b"}),
+            bs=memoryview(payload),
+            int_info=606,
+        )
+        parts = message.pack_parts()
+        self.assertIs(parts[-1].obj, payload)  # the byte stream is not copied
+        self.assertEqual(b"".join(parts), message.pack())
+
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            thread = threading.Thread(
+                target=_send_message_parts, args=(sender, parts)
+            )
+            thread.start()
+            received = iRODSMessage.recv(receiver)
+            thread.join()
+        self.assertEqual(received.int_info, 606)
+        self.assertIs(type(received.bs), bytes)
+        self.assertEqual(received.bs, payload)
+        kvp = StringStringMap()
+        kvp.unpack(ET().fromstring(received.msg))
+        self.assertEqual(kvp.keyWord, ["a"])
+
 
 if __name__ == "__main__":
     unittest.main()
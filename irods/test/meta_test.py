@@ -269,6 +269,99 @@ class TestMeta(unittest.TestCase):
                 obj.metadata.remove_all()
             my_resc.remove()
 
+    def test_batched_metadata_changes(self):
+        meta = self.obj.metadata
+        meta.add("batch_a", "0")
+        with meta.batch(chunk_size=8):
+            for i in range(20):
+                meta.add("batch_t", str(i))
+            meta.set("batch_a", "1")
+            meta["batch_b"] = iRODSMeta("batch_b", "2", "u")
+            del meta["batch_t"]
+            meta.add("batch_t", "20")
+            # The local view shows the changes, none of which has been sent yet.
+            self.assertEqual(len(self.sess.metadata.get(DataObject, self.obj_path)), 1)
+            self.assertEqual([m.value for m in meta.get_all("batch_t")], ["20"])
+        expected = [
+            ("batch_a", "1", None),
+            ("batch_b", "2", "u"),
+            ("batch_t", "20", None),
+        ]
+        for avus in (
+            meta.items(),
+            self.sess.metadata.get(DataObject, self.obj_path),
+        ):
+            self.assertEqual(
+                sorted((m.name, m.value, m.units or None) for m in avus), expected
+            )
+        self.assertTrue(all(m.avu_id for m in meta.items()))
+
+        # Nothing is sent if the batch is abandoned by an exception.
+        with self.assertRaises(ZeroDivisionError):
+            with meta.batch():
+                meta.remove_all()
+                self.assertEqual(len(meta), 0)
+                1 / 0
+        self.assertEqual(len(meta), 3)
+        with meta.batch(refresh=False):
+            meta.remove_all()
+        self.assertEqual(self.sess.metadata.get(DataObject, self.obj_path), [])
+
+    def test_metadata_views_are_read_lazily(self):
+        meta = self.obj.metadata
+        meta.add("lazy_a", "1")
+        self.assertTrue(meta.stale)
+        admin_view = meta(admin=True)
+        self.assertTrue(admin_view.stale)
+        # Writes need no read of the metadata, and leave the view stale.
+        admin_view.add("lazy_b", "2")
+        with admin_view.batch():
+            admin_view.add("lazy_c", "3")
+        self.assertTrue(admin_view.stale)
+        self.assertEqual(
+            sorted(m.name for m in admin_view.items() if m.name.startswith("lazy_")),
+            ["lazy_a", "lazy_b", "lazy_c"],
+        )
+        self.assertFalse(admin_view.stale)
+        # Changes batched before the first read are shown in the view.
+        fresh = self.sess.data_objects.get(self.obj_path).metadata
+        with fresh.batch(refresh=False):
+            fresh.add("lazy_d", "4")
+            self.assertIn("lazy_d", fresh)
+            self.assertIn("lazy_a", fresh)
+        self.assertFalse(fresh.stale)
+        self.assertIn("lazy_d", meta)
+
+    def test_apply_many_metadata_operations(self):
+        paths = [self.obj_path]
+        for i in range(9):
+            paths.append("{}/apply_many_{}".format(self.coll_path, i))
+            self.sess.data_objects.create(paths[-1])
+        missing_path = self.coll_path + "/apply_many_missing"
+        entries = [
+            (
+                DataObject,
+                path,
+                [AVUOperation(operation="add", avu=iRODSMeta("n", str(i), "u"))]
+                + [AVUOperation(operation="add", avu=iRODSMeta("tag", path))],
+            )
+            for i, path in enumerate(paths + [missing_path])
+        ]
+        result = self.sess.metadata.apply_many(iter(entries), workers=3)
+        self.assertEqual(result.applied, len(paths))
+        self.assertEqual(result.operations, 2 * len(paths))
+        self.assertEqual(
+            [(cls, path) for cls, path, _ in result.failures],
+            [(DataObject, missing_path)],
+        )
+        self.assertIsInstance(result.failures[0][2], ex.iRODSException)
+        self.assertGreater(result.entities_per_second, 0)
+        for i, path in enumerate(paths):
+            avus = self.sess.metadata.get(DataObject, path)
+            self.assertEqual(
+                sorted((m.name, m.value) for m in avus), [("n", str(i)), ("tag", path)]
+            )
+
     def test_get_obj_meta(self):
         # get object metadata
         meta = self.sess.metadata.get(DataObject, self.obj_path)
@@ -10,10 +10,13 @@ import sys
 import tempfile
 import time
 import json
+import threading
 import unittest
 import socket
+import irods.parallel
 import irods.test.helpers as helpers
 from irods.connection import DESTRUCTOR_MSG
+from irods.exception import ConnectionPoolTimeout
 
 #  Regular expression to match common synonyms for localhost.
 #
@@ -395,6 +398,83 @@ class TestPool(unittest.TestCase):
         )
         self.assertEqual(connection_refresh_time, 3)
 
+    def test_bounded_pool_with_prewarming(self):
+        with helpers.make_session(
+            max_connections=2, min_idle_connections=2, pool_timeout=0.5
+        ) as sess:
+            pool = sess.pool
+            deadline = time.time() + 10
+            while len(pool.idle) < 2 and time.time() < deadline:
+                time.sleep(0.05)
+            self.assertEqual(2, len(pool.idle))
+
+            peak = []
+
+            def hold_connection():
+                with pool.get_connection():
+                    peak.append(len(pool.active))
+                    time.sleep(0.05)
+
+            pool.acquire_timeout = None
+            acquisitions = pool.stats().acquisitions
+            threads = [threading.Thread(target=hold_connection) for _ in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertLessEqual(max(peak), 2)
+
+            stats = pool.stats()
+            self.assertEqual(stats.created, 2)
+            self.assertEqual(stats.acquisitions - acquisitions, 10)
+            self.assertGreater(stats.waits, 0)
+
+            pool.acquire_timeout = 0.5
+            with pool.get_connection(), pool.get_connection():
+                with self.assertRaises(ConnectionPoolTimeout):
+                    pool.get_connection()
+            self.assertEqual(pool.stats().timeouts, 1)
+
+    def test_parallel_transfer_in_bounded_pool(self):
+        FILE_LENGTH = 4 * 1024**2 + 123
+        with helpers.make_session(max_connections=2, pool_timeout=30) as sess:
+            logical_path = "{}/bounded_pool_{}.dat".format(
+                helpers.home_collection(sess),
+                helpers.unique_name(helpers.my_function_name(), time.time()),
+            )
+            content = os.urandom(FILE_LENGTH)
+            peak = []
+            with tempfile.NamedTemporaryFile() as f:
+                f.write(content)
+                f.flush()
+                try:
+                    # More transfer threads are asked for than the pool has connections.
+                    for operation, local_file in (
+                        (irods.parallel.Oper.PUT, f.name),
+                        (irods.parallel.Oper.GET, f.name + ".get"),
+                    ):
+                        self.assertTrue(
+                            irods.parallel.io_main(
+                                sess,
+                                logical_path,
+                                operation,
+                                local_file,
+                                num_threads=4,
+                                total_bytes=FILE_LENGTH,
+                                chunk_size=1024**2,
+                                updatables=lambda n: peak.append(len(sess.pool.active)),
+                            )
+                        )
+                    with open(f.name + ".get", "rb") as g:
+                        self.assertEqual(g.read(), content)
+                finally:
+                    if os.path.exists(f.name + ".get"):
+                        os.unlink(f.name + ".get")
+                    if sess.data_objects.exists(logical_path):
+                        sess.data_objects.unlink(logical_path, force=True)
+            self.assertLessEqual(max(peak), 2)
+            self.assertEqual(sess.pool.stats().timeouts, 0)
+
 
 def irods_test_path():
     return os.path.dirname(__file__)
@@ -33,6 +33,7 @@ from irods.rule import Rule
 from irods import MAX_SQL_ROWS
 from irods.test.helpers import irods_shared_reg_resc_vault
 import irods.test.helpers as helpers
+import irods.client_configuration as config
 import irods.keywords as kw
 
 IRODS_STATEMENT_TABLE_SIZE = 50
@@ -518,6 +519,110 @@ class TestQuery(unittest.TestCase):
         results = self.sess.query(User.name).first()
         self.assertEqual(len(results), 1)
 
+    def test_result_set_is_columnar(self):
+        for i in range(10):
+            self.sess.data_objects.create("{}/obj_{}".format(self.coll_path, i))
+        results = (
+            self.sess.query(DataObject.name, DataObject.size, DataObject.modify_time)
+            .filter(Collection.name == self.coll_path)
+            .order_by(DataObject.name)
+            .all()
+        )
+        self.assertEqual(
+            results.keys(), [DataObject.name, DataObject.size, DataObject.modify_time]
+        )
+        names = results.column_values(DataObject.name)
+        self.assertEqual(len(names), len(results))
+        self.assertIn("obj_3", names)
+        self.assertEqual(set(results.column_values(DataObject.size)), {0})
+        self.assertIsInstance(results.column_values(DataObject.modify_time)[0], datetime)
+
+        rows = list(results)
+        self.assertEqual([row[DataObject.name] for row in rows], names)
+        self.assertEqual(results[-1], rows[-1])
+        self.assertEqual(results[2:5], rows[2:5])
+        with self.assertRaises(IndexError):
+            results[len(rows)]
+        self.assertEqual(results.rows, rows)
+        self.assertTrue(results.has_value("obj_9"))
+
+    def test_query_to_arrays_and_dataframe(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        query = self.sess.query(
+            DataObject.name, DataObject.size, DataObject.modify_time
+        ).filter(Collection.name == self.coll_path)
+        rows = list(query)
+        arrays = query.to_arrays()
+        self.assertEqual(arrays[DataObject.size].dtype, numpy.int64)
+        self.assertEqual(arrays[DataObject.modify_time].dtype.kind, "M")
+        self.assertEqual(
+            sorted(arrays[DataObject.name]), sorted(row[DataObject.name] for row in rows)
+        )
+        try:
+            import pandas
+        except ImportError:
+            return
+        frame = query.to_dataframe(categorical=[DataObject.name])
+        self.assertEqual(list(frame.columns), ["DATA_NAME", "DATA_SIZE", "D_MODIFY_TIME"])
+        self.assertEqual(len(frame), len(rows))
+        self.assertEqual(frame["DATA_NAME"].dtype.name, "category")
+        self.assertEqual(str(frame["D_MODIFY_TIME"].dt.tz), "UTC")
+
+    def test_large_in_filter_is_split(self):
+        names = ["obj_{}".format(i) for i in range(25)]
+        for name in names[::2]:
+            self.sess.data_objects.create("{}/{}".format(self.coll_path, name))
+        with config.loadlines(
+            entries=[
+                dict(setting="genquery.in_filter_max_values", value=4),
+                dict(setting="genquery.in_filter_workers", value=3),
+            ]
+        ):
+            query = self.sess.query(DataObject.name).filter(
+                Collection.name == self.coll_path, In(DataObject.name, names)
+            )
+            self.assertEqual(len(query._split_in_filters()), 7)
+            found = sorted(row[DataObject.name] for row in query)
+            # The first page of a split query holds the rows of its parts' first pages,
+            # and is not continued.
+            first_page = query.execute()
+            self.assertEqual(first_page.continue_index, 0)
+            self.assertEqual(sorted(row[DataObject.name] for row in first_page), found)
+            self.assertEqual(len(query.all()), len(found))
+            self.assertEqual(len(next(query.limit(1).get_batches(prefetch=2))), 1)
+
+            # Ordered, limited and aggregated queries are not split, and so give the
+            # same results as they would with a single In() filter.
+            ordered = query.order_by(DataObject.name, "desc")
+            self.assertIsNone(ordered._split_in_filters())
+            self.assertEqual(
+                [row[DataObject.name] for row in ordered],
+                sorted(names[::2], reverse=True),
+            )
+            limited = query.order_by(DataObject.name).limit(3)
+            self.assertIsNone(limited._split_in_filters())
+            self.assertEqual(
+                [row[DataObject.name] for row in limited.execute()],
+                sorted(names[::2])[:3],
+            )
+            self.assertEqual(limited.first()[DataObject.name], sorted(names[::2])[0])
+            counted = self.sess.query(Collection.name).count(DataObject.id).filter(
+                Collection.name == self.coll_path, In(DataObject.name, names)
+            )
+            self.assertIsNone(counted._split_in_filters())
+            self.assertEqual(counted.one()[DataObject.id], len(names[::2]))
+
+            # Nor is an In() filter on a column not selected, whose rows would repeat.
+            self.assertIsNone(
+                self.sess.query(Collection.name)
+                .filter(In(DataObject.name, names))
+                ._split_in_filters()
+            )
+        self.assertEqual(found, sorted(names[::2]))
+
     def test_query_one(self):
         # with multiple results
         with self.assertRaises(MultipleResultsFound):
@@ -932,6 +1037,23 @@ class TestQuery(unittest.TestCase):
                 for dummy_row in buildQuery():
                     break  # single iteration
 
+    def test_prefetched_batches__166(self):
+
+        with self.Issue_166_context(
+            self.sess, num_objects=self.More_than_one_batch
+        ) as buildQuery:
+
+            expected = [row[DataObject.name] for row in buildQuery()]
+            self.assertEqual(
+                [row[DataObject.name] for row in buildQuery().get_results(prefetch=2)],
+                expected,
+            )
+
+            # Abandoning the prefetching generator must close the query on the server.
+            for dummy_i in self.Iterate_to_exhaust_statement_table:
+                for dummy_batch in buildQuery().get_batches(prefetch=1):
+                    break
+
     def test_paging_get_batches_and_check_paging__166(self):
 
         with self.Issue_166_context(
@@ -1063,6 +1185,50 @@ class TestSpecificQuery(unittest.TestCase):
         # remove test collection
         self.test_collection.remove(recurse=True, force=True)
 
+    def test_query_with_prefetched_batches(self):
+        test_collection_size = 3 * MAX_SQL_ROWS
+        test_collection_path = "/{0}/home/{1}/test_collection".format(
+            self.session.zone, self.session.username
+        )
+        self.test_collection = helpers.make_test_collection(
+            self.session, test_collection_path, obj_count=test_collection_size
+        )
+        try:
+            sql = "select DATA_NAME from R_DATA_MAIN join R_COLL_MAIN using (COLL_ID) where COLL_NAME = '{}' order by DATA_NAME".format(
+                test_collection_path
+            )
+            alias = "list_data_name_prefetched"
+            query = SpecificQuery(self.session, sql, alias, [DataObject.name])
+            query.register()
+            try:
+                expected = [
+                    row[DataObject.name]
+                    for row in SpecificQuery(
+                        self.session, alias=alias, columns=[DataObject.name]
+                    )
+                ]
+                self.assertEqual(len(expected), test_collection_size)
+                self.assertEqual(
+                    [
+                        row[DataObject.name]
+                        for row in SpecificQuery(
+                            self.session, alias=alias, columns=[DataObject.name]
+                        ).get_results(prefetch=2)
+                    ],
+                    expected,
+                )
+
+                # Abandoning the prefetching generator closes the query on the server.
+                for dummy_i in range(60):
+                    for dummy_batch in SpecificQuery(
+                        self.session, alias=alias
+                    ).get_batches(prefetch=1):
+                        break
+            finally:
+                query.remove()
+        finally:
+            self.test_collection.remove(recurse=True, force=True)
+
     def test_query_data_name_and_id_no_columns(self):
         """Same test as above, but without providing query columns to parse results.
         Result columns are retrieved by index 0..n
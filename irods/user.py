@@ -60,7 +60,7 @@ class iRODSUser:
 
     @property
     def metadata(self):
-        if not self._meta:
+        if self._meta is None:
             self._meta = iRODSMetaCollection(
                 self.manager.sess.metadata, User, self.name
             )
@@ -117,7 +117,7 @@ class iRODSGroup:
 
     @property
     def metadata(self):
-        if not self._meta:
+        if self._meta is None:
             self._meta = iRODSMetaCollection(
                 self.manager.sess.metadata, User, self.name
             )
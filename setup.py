@@ -45,5 +45,9 @@ setup(
         "PrettyTable>=0.7.2",
         "defusedxml",
     ],
-    extras_require={"tests": ["unittest-xml-reporting"]},  # for xmlrunner
+    extras_require={
+        "tests": ["unittest-xml-reporting"],  # for xmlrunner
+        "numpy": ["numpy"],  # for Query.to_arrays
+        "pandas": ["numpy", "pandas"],  # for Query.to_dataframe
+    },
 )